@@ -10,6 +10,9 @@
 #
 
 
+import hashlib
+import json
+
 from api import ApiError
 from utils.constructors.mapping import get_adapter_constructor_class
 
@@ -30,6 +33,19 @@ def construct_adapter(vendor, module_type, **kwargs):
     :param kwargs:      Additional key-value pairs.
     :return:            The constructor for the specified vendor and module type.
     """
+    # Imported here because the replay module depends on ApiAdapterError
+    from api.adapter import replay
+
     constructor = get_adapter_constructor_class(vendor, module_type)
 
-    return constructor(**kwargs)
+    adapter = constructor(**kwargs)
+    adapter.config_digest = config_digest(kwargs)
+    return replay.record_adapter(adapter, module_type)
+
+
+def config_digest(adapter_config):
+    """
+    This function returns a digest of the configuration an adapter was constructed with, which identifies the endpoint
+    and credentials of the adapter without holding them in clear.
+    """
+    return hashlib.sha256(json.dumps(adapter_config, sort_keys=True, default=str)).hexdigest()
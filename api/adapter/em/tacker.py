@@ -13,11 +13,11 @@
 import logging
 import time
 
-import os_client_config
 import tackerclient.common.exceptions
 from tackerclient.tacker.client import Client as TackerClient
 
 from api.adapter import construct_adapter
+from api.adapter.keystone import get_shared_session
 from api.adapter.em import EmAdapterError
 from api.generic import constants
 from utils.logging_module import log_entry_exit
@@ -42,16 +42,15 @@ class TackerEmAdapter(object):
     def __init__(self, auth_url=None, username=None, password=None, identity_api_version=None, project_name=None,
                  project_domain_name=None, user_domain_name=None):
         try:
-            self.keystone_client = os_client_config.make_client('identity',
-                                                                auth_url=auth_url,
-                                                                username=username,
-                                                                password=password,
-                                                                identity_api_version=identity_api_version,
-                                                                project_name=project_name,
-                                                                project_domain_name=project_domain_name,
-                                                                user_domain_name=user_domain_name)
-
-            self.tacker_client = TackerClient(api_version='1.0', session=self.keystone_client.session)
+            self.shared_session = get_shared_session(auth_url=auth_url,
+                                                     username=username,
+                                                     password=password,
+                                                     identity_api_version=identity_api_version,
+                                                     project_name=project_name,
+                                                     project_domain_name=project_domain_name,
+                                                     user_domain_name=user_domain_name)
+
+            self.tacker_client = TackerClient(api_version='1.0', session=self.shared_session.session)
         except Exception as e:
             LOG.exception(e)
             raise TackerEmAdapterError('Unable to create %s instance - %s' % (self.__class__.__name__, e))
@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import logging
+import threading
+
+import os_client_config
+from keystoneauth1.exceptions import DiscoveryFailure
+from requests.adapters import HTTPAdapter
+
+from api.adapter import config_digest
+
+# Interval of time in seconds before the expiration of the token when a new token is requested
+TOKEN_REFRESH_MARGIN = 300
+
+# Maximum number of connections kept open to each OpenStack endpoint
+CONNECTION_POOL_SIZE = 16
+
+_shared_sessions = {}
+_key_locks = {}
+_lock = threading.Lock()
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+class SharedSession(object):
+    """
+    keystoneauth session shared by all the OpenStack clients built with the same credentials in this process. The
+    session authenticates once, refreshes the token TOKEN_REFRESH_MARGIN seconds before it expires and keeps a pool
+    of connections to each endpoint. The service clients are built on first use.
+    """
+
+    def __init__(self, cloud_config):
+        self.cloud_config = cloud_config
+        self.session = cloud_config.get_session()
+        self.session.auth.MIN_TOKEN_LIFE_SECONDS = TOKEN_REFRESH_MARGIN
+        http_adapter = HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE)
+        self.session.session.mount('http://', http_adapter)
+        self.session.session.mount('https://', http_adapter)
+        self.clients = {}
+        self.lock = threading.Lock()
+
+    def authenticate(self):
+        self.session.get_token()
+
+    def get_client(self, service_key):
+        """
+        This method returns the client of the service, building it if it was not used before.
+
+        :param service_key: Service type, as known by os_client_config. Ex. 'compute'
+        """
+        with self.lock:
+            client = self.clients.get(service_key)
+            if client is None:
+                client = self.cloud_config.get_legacy_client(service_key)
+                self.clients[service_key] = client
+            return client
+
+
+def _create_shared_session(auth_url, username, password, identity_api_version, project_name, project_domain_name,
+                           user_domain_name, verify):
+    cloud_config = os_client_config.get_config(auth_url=auth_url,
+                                               username=username,
+                                               password=password,
+                                               identity_api_version=identity_api_version,
+                                               project_name=project_name,
+                                               project_domain_name=project_domain_name,
+                                               user_domain_name=user_domain_name,
+                                               verify=verify)
+    shared_session = SharedSession(cloud_config)
+    try:
+        shared_session.authenticate()
+    except DiscoveryFailure as e:
+        if user_domain_name is None and project_domain_name is None:
+            LOG.debug('Domain params are not present, so not attempting to retry authenticating without them')
+            raise e
+
+        LOG.debug('Unable to authenticate, because auth_url may be v2.0 and domain params are present. '
+                  'Retrying without domain params')
+        return _create_shared_session(auth_url, username, password, identity_api_version, project_name, None, None,
+                                      verify)
+    return shared_session
+
+
+def get_shared_session(auth_url=None, username=None, password=None, identity_api_version=None, project_name=None,
+                       project_domain_name=None, user_domain_name=None, verify=True):
+    """
+    This function returns the session shared by the OpenStack clients using the provided credentials, authenticating
+    only the first time the credentials are used.
+
+    :return:    SharedSession object.
+    """
+    credentials = {
+        'auth_url': auth_url,
+        'username': username,
+        'password': password,
+        'identity_api_version': identity_api_version,
+        'project_name': project_name,
+        'project_domain_name': project_domain_name,
+        'user_domain_name': user_domain_name,
+        'verify': verify
+    }
+    # The sessions are registered by digest, so that the registry does not hold the passwords in clear
+    key = config_digest(credentials)
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        with _lock:
+            shared_session = _shared_sessions.get(key)
+        if shared_session is None:
+            shared_session = _create_shared_session(**credentials)
+            with _lock:
+                _shared_sessions[key] = shared_session
+        return shared_session
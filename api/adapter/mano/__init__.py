@@ -10,11 +10,130 @@
 #
 
 
+import functools
+import logging
+import threading
+
+from monotonic import monotonic
+
 from api.adapter import ApiAdapterError
 
+# Interval of time in seconds after which a cached VIM helper is constructed again, with fresh credentials
+VIM_HELPER_TTL = 600
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
 
 class ManoAdapterError(ApiAdapterError):
     """
     A problem occurred in the VNF LifeCycle Validation MANO adapter API.
     """
     pass
+
+
+def is_auth_failure(error):
+    """
+    This function tells if the error was caused by expired or rejected VIM credentials. The VIM adapters wrap the
+    client errors, so the original error may only be found in the message.
+    """
+    if getattr(error, 'http_status', None) == 401 or getattr(error, 'status_code', None) == 401:
+        return True
+    if type(error).__name__ in ('Unauthorized', 'AuthorizationFailure'):
+        return True
+    return 'HTTP 401' in str(error)
+
+
+class CachedVimHelper(object):
+    """
+    Proxy of a cached VIM helper. If a call fails because the VIM rejected the credentials, the VIM helper is
+    removed from the registry and the call is retried once with a newly constructed VIM helper.
+    """
+
+    def __init__(self, vim_helper, registry, key, construct):
+        self._vim_helper = vim_helper
+        self._registry = registry
+        self._key = key
+        self._construct = construct
+
+    def __getattr__(self, name):
+        attr = getattr(self._vim_helper, name)
+        if not callable(attr):
+            return attr
+
+        def retried_method(*args, **kwargs):
+            try:
+                return attr(*args, **kwargs)
+            except Exception as e:
+                if not is_auth_failure(e):
+                    raise
+                LOG.debug('VIM rejected the credentials of the cached VIM helper for %s, constructing a new one'
+                          % (self._key,))
+                self._registry.invalidate(self._key, self)
+                vim_helper = self._registry.get(self._key, self._construct)
+                return getattr(vim_helper._vim_helper, name)(*args, **kwargs)
+        return retried_method
+
+
+class VimHelperRegistry(object):
+    """
+    Process wide registry of the VIM helpers constructed by the MANO adapters, so that the VIM credentials are not
+    resolved and the VIM clients are not authenticated again for every VNFC. The VIM helpers are kept for
+    VIM_HELPER_TTL seconds, and dropped as soon as the VIM rejects their credentials.
+    """
+
+    def __init__(self, ttl=VIM_HELPER_TTL):
+        self.ttl = ttl
+        self.entries = {}
+        self.key_locks = {}
+        self.lock = threading.Lock()
+
+    def get(self, key, construct):
+        """
+        This method returns the VIM helper registered with the key, constructing it with construct() if there is none
+        or if it expired. Concurrent callers asking for the same key wait for a single construction.
+        """
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self.lock:
+                entry = self.entries.get(key)
+            if entry is not None and entry[1] > monotonic():
+                return entry[0]
+            vim_helper = CachedVimHelper(construct(), self, key, construct)
+            with self.lock:
+                self.entries[key] = (vim_helper, monotonic() + self.ttl)
+            return vim_helper
+
+    def invalidate(self, key=None, vim_helper=None):
+        """
+        This method removes the VIM helper registered with the key, or all of them if no key is given. If vim_helper is
+        given, the entry is removed only if it still holds that VIM helper, so that a VIM helper that was already
+        constructed again by another thread is kept.
+        """
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            elif vim_helper is None or self.entries.get(key, (None,))[0] is vim_helper:
+                self.entries.pop(key, None)
+
+
+VIM_HELPERS = VimHelperRegistry()
+
+
+def cached_vim_helper(endpoint_attr):
+    """
+    This function returns a decorator for the get_vim_helper(vim_id) methods of the MANO adapters that looks the VIM
+    helper up in VIM_HELPERS before constructing it. The VIM helpers are registered per MANO endpoint and per digest of
+    the adapter configuration, so that adapters using different credentials for the same MANO do not share them.
+
+    :param endpoint_attr:   Name of the adapter attribute identifying the MANO, so that the VIM IDs of different MANOs
+                            do not collide. Ex. 'url'
+    """
+    def decorator(get_vim_helper):
+        @functools.wraps(get_vim_helper)
+        def cached_get_vim_helper(self, vim_id):
+            key = (type(self).__name__, getattr(self, endpoint_attr), getattr(self, 'config_digest', None), vim_id)
+            return VIM_HELPERS.get(key, functools.partial(get_vim_helper, self, vim_id))
+        return cached_get_vim_helper
+    return decorator
@@ -19,7 +19,7 @@ import ncclient
 from ncclient import manager, NCClientError
 
 from api.adapter import construct_adapter
-from api.adapter.mano import ManoAdapterError
+from api.adapter.mano import ManoAdapterError, cached_vim_helper
 from api.generic import constants
 from api.structures.objects import InstantiatedVnfInfo, VnfExtCpInfo, VnfInfo, VnfcResourceInfo, ResourceHandle, \
     NsInfo, NsdInfo, Alarm, FaultyResourceInfo
@@ -280,7 +280,7 @@ class CiscoNFVManoAdapter(object):
                                                 password=esc_password,
                                                 hostkey_verify=False, look_for_keys=False)
 
-            self.vim_helper = None
+            self.esc_hostname = esc_hostname
 
         except Exception as e:
             LOG.exception(e)
@@ -1531,45 +1531,43 @@ class CiscoNFVManoAdapter(object):
         return lifecycle_operations_occurrence_id
 
     @log_entry_exit(LOG)
+    @cached_vim_helper('esc_hostname')
     def get_vim_helper(self, vim_id):
-        if self.vim_helper is None:
-            netconf_reply = self.esc.get(('xpath', '/esc_system_config/vim_connectors/vim_connector'))
-            vim_xml = etree.fromstring(netconf_reply.data_xml)
-
-            vim_type = vim_xml.find('.//{http://www.cisco.com/esc/esc}type').text
-            if vim_type == 'OPENSTACK':
-                client_params = {}
-                property_name_mapping = {
-                    'os_auth_url': 'auth_url',
-                    'os_password': 'password',
-                    'os_project_name': 'project_name',
-                    'os_project_domain_name': 'project_domain_name',
-                    'os_user_domain_name': 'user_domain_name'
-                }
-                property_list = vim_xml.findall('.//{http://www.cisco.com/esc/esc}property')
-                for property_elem in property_list:
-                    property_name = property_elem.find('.//{http://www.cisco.com/esc/esc}name').text
-                    property_value = property_elem.find('.//{http://www.cisco.com/esc/esc}value').text
+        netconf_reply = self.esc.get(('xpath', '/esc_system_config/vim_connectors/vim_connector'))
+        vim_xml = etree.fromstring(netconf_reply.data_xml)
+
+        vim_type = vim_xml.find('.//{http://www.cisco.com/esc/esc}type').text
+        if vim_type == 'OPENSTACK':
+            client_params = {}
+            property_name_mapping = {
+                'os_auth_url': 'auth_url',
+                'os_password': 'password',
+                'os_project_name': 'project_name',
+                'os_project_domain_name': 'project_domain_name',
+                'os_user_domain_name': 'user_domain_name'
+            }
+            property_list = vim_xml.findall('.//{http://www.cisco.com/esc/esc}property')
+            for property_elem in property_list:
+                property_name = property_elem.find('.//{http://www.cisco.com/esc/esc}name').text
+                property_value = property_elem.find('.//{http://www.cisco.com/esc/esc}value').text
 
-                    vim_param = property_name_mapping.get(property_name)
-                    if vim_param is not None:
-                        client_params[vim_param] = property_value
+                vim_param = property_name_mapping.get(property_name)
+                if vim_param is not None:
+                    client_params[vim_param] = property_value
 
-                user_id_elem = vim_xml.find('.//{http://www.cisco.com/esc/esc}user/{http://www.cisco.com/esc/esc}id')
-                user_id = user_id_elem.text
-                client_params['username'] = user_id
+            user_id_elem = vim_xml.find('.//{http://www.cisco.com/esc/esc}user/{http://www.cisco.com/esc/esc}id')
+            user_id = user_id_elem.text
+            client_params['username'] = user_id
 
-                # If the ESC reports VIM project_domain_name as empty string, set it as Default
-                if 'project_domain_name' in client_params and 'user_domain_name' in client_params:
-                    if client_params['project_domain_name'] is None:
-                        client_params['project_domain_name'] = client_params['user_domain_name']
+            # If the ESC reports VIM project_domain_name as empty string, set it as Default
+            if 'project_domain_name' in client_params and 'user_domain_name' in client_params:
+                if client_params['project_domain_name'] is None:
+                    client_params['project_domain_name'] = client_params['user_domain_name']
 
-                self.vim_helper = construct_adapter(vendor='openstack', module_type='vim', **client_params)
+            return construct_adapter(vendor='openstack', module_type='vim', **client_params)
 
-            else:
-                raise CiscoNFVManoAdapterError('Cannot create VIM helper for unsupported type: %s' % vim_type)
-
-        return self.vim_helper
+        else:
+            raise CiscoNFVManoAdapterError('Cannot create VIM helper for unsupported type: %s' % vim_type)
 
     @log_entry_exit(LOG)
     def wait_for_vnf_stable_state(self, vnf_instance_id, max_wait_time, poll_interval):
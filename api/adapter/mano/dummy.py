@@ -11,12 +11,13 @@
 
 
 import logging
-import time
 
 from api.adapter.mano import ManoAdapterError
 from api.generic import constants
 from api.structures.objects import InstantiatedVnfInfo, VnfInfo, VnfcResourceInfo, ResourceHandle, NsInfo
+from utils import tracing
 from utils.logging_module import log_entry_exit
+from utils.polling import poll_for_completion
 
 # Instantiate logger
 LOG = logging.getLogger(__name__)
@@ -51,22 +52,8 @@ class DummyManoAdapter(object):
     @log_entry_exit(LOG)
     def poll_for_operation_completion(self, lifecycle_operation_occurrence_id, final_states, max_wait_time,
                                       poll_interval):
-        operation_pending = True
-        elapsed_time = 0
-
-        while operation_pending and elapsed_time < max_wait_time:
-            operation_status = self.get_operation_status(lifecycle_operation_occurrence_id)
-            LOG.debug('Got status %s for operation with ID %s' % (operation_status, lifecycle_operation_occurrence_id))
-            if operation_status in final_states:
-                operation_pending = False
-            else:
-                LOG.debug('Expected state to be one of %s, got %s' % (final_states, operation_status))
-                LOG.debug('Sleeping %s seconds' % poll_interval)
-                time.sleep(poll_interval)
-                elapsed_time += poll_interval
-                LOG.debug('Elapsed time %s seconds out of %s' % (elapsed_time, max_wait_time))
-
-        return operation_status
+        return poll_for_completion(self.get_operation_status, lifecycle_operation_occurrence_id, final_states,
+                                   max_wait_time, poll_interval, operation_name=tracing.caller_name())
 
     @log_entry_exit(LOG)
     def validate_vnf_allocated_vresources(self, vnf_info, additional_param=None):
@@ -11,6 +11,7 @@
 
 
 import logging
+import threading
 import time
 import uuid
 
@@ -18,7 +19,7 @@ import requests
 from requests.auth import HTTPBasicAuth
 
 from api.adapter import construct_adapter
-from api.adapter.mano import ManoAdapterError
+from api.adapter.mano import ManoAdapterError, cached_vim_helper
 from api.generic import constants
 from api.structures.objects import ResourceHandle, InstantiatedVnfInfo, NsInfo, VnfInfo, VnfExtCpInfo, \
     VnfcResourceInfo, NsdInfo
@@ -49,17 +50,28 @@ class OpenbatonManoAdapter(object):
         self.password = password
         self.project = project
         self.vim_info = vim_info
-        self.session = requests.Session()
+        self.local = threading.local()
+        self.token_lock = threading.Lock()
         self.token = self.get_token(username, password)
-        self.session.headers = {
-            'Content-Type': 'application/json',
-            'project-id': self.project,
-            'Authorization': self.token
-        }
         self.vnf_to_ns_mapping = {}
         self.nsd_info_ids = {}
         self.nsd_info_id_to_vnfd_ids = {}
 
+    @property
+    def session(self):
+        """
+        This property returns the requests session of the calling thread, since requests sessions are not thread safe.
+        """
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers = {
+                'Content-Type': 'application/json',
+                'project-id': self.project
+            }
+            self.local.session = session
+        return session
+
     @log_entry_exit(LOG)
     def get_token(self, username, password):
         http_headers = {
@@ -84,19 +96,23 @@ class OpenbatonManoAdapter(object):
     @log_entry_exit(LOG)
     def request(self, url, method, data=None, verify=False):
         # Perform the request once. If we get a 401 back then it might be because the auth token expired, so try to
-        # re-authenticate and try again. If it still fails, bail.
+        # re-authenticate and try again. If it still fails, bail. Concurrent requests rejected with the same token
+        # re-authenticate only once.
+        token = self.token
         try:
             status_code, body = self.do_request(self.url + url, method, data, verify)
         except OpenbatonManoAdapterUnauthorized:
-            self.token = self.get_token(self.username, self.password)
-            self.session.headers['Authorization'] = self.token
+            with self.token_lock:
+                if self.token == token:
+                    self.token = self.get_token(self.username, self.password)
             status_code, body = self.do_request(self.url + url, method, data, verify)
         return status_code, body
 
     @log_entry_exit(LOG)
     def do_request(self, url, method, data=None, verify=False):
         try:
-            resp = self.session.request(url=url, method=method, data=data, verify=verify)
+            resp = self.session.request(url=url, method=method, data=data, verify=verify,
+                                        headers={'Authorization': self.token})
         except Exception as e:
             LOG.exception(e)
             raise OpenbatonManoAdapterError('Unable to run request on %s, method %s. Reason: %s' % (url, method, e))
@@ -233,6 +249,7 @@ class OpenbatonManoAdapter(object):
         return vnf_info
 
     @log_entry_exit(LOG)
+    @cached_vim_helper('url')
     def get_vim_helper(self, vim_id):
         url = '/api/v1/datacenters/%s' % vim_id
         try:
@@ -13,6 +13,7 @@
 import json
 import logging
 import random
+import threading
 import time
 import uuid
 from collections import defaultdict
@@ -22,7 +23,7 @@ from requests.auth import HTTPBasicAuth
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 from api.adapter import construct_adapter
-from api.adapter.mano import ManoAdapterError
+from api.adapter.mano import ManoAdapterError, cached_vim_helper
 from api.generic import constants
 from api.structures.objects import NsInfo, VnfInfo, InstantiatedVnfInfo, VnfcResourceInfo, ResourceHandle, NsdInfo, \
     VnfExtCpInfo, Nsd, VnfProfile, NsDf, NsVirtualLinkDesc, NsVirtualLinkConnectivity, Vnfd, Vdu, VirtualComputeDesc, \
@@ -46,14 +47,7 @@ class RiftManoAdapter(object):
         self.username = username
         self.password = password
         self.project = project
-
-        self.session = requests.Session()
-        self.session.headers = {
-            'Accept': 'application/vnd.yang.data+json',
-            'Content-type': 'application/vnd.yang.data+json'
-        }
-        self.session.auth = HTTPBasicAuth(username=self.username, password=self.password)
-        self.session.verify = False
+        self.local = threading.local()
 
         resource = '/api/operational/project/%s/project-config' % self.project
         try:
@@ -74,7 +68,22 @@ class RiftManoAdapter(object):
         self.nsr_metadata = {}
         self.nsd_info_ids = {}
 
-        self.vim_helpers = {}
+    @property
+    def session(self):
+        """
+        This property returns the requests session of the calling thread, since requests sessions are not thread safe.
+        """
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers = {
+                'Accept': 'application/vnd.yang.data+json',
+                'Content-type': 'application/vnd.yang.data+json'
+            }
+            session.auth = HTTPBasicAuth(username=self.username, password=self.password)
+            session.verify = False
+            self.local.session = session
+        return session
 
     @log_entry_exit(LOG)
     def get_operation_status(self, lifecycle_operation_occurrence_id):
@@ -507,11 +516,8 @@ class RiftManoAdapter(object):
         self.nsr_metadata.pop(ns_instance_id)
 
     @log_entry_exit(LOG)
+    @cached_vim_helper('url')
     def get_vim_helper(self, vim_id):
-        vim_helper = self.vim_helpers.get(vim_id)
-        if vim_helper is not None:
-            return vim_helper
-
         resource = '/api/config/project/cloud/account/%s' % vim_id
 
         try:
@@ -540,10 +546,7 @@ class RiftManoAdapter(object):
         else:
             raise RiftManoAdapterError('Unsupported VIM type: %s' % vim_type)
 
-        vim_helper = construct_adapter(vendor=vim_vendor, module_type='vim', **vim_params)
-        self.vim_helpers[vim_id] = vim_helper
-
-        return vim_helper
+        return construct_adapter(vendor=vim_vendor, module_type='vim', **vim_params)
 
     @log_entry_exit(LOG)
     def verify_vnf_sw_images(self, vnf_info, additional_param=None):
@@ -17,7 +17,7 @@ import time
 import requests
 
 from api.adapter import construct_adapter
-from api.adapter.mano import ManoAdapterError
+from api.adapter.mano import ManoAdapterError, cached_vim_helper
 from api.generic import constants
 from api.structures.objects import ResourceHandle, InstantiatedVnfInfo, NsInfo, VnfInfo, VnfExtCpInfo, VnfcResourceInfo
 from utils.logging_module import log_entry_exit
@@ -278,6 +278,7 @@ class SdlManoAdapter(object):
         return vnf_info
 
     @log_entry_exit(LOG)
+    @cached_vim_helper('nfv_api_url')
     def get_vim_helper(self, vim_id):
         response = requests.get(url=self.nfv_api_url + '/nfv/vi/virp/%s' % vim_id)
         assert response.status_code == 200
@@ -15,20 +15,29 @@ import logging
 import re
 import time
 import uuid
-from threading import Timer
+import weakref
+from threading import Event, Lock
 
-import os_client_config
 import tackerclient.common.exceptions
 import yaml
 from tackerclient.tacker.client import Client as TackerClient
 
 from api.adapter import construct_adapter
-from api.adapter.mano import ManoAdapterError
+from api.adapter.keystone import get_shared_session
+from api.adapter.mano import ManoAdapterError, cached_vim_helper
 from api.generic import constants
 from api.structures.objects import InstantiatedVnfInfo, VnfExtCpInfo, VnfInfo, VnfcResourceInfo, ResourceHandle, \
     VnfLifecycleChangeNotification, NsInfo
+from utils import polling
 from utils.logging_module import log_entry_exit
 
+# Interval of time in seconds between consecutive polls of the VNF events, right after a lifecycle call and when idle
+EVENT_POLL_MIN_INTERVAL = 1
+EVENT_POLL_MAX_INTERVAL = 10
+
+# Number of VNF events requested per page
+EVENT_PAGE_SIZE = 100
+
 # Instantiate logger
 LOG = logging.getLogger(__name__)
 
@@ -40,6 +49,68 @@ class TackerManoAdapterError(ManoAdapterError):
     pass
 
 
+class VnfEventCursor(object):
+    """
+    Cursor over the VNF events stored by Tacker. Each fetch asks Tacker, one page at a time, only for the events more
+    recent than the last one seen, optionally restricted to one VNF instance.
+
+    The polling interval drops to EVENT_POLL_MIN_INTERVAL after a lifecycle call or when new events arrive, and
+    doubles up to EVENT_POLL_MAX_INTERVAL while there are none.
+    """
+
+    def __init__(self, tacker_client, resource_id=None):
+        self.tacker_client = tacker_client
+        self.resource_id = resource_id
+        self.interval = EVENT_POLL_MIN_INTERVAL
+        self.lifecycle_call = Event()
+        self.last_event_id = None
+
+        # Only the first page is needed, holding the most recent event
+        for vnf_event_page in self._list_event_pages(sort_dir='desc', limit=1):
+            if len(vnf_event_page) > 0:
+                self.last_event_id = max(vnf_event['id'] for vnf_event in vnf_event_page)
+            break
+        LOG.debug('Got last event id: %s' % self.last_event_id)
+
+    def _list_event_pages(self, **params):
+        if self.resource_id is not None:
+            params['resource_id'] = self.resource_id
+        try:
+            for vnf_event_page in self.tacker_client.list_vnf_events(retrieve_all=False, sort_key='id', **params):
+                yield vnf_event_page['vnf_events']
+        except Exception as e:
+            LOG.exception(e)
+            raise TackerManoAdapterError('Unable to get VNF events - %s' % e)
+
+    def fetch(self):
+        """
+        This method returns the events that occurred since the previous fetch, in the order of their IDs.
+        """
+        params = {'sort_dir': 'asc', 'limit': EVENT_PAGE_SIZE}
+        if self.last_event_id is not None:
+            params['marker'] = self.last_event_id
+
+        # The events are also filtered here, in case the server does not support the marker
+        vnf_events = sorted((vnf_event for vnf_event_page in self._list_event_pages(**params)
+                             for vnf_event in vnf_event_page
+                             if self.last_event_id is None or vnf_event['id'] > self.last_event_id),
+                            key=lambda vnf_event: vnf_event['id'])
+        if len(vnf_events) > 0:
+            self.last_event_id = vnf_events[-1]['id']
+            self.interval = EVENT_POLL_MIN_INTERVAL
+        return vnf_events
+
+    def wait(self):
+        """
+        This method waits for the polling interval to pass, or for a lifecycle call to be made.
+        """
+        if self.lifecycle_call.wait(self.interval):
+            self.lifecycle_call.clear()
+            self.interval = EVENT_POLL_MIN_INTERVAL
+        else:
+            self.interval = min(self.interval * 2, EVENT_POLL_MAX_INTERVAL)
+
+
 class TackerManoAdapter(object):
     """
     Class of functions that map the generic operations exposed by the MANO to the operations exposed by the
@@ -49,17 +120,19 @@ class TackerManoAdapter(object):
     def __init__(self, auth_url=None, username=None, password=None, identity_api_version=None, project_name=None,
                  project_domain_name=None, user_domain_name=None):
         try:
-            self.keystone_client = os_client_config.make_client('identity',
-                                                                auth_url=auth_url,
-                                                                username=username,
-                                                                password=password,
-                                                                identity_api_version=identity_api_version,
-                                                                project_name=project_name,
-                                                                project_domain_name=project_domain_name,
-                                                                user_domain_name=user_domain_name)
-
-            self.tacker_client = TackerClient(api_version='1.0', session=self.keystone_client.session)
+            self.shared_session = get_shared_session(auth_url=auth_url,
+                                                     username=username,
+                                                     password=password,
+                                                     identity_api_version=identity_api_version,
+                                                     project_name=project_name,
+                                                     project_domain_name=project_domain_name,
+                                                     user_domain_name=user_domain_name)
+
+            self.tacker_client = TackerClient(api_version='1.0', session=self.shared_session.session)
+            self.auth_url = auth_url
             self.password = password
+            self.event_cursors = weakref.WeakSet()
+            self.event_cursors_lock = Lock()
 
         except Exception as e:
             LOG.exception(e)
@@ -292,6 +365,7 @@ class TackerManoAdapter(object):
         return reservation_id
 
     @log_entry_exit(LOG)
+    @cached_vim_helper('auth_url')
     def get_vim_helper(self, vim_id):
         try:
             vim_details = self.tacker_client.show_vim(vim_id)['vim']
@@ -439,6 +513,7 @@ class TackerManoAdapter(object):
             }
             try:
                 self.tacker_client.update_vnf(vnf_instance_id, body=vnf_attributes)
+                self.notify_lifecycle_call()
             except Exception as e:
                 LOG.exception(e)
                 raise TackerManoAdapterError('Unable to update VNF %s - %s' % (vnf_instance_id, e))
@@ -476,6 +551,7 @@ class TackerManoAdapter(object):
 
         try:
             vnf_instance = self.tacker_client.create_vnf(body=vnf_dict)
+            self.notify_lifecycle_call()
             LOG.debug('Response from VNFM:\n%s' % json.dumps(vnf_instance, indent=4, separators=(',', ': ')))
         except Exception as e:
             LOG.exception(e)
@@ -586,21 +662,21 @@ class TackerManoAdapter(object):
                     for scaling_resource in scaling_resources:
                         resource_list += vim.stack_resource_list(scaling_resource['id'])
 
-                    # Get details from Nova for the servers corresponding to each resource belonging to the auto
-                    # scaling group
+                    # Get from Nova, in a single paged listing, the servers of the tenant and join them in memory
+                    # with the resources belonging to the auto scaling group, based on their name.
+                    # The servers' names we are looking for start with ta-...
+                    # Example ta-hnrt7a-xvlcnwn2nphm-t5vjqah6itlt-VDU1-jyettvu5bvkg
+                    server_list = vim.server_list(limit=-1)
                     for resource in resource_list:
                         resource_name = resource.resource_name
 
-                        # Get the Nova list of servers filtering the servers based on their name.
-                        # The servers' names we are looking for start with ta-...
-                        # Example ta-hnrt7a-xvlcnwn2nphm-t5vjqah6itlt-VDU1-jyettvu5bvkg
                         # The server name we are looking for should match the following pattern
-                        pattern = 'ta-[a-z0-9]{6}-' + resource_name + '-[a-z0-9]{12}-VDU[0-9]+-[a-z0-9]{12}'
-                        server_list = vim.server_list(query_filter={'name': pattern})
-                        if len(server_list) == 0:
+                        pattern = re.compile('ta-[a-z0-9]{6}-' + resource_name + '-[a-z0-9]{12}-VDU[0-9]+-[a-z0-9]{12}')
+                        resource_server_list = [server for server in server_list if pattern.search(server.name)]
+                        if len(resource_server_list) == 0:
                             raise TackerManoAdapterError('No Nova server name contains string %s' % resource_name)
 
-                        for server in server_list:
+                        for server in resource_server_list:
                             vnf_resource_id = server.id
 
                             # Extract the VDU ID from the server name
@@ -637,32 +713,33 @@ class TackerManoAdapter(object):
 
                             vnf_info.instantiated_vnf_info.vnfc_resource_info.append(vnfc_resource_info)
 
+                # Get from Neutron, in chunked paged listings, the ports of all the VNFCs grouped by VNFC
+                vnfc_port_list = vim.device_port_list([vnfc_resource_info.compute_resource.resource_id
+                                                       for vnfc_resource_info
+                                                       in vnf_info.instantiated_vnf_info.vnfc_resource_info])
+
                 # Build the VnfExtCpInfo data structure
                 vnf_info.instantiated_vnf_info.ext_cp_info = []
-                for vnfc_resource_info in vnf_info.instantiated_vnf_info.vnfc_resource_info:
-
-                    vnf_resource_id = vnfc_resource_info.compute_resource.resource_id
-                    port_dict = vim.port_list(device_id=vnf_resource_id)
-                    for port_list in port_dict:
-                        for port in port_list['ports']:
-                            vnf_ext_cp_info = VnfExtCpInfo()
-                            vnf_ext_cp_info.cp_instance_id = str(port['id'])
-                            vnf_ext_cp_info.address = {
-                                'mac': [str(port['mac_address'])],
-                                'ip': []
-                            }
-
-                            for fixed_ip in port['fixed_ips']:
-                                vnf_ext_cp_info.address['ip'].append(str(fixed_ip['ip_address']))
-
-                            # Extract the CP ID from the port name
-                            match = re.search('CP\d+', port['name'])
-                            if match:
-                                vnf_ext_cp_info.cpd_id = str(match.group())
-                            else:
-                                raise TackerManoAdapterError('Cannot get the CP ID')
-
-                            vnf_info.instantiated_vnf_info.ext_cp_info.append(vnf_ext_cp_info)
+                for port_list in vnfc_port_list.values():
+                    for port in port_list:
+                        vnf_ext_cp_info = VnfExtCpInfo()
+                        vnf_ext_cp_info.cp_instance_id = str(port['id'])
+                        vnf_ext_cp_info.address = {
+                            'mac': [str(port['mac_address'])],
+                            'ip': []
+                        }
+
+                        for fixed_ip in port['fixed_ips']:
+                            vnf_ext_cp_info.address['ip'].append(str(fixed_ip['ip_address']))
+
+                        # Extract the CP ID from the port name
+                        match = re.search('CP\d+', port['name'])
+                        if match:
+                            vnf_ext_cp_info.cpd_id = str(match.group())
+                        else:
+                            raise TackerManoAdapterError('Cannot get the CP ID')
+
+                        vnf_info.instantiated_vnf_info.ext_cp_info.append(vnf_ext_cp_info)
 
             except tackerclient.common.exceptions.TackerException:
                 return vnf_info
@@ -687,6 +764,7 @@ class TackerManoAdapter(object):
                 }
             }
             self.tacker_client.scale_vnf(vnf_instance_id, body)
+            self.notify_lifecycle_call()
         except tackerclient.common.exceptions.NotFound as e:
             LOG.exception(e)
             raise TackerManoAdapterError(
@@ -703,6 +781,7 @@ class TackerManoAdapter(object):
                       additional_param=None):
         try:
             self.tacker_client.delete_vnf(vnf_instance_id)
+            self.notify_lifecycle_call()
         except tackerclient.common.exceptions.NotFound:
             # Treat the case when the VNF termination is attempted multiple times (ex. during test execution and as part
             # of the cleanup procedure)
@@ -718,27 +797,35 @@ class TackerManoAdapter(object):
 
     @log_entry_exit(LOG)
     def vnf_lifecycle_change_notification_subscribe(self, notification_filter=None):
-        # TODO: implement notification filter
-        last_vnf_event_id = list(self._get_vnf_events())[-1]['id']
-        LOG.debug('Got last event id: %d' % last_vnf_event_id)
+        notification_filter = notification_filter or {}
+        event_cursor = VnfEventCursor(self.tacker_client, resource_id=notification_filter.get('vnf_instance_id'))
+        with self.event_cursors_lock:
+            self.event_cursors.add(event_cursor)
 
-        def notification_generator(starting_event_id):
+        def notification_generator():
             while True:
-                vnf_events = self._get_vnf_events(starting_from=starting_event_id)
-                timer = Timer(10, lambda: None)  # TODO: define polling interval as parameter
-                timer.start()
-
-                for vnf_event in vnf_events:
-                    starting_event_id = vnf_event['id']
-                    notification = self.translate_vnf_event(vnf_event)
-                    if notification is not None:
-                        yield notification
+                notifications = [notification for notification in map(self.translate_vnf_event, event_cursor.fetch())
+                                 if notification is not None]
+                if len(notifications) > 0:
+                    # Let the pollers waiting for lifecycle operations to complete check their status right away
+                    polling.wake_up()
+                for notification in notifications:
+                    yield notification
 
                 yield None
-                timer.join()
+                event_cursor.wait()
 
         subscription_id = uuid.uuid4()
-        return subscription_id, notification_generator(last_vnf_event_id)
+        return subscription_id, notification_generator()
+
+    def notify_lifecycle_call(self):
+        """
+        This method makes the VNF event cursors poll again immediately, since a lifecycle call generates new events.
+        """
+        with self.event_cursors_lock:
+            event_cursors = list(self.event_cursors)
+        for event_cursor in event_cursors:
+            event_cursor.lifecycle_call.set()
 
     @log_entry_exit(LOG)
     def translate_vnf_event(self, vnf_event):
@@ -782,24 +869,6 @@ class TackerManoAdapter(object):
 
         return notification
 
-    @log_entry_exit(LOG)
-    def _get_vnf_events(self, starting_from=None, event_type=None, resource_id=None):
-        params = {}
-        if resource_id is not None:
-            params['resource_id'] = resource_id
-        if event_type is not None:
-            params['event_type'] = event_type
-
-        try:
-            vnf_events = self.tacker_client.list_vnf_events(**params)['vnf_events']
-        except Exception as e:
-            LOG.exception(e)
-            raise TackerManoAdapterError('Unable to get VNF events - %s' % e)
-        if starting_from is not None:
-            vnf_events = (vnf_event for vnf_event in vnf_events if vnf_event['id'] > starting_from)
-
-        return vnf_events
-
     @log_entry_exit(LOG)
     def wait_for_vnf_stable_state(self, vnf_instance_id, max_wait_time, poll_interval):
         if vnf_instance_id is None:
@@ -0,0 +1,252 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import cPickle as pickle
+import gzip
+import hashlib
+import logging
+import threading
+
+from api.adapter import ApiAdapterError
+from api.generic import constants
+
+CASSETTE_VERSION = 1
+
+# Names of the constants that are used as sleep intervals by the generic functions and the test cases
+TIMING_CONSTANTS = ['POLL_INTERVAL', 'INSTANCE_BOOT_TIME', 'INSTANCE_FIRST_BOOT_TIME', 'TRAFFIC_DELAY_TIME',
+                    'TRAFFIC_STABILIZATION_TIME']
+
+_context = threading.local()
+_active_cassette = None
+_original_timing = {}
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+class ReplayAdapterError(ApiAdapterError):
+    """
+    A problem occurred in the replay adapter.
+    """
+    pass
+
+
+def _args_digest(args, kwargs):
+    return hashlib.md5(repr((args, sorted(kwargs.items())))).hexdigest()
+
+
+def _is_api_object(obj):
+    return type(obj).__module__.startswith(('api.adapter.', 'api.generic.'))
+
+
+class Cassette(object):
+    """
+    Ordered record of the calls made to the adapters of one test case execution and of their outcomes, grouped in
+    streams. There is one stream per module type, plus one for the API objects returned by adapter methods.
+    """
+
+    def __init__(self, streams=None):
+        self.streams = streams or collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.pending = None
+
+    def record(self, stream, method, args_digest, outcome, payload):
+        with self.lock:
+            self.streams.setdefault(stream, []).append((method, args_digest, outcome, payload))
+
+    def save(self, cassette_path):
+        """
+        This method writes the cassette to a gzipped pickle file. Outcomes that can not be pickled are replaced by an
+        error, which is raised when the call is replayed.
+        """
+        with self.lock:
+            streams = collections.OrderedDict((stream, list(calls)) for stream, calls in self.streams.items())
+
+        serializable_streams = collections.OrderedDict()
+        for stream, calls in streams.items():
+            serializable_streams[stream] = []
+            for method, args_digest, outcome, payload in calls:
+                try:
+                    pickle.loads(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL))
+                except Exception:
+                    outcome, payload = 'error', ReplayAdapterError('Unable to record the result of %s' % method)
+                serializable_streams[stream].append((method, args_digest, outcome, payload))
+
+        with gzip.open(cassette_path, 'wb') as cassette_file:
+            pickle.dump({'version': CASSETTE_VERSION, 'streams': serializable_streams}, cassette_file,
+                        pickle.HIGHEST_PROTOCOL)
+
+    def take(self, stream, method, args_digest):
+        """
+        This method returns the first unused outcome recorded in the stream for the same method and arguments or, if
+        there is none, the first unused outcome recorded for the same method, since some arguments (ex. generated names)
+        differ from one run to another.
+
+        :return:    Tuple containing the outcome type and its payload.
+        """
+        with self.lock:
+            if self.pending is None:
+                self.pending = collections.defaultdict(collections.deque)
+                for recorded_stream, calls in self.streams.items():
+                    for recorded_method, recorded_args_digest, outcome, payload in calls:
+                        self.pending[(recorded_stream, recorded_method)].append(
+                            (recorded_args_digest, outcome, payload))
+
+            pending = self.pending.get((stream, method))
+            if not pending:
+                raise ReplayAdapterError('No recorded call to %s left in stream %s' % (method, stream))
+            for recorded_call in pending:
+                if recorded_call[0] == args_digest:
+                    pending.remove(recorded_call)
+                    break
+            else:
+                recorded_call = pending.popleft()
+        return recorded_call[1:]
+
+    @classmethod
+    def load(cls, cassette_path):
+        with gzip.open(cassette_path, 'rb') as cassette_file:
+            cassette_data = pickle.load(cassette_file)
+        if cassette_data.get('version') != CASSETTE_VERSION:
+            raise ReplayAdapterError('Unsupported cassette version %s' % cassette_data.get('version'))
+        return cls(cassette_data['streams'])
+
+
+def activate(cassette):
+    """
+    This function starts recording the calls made to the adapters constructed from now on in the cassette.
+    """
+    global _active_cassette
+    _active_cassette = cassette
+
+
+def deactivate():
+    global _active_cassette
+    _active_cassette = None
+
+
+def record_adapter(adapter, stream):
+    """
+    This function wraps the adapter in a recording proxy if a cassette is active and the adapter is not constructed
+    by an adapter call that is already being recorded.
+    """
+    cassette = _active_cassette
+    if cassette is None or getattr(_context, 'depth', 0) > 0 or isinstance(adapter, ReplayAdapter):
+        return adapter
+    return RecordingAdapter(adapter, cassette, stream)
+
+
+class RecordingAdapter(object):
+    """
+    Proxy that forwards the method calls to the adapter and records their outcome in the cassette.
+    """
+
+    def __init__(self, adapter, cassette, stream):
+        self._adapter = adapter
+        self._cassette = cassette
+        self._stream = stream
+
+    def __getattr__(self, name):
+        attr = getattr(self._adapter, name)
+        if not callable(attr):
+            return attr
+
+        def recorded_method(*args, **kwargs):
+            args_digest = _args_digest(args, kwargs)
+            _context.depth = getattr(_context, 'depth', 0) + 1
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                self._cassette.record(self._stream, name, args_digest, 'error', e)
+                raise
+            finally:
+                _context.depth -= 1
+
+            if _is_api_object(result):
+                object_stream = '%s.%s' % (self._stream, name)
+                self._cassette.record(self._stream, name, args_digest, 'object', object_stream)
+                return RecordingAdapter(result, self._cassette, object_stream)
+            self._cassette.record(self._stream, name, args_digest, 'result', result)
+            return result
+        return recorded_method
+
+
+def compress_timing(time_scale):
+    """
+    This function scales the sleep intervals defined in the constants module. The original values are restored by
+    restore_timing().
+    """
+    for constant_name in TIMING_CONSTANTS:
+        original_value = _original_timing.setdefault(constant_name, getattr(constants, constant_name))
+        setattr(constants, constant_name, original_value * time_scale)
+
+
+def restore_timing():
+    for constant_name, original_value in _original_timing.items():
+        setattr(constants, constant_name, original_value)
+    _original_timing.clear()
+
+
+class ReplayAdapter(object):
+    """
+    Adapter that serves the outcomes recorded in a cassette instead of calling the real API.
+    """
+    STREAM = None
+
+    def __init__(self, cassette, time_scale=0, stream=None, **kwargs):
+        """
+        :param cassette:    Path of the cassette file, or Cassette object.
+        :param time_scale:  Factor applied to the sleep intervals of the generic functions and of the test cases.
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+            compress_timing(time_scale)
+        self._cassette = cassette
+        self._stream = stream or self.STREAM
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def replayed_method(*args, **kwargs):
+            outcome, payload = self._cassette.take(self._stream, name, _args_digest(args, kwargs))
+            if outcome == 'error':
+                raise payload
+            if outcome == 'object':
+                return ReplayAdapter(self._cassette, stream=payload)
+            return payload
+        return replayed_method
+
+
+class ReplayManoAdapter(ReplayAdapter):
+    STREAM = 'mano'
+
+
+class ReplayVnfmAdapter(ReplayAdapter):
+    STREAM = 'vnfm'
+
+
+class ReplayEmAdapter(ReplayAdapter):
+    STREAM = 'em'
+
+
+class ReplayVnfAdapter(ReplayAdapter):
+    STREAM = 'vnf'
+
+
+class ReplayVimAdapter(ReplayAdapter):
+    STREAM = 'vim'
+
+
+class ReplayTrafficAdapter(ReplayAdapter):
+    STREAM = 'traffic'
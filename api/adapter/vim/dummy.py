@@ -11,6 +11,7 @@
 
 
 import logging
+from collections import OrderedDict
 
 from api.adapter.vim import VimAdapterError
 from api.structures.objects import VirtualCompute, VirtualNetwork, VirtualStorage
@@ -40,6 +41,10 @@ class DummyVimAdapter(object):
         virtual_compute = VirtualCompute()
         return virtual_compute
 
+    @log_entry_exit(LOG)
+    def query_virtualised_compute_resources(self, compute_id_list):
+        return OrderedDict((compute_id, VirtualCompute()) for compute_id in compute_id_list)
+
     @log_entry_exit(LOG)
     def query_virtualised_network_resource(self, query_network_filter):
         virtual_network = VirtualNetwork()
@@ -11,19 +11,36 @@
 
 
 import logging
-from novaclient.exceptions import NotFound
-from keystoneauth1.exceptions import DiscoveryFailure
+from collections import OrderedDict
+from threading import Lock
 
-import os_client_config
+from novaclient.exceptions import NotFound
 
+from api.adapter.keystone import get_shared_session
 from api.adapter.vim import VimAdapterError
 from api.generic import constants
 from api.structures.objects import VirtualCompute, VirtualCpu, VirtualMemory, VirtualStorage, VirtualNetworkInterface, \
     VirtualComputeQuota, VirtualNetworkQuota, VirtualStorageQuota, SoftwareImageInformation
+from utils.cache import LruCache
 from utils.logging_module import log_entry_exit
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of flavors and images cached by the process, across all the VIMs and projects
+FLAVOR_CACHE_SIZE = 1024
+IMAGE_CACHE_SIZE = 1024
+
+# Maximum number of server IDs in one query of ports, which are passed in the URL of the query
+PORT_QUERY_CHUNK_SIZE = 50
+
+FLAVOR_CACHE = LruCache('openstack_flavor', FLAVOR_CACHE_SIZE)
+IMAGE_CACHE = LruCache('openstack_image', IMAGE_CACHE_SIZE)
+
+# (auth_url, project_name) tuples for which the caches were warmed up with the listing of all flavors or images
+_warmed_up_flavor_scopes = set()
+_warmed_up_image_scopes = set()
+_warm_up_lock = Lock()
+
 
 class OpenstackVimAdapterError(VimAdapterError):
     """
@@ -56,69 +73,40 @@ class OpenstackVimAdapter(object):
     @log_entry_exit(LOG)
     def build_clients(self, auth_url=None, username=None, password=None, identity_api_version=None, project_name=None,
                       project_domain_name=None, user_domain_name=None, verify=False):
-        try:
-            self.heat_client = os_client_config.make_client('orchestration',
-                                                            auth_url=auth_url,
-                                                            username=username,
-                                                            password=password,
-                                                            identity_api_version=identity_api_version,
-                                                            project_name=project_name,
-                                                            project_domain_name=project_domain_name,
-                                                            user_domain_name=user_domain_name,
-                                                            verify=verify)
-
-            self.neutron_client = os_client_config.make_client('network',
-                                                               auth_url=auth_url,
-                                                               username=username,
-                                                               password=password,
-                                                               identity_api_version=identity_api_version,
-                                                               project_name=project_name,
-                                                               project_domain_name=project_domain_name,
-                                                               user_domain_name=user_domain_name,
-                                                               verify=verify)
-
-            self.nova_client = os_client_config.make_client('compute',
-                                                            auth_url=auth_url,
-                                                            username=username,
-                                                            password=password,
-                                                            identity_api_version=identity_api_version,
-                                                            project_name=project_name,
-                                                            project_domain_name=project_domain_name,
-                                                            user_domain_name=user_domain_name,
-                                                            verify=verify)
-
-            self.cinder_client = os_client_config.make_client('volume',
-                                                              auth_url=auth_url,
-                                                              username=username,
-                                                              password=password,
-                                                              identity_api_version=identity_api_version,
-                                                              project_name=project_name,
-                                                              project_domain_name=project_domain_name,
-                                                              user_domain_name=user_domain_name,
-                                                              verify=verify)
-
-            self.glance_client = os_client_config.make_client('image',
-                                                              auth_url=auth_url,
-                                                              username=username,
-                                                              password=password,
-                                                              identity_api_version=identity_api_version,
-                                                              project_name=project_name,
-                                                              project_domain_name=project_domain_name,
-                                                              user_domain_name=user_domain_name,
-                                                              verify=verify)
-        except DiscoveryFailure as e:
-            if user_domain_name is None and project_domain_name is None:
-                LOG.debug('Domain params are not present, so not attempting to retry building adapter without them')
-                raise e
-
-            LOG.debug('Unable to build adapter, because auth_url may be v2.0 and domain params are present. '
-                      'Retrying without domain params')
-            self.build_clients(auth_url=auth_url,
-                               username=username,
-                               password=password,
-                               identity_api_version=identity_api_version,
-                               project_name=project_name,
-                               verify=verify)
+        """
+        This method gets the keystone session shared by the adapters using the same credentials. The Heat, Neutron,
+        Nova, Cinder and Glance clients are built from it on first use.
+        """
+        self.auth_url = auth_url
+        self.project_name = project_name
+        self.shared_session = get_shared_session(auth_url=auth_url,
+                                                 username=username,
+                                                 password=password,
+                                                 identity_api_version=identity_api_version,
+                                                 project_name=project_name,
+                                                 project_domain_name=project_domain_name,
+                                                 user_domain_name=user_domain_name,
+                                                 verify=verify)
+
+    @property
+    def heat_client(self):
+        return self.shared_session.get_client('orchestration')
+
+    @property
+    def neutron_client(self):
+        return self.shared_session.get_client('network')
+
+    @property
+    def nova_client(self):
+        return self.shared_session.get_client('compute')
+
+    @property
+    def cinder_client(self):
+        return self.shared_session.get_client('volume')
+
+    @property
+    def glance_client(self):
+        return self.shared_session.get_client('image')
 
     @log_entry_exit(LOG)
     def get_operation_status(self, operation_id):
@@ -199,13 +187,18 @@ class OpenstackVimAdapter(object):
             raise OpenstackVimAdapterError('Unable to get project ID - %s' % e)
         return str(project_id)
 
-    @log_entry_exit(LOG)
-    def query_virtualised_compute_resource(self, query_compute_filter):
-        virtual_compute = VirtualCompute()
+    def build_virtual_compute(self, compute_id, server_details, port_list):
+        """
+        This function builds the VirtualCompute information element of a server.
 
-        compute_id = query_compute_filter['compute_id']
+        :param compute_id:      ID of the server.
+        :param server_details:  Dictionary with server details, as returned by server_get().
+        :param port_list:       List of the ports of the server.
+        :return:                VirtualCompute object.
+        """
+        virtual_compute = VirtualCompute()
         virtual_compute.compute_id = compute_id
-        server_details = self.server_get(compute_id)
+
         server_flavor_id = server_details['flavor_id']
         virtual_compute.flavour_id = server_flavor_id
         server_status = server_details['status']
@@ -228,22 +221,56 @@ class OpenstackVimAdapter(object):
         virtual_compute.virtual_disks = [virtual_storage]
 
         virtual_compute.virtual_network_interface = []
-        port_dict = self.port_list(device_id=compute_id)
-        for port_list in port_dict:
-            for port in port_list['ports']:
-                virtual_network_interface = VirtualNetworkInterface()
-                virtual_network_interface.resource_id = str(port['id'])
-                virtual_network_interface.owner_id = str(port['device_id'])
-                virtual_network_interface.network_id = str(port['network_id'])
-                virtual_network_interface.type_virtual_nic = str(port['binding:vnic_type'])
-                virtual_network_interface.mac_address = str(port['mac_address'])
-                virtual_network_interface.acceleration_capability = []
-                virtual_compute.virtual_network_interface.append(virtual_network_interface)
+        for port in port_list:
+            virtual_network_interface = VirtualNetworkInterface()
+            virtual_network_interface.resource_id = str(port['id'])
+            virtual_network_interface.owner_id = str(port['device_id'])
+            virtual_network_interface.network_id = str(port['network_id'])
+            virtual_network_interface.type_virtual_nic = str(port['binding:vnic_type'])
+            virtual_network_interface.mac_address = str(port['mac_address'])
+            virtual_network_interface.acceleration_capability = []
+            virtual_compute.virtual_network_interface.append(virtual_network_interface)
 
         virtual_compute.vc_image_id = server_details['image_id']
-        # TODO: What should the function return when the specified resources are not found?
         return virtual_compute
 
+    @log_entry_exit(LOG)
+    def query_virtualised_compute_resource(self, query_compute_filter):
+        compute_id = query_compute_filter['compute_id']
+        server_details = self.server_get(compute_id)
+        port_list = [port for port_page in self.port_list(device_id=compute_id) for port in port_page['ports']]
+
+        # TODO: What should the function return when the specified resources are not found?
+        return self.build_virtual_compute(compute_id, server_details, port_list)
+
+    @log_entry_exit(LOG)
+    def query_virtualised_compute_resources(self, compute_id_list):
+        """
+        This function queries the virtualised compute resources with the given IDs in bulk: the servers of the project
+        are listed in a single paged listing and joined in memory with the requested IDs, the ports of the servers are
+        listed by device_port_list() and the flavors are fetched once each. The servers missing from the listing are
+        left out of the result.
+
+        :param compute_id_list: List of server IDs.
+        :return:                Ordered dictionary with the IDs of the servers found as keys and the VirtualCompute
+                                objects as values, in the order of compute_id_list.
+        """
+        compute_id_list = list(OrderedDict.fromkeys(compute_id_list))
+        if len(compute_id_list) == 0:
+            return OrderedDict()
+
+        listed_servers = dict((str(server.id), server) for server in self.server_list(limit=-1))
+        details_by_id = OrderedDict((compute_id, self.server_details(listed_servers[compute_id]))
+                                    for compute_id in compute_id_list if compute_id in listed_servers)
+        for compute_id in compute_id_list:
+            if compute_id not in details_by_id:
+                LOG.debug('Server %s not found' % compute_id)
+
+        ports = self.device_port_list(list(details_by_id.keys()))
+
+        return OrderedDict((compute_id, self.build_virtual_compute(compute_id, details, ports[compute_id]))
+                           for compute_id, details in details_by_id.items())
+
     @log_entry_exit(LOG)
     def trigger_compute_resource_terminate(self, compute_id):
         try:
@@ -288,17 +315,37 @@ class OpenstackVimAdapter(object):
             raise OpenstackVimAdapterError('Unable to get the list of ports - %s' % e)
         return neutron_ports
 
+    def device_port_list(self, device_id_list):
+        """
+        This function gets the ports of the devices with the given IDs, with one paged query per chunk of
+        PORT_QUERY_CHUNK_SIZE device IDs, since the device IDs are passed in the URL of the query.
+
+        :param device_id_list:  List of device IDs. Ex. server IDs
+        :return:                Ordered dictionary with the device IDs as keys and the lists of their ports as values,
+                                in the order of device_id_list.
+        """
+        ports = OrderedDict((device_id, []) for device_id in device_id_list)
+        device_id_list = list(ports.keys())
+        for chunk_start in range(0, len(device_id_list), PORT_QUERY_CHUNK_SIZE):
+            for port_page in self.port_list(device_id=device_id_list[chunk_start:chunk_start + PORT_QUERY_CHUNK_SIZE]):
+                for port in port_page['ports']:
+                    if port['device_id'] in ports:
+                        ports[port['device_id']].append(port)
+        return ports
+
     @log_entry_exit(LOG)
-    def server_list(self, query_filter=None):
+    def server_list(self, query_filter=None, limit=None):
         """
         This function gets the list of servers.
 
         :param query_filter:    Filter out servers which don't match the search_opts (optional). The search opts format
                                 is a dictionary of key / value pairs that will be appended to the query string.
+        :param limit:           Maximum number of servers to get (optional). If -1, all the servers are fetched, one
+                                page at a time. Otherwise Nova returns at most osapi_max_limit servers.
         :return:                List of 'Server' objects.
         """
         try:
-            nova_servers = self.nova_client.servers.list(search_opts=query_filter)
+            nova_servers = self.nova_client.servers.list(search_opts=query_filter, limit=limit)
         except Exception as e:
             LOG.exception(e)
             raise OpenstackVimAdapterError('Unable to get the list of servers - %s' % e)
@@ -318,7 +365,11 @@ class OpenstackVimAdapter(object):
             LOG.exception(e)
             raise OpenstackVimAdapterError('Unable to get details for server %s - %s' % (server_id, e))
 
-        server_details = {
+        return self.server_details(server)
+
+    @staticmethod
+    def server_details(server):
+        return {
             'flavor_id': str(server.flavor['id']),
             'hostId': str(server.hostId),
             'image_id': str(server.image['id']),
@@ -327,8 +378,6 @@ class OpenstackVimAdapter(object):
             'user_id': str(server.user_id)
         }
 
-        return server_details
-
     @log_entry_exit(LOG)
     def stack_get(self, stack_id):
         """
@@ -501,43 +550,144 @@ class OpenstackVimAdapter(object):
                 setattr(virtual_storage_quota, item, value)
         return virtual_storage_quota
 
+    def warm_up_flavor_cache(self):
+        """
+        This function caches the details of all the flavors visible to the project with a single listing.
+
+        :return:    Dictionary with the flavor IDs as keys and the flavor details as values.
+        """
+        # The listing is attempted once per project. If it fails, the lookups get the flavors by ID
+        with _warm_up_lock:
+            _warmed_up_flavor_scopes.add((self.auth_url, self.project_name))
+        try:
+            flavor_list = self.nova_client.flavors.list(is_public=None)
+        except Exception as e:
+            LOG.exception(e)
+            raise OpenstackVimAdapterError('Unable to get the list of flavors - %s' % e)
+
+        flavors = {}
+        for flavor in flavor_list:
+            flavors[str(flavor.id)] = self.flavor_details(flavor)
+            FLAVOR_CACHE.put((self.auth_url, self.project_name, str(flavor.id)), flavors[str(flavor.id)])
+        return flavors
+
     @log_entry_exit(LOG)
     def flavor_get(self, flavor_id):
         """
-        This function retrieves the details for the flavor with the given ID.
+        This function retrieves the details for the flavor with the given ID. The details are cached for the whole
+        process, since flavors do not change. The first flavor looked up for the project warms up the cache with all
+        the flavors of the project.
 
         :param flavor_id:   ID of the flavor to get details for.
         :return:            Dictionary with flavor details.
         """
-        try:
-            flavor = self.nova_client.flavors.get(flavor_id)
-        except Exception as e:
-            LOG.exception(e)
-            raise OpenstackVimAdapterError('Unable to get details for flavor %s - %s' % (flavor_id, e))
+        def load_flavor(_):
+            with _warm_up_lock:
+                warmed_up = (self.auth_url, self.project_name) in _warmed_up_flavor_scopes
+            if not warmed_up:
+                try:
+                    flavor_details = self.warm_up_flavor_cache().get(str(flavor_id))
+                except OpenstackVimAdapterError:
+                    LOG.debug('Unable to warm up the flavor cache, getting flavor %s by ID' % flavor_id)
+                    flavor_details = None
+                if flavor_details is not None:
+                    return flavor_details
+
+            try:
+                flavor = self.nova_client.flavors.get(flavor_id)
+            except NotFound:
+                return None
+            except Exception as e:
+                LOG.exception(e)
+                raise OpenstackVimAdapterError('Unable to get details for flavor %s - %s' % (flavor_id, e))
+            return self.flavor_details(flavor)
+
+        flavor_details = FLAVOR_CACHE.get((self.auth_url, self.project_name, str(flavor_id)), load_flavor)
+        if flavor_details is None:
+            raise OpenstackVimAdapterError('Unable to get details for flavor %s - flavor not found' % flavor_id)
 
-        flavor_details = {
+        return dict(flavor_details)
+
+    @staticmethod
+    def flavor_details(flavor):
+        return {
             'name': flavor.name,
             'vcpus': flavor.vcpus,
             'ram': flavor.ram,
             'disk': flavor.disk
         }
 
-        return flavor_details
+    def warm_up_image_cache(self):
+        """
+        This function caches the details of all the images visible to the project with a single listing.
 
-    @log_entry_exit(LOG)
-    def query_image(self, image_id):
+        :return:    Dictionary with the image IDs as keys and the image details as values.
+        """
+        # The listing is attempted once per project. If it fails, the lookups get the images by ID
+        with _warm_up_lock:
+            _warmed_up_image_scopes.add((self.auth_url, self.project_name))
         try:
-            image = self.glance_client.images.get(image_id)
+            image_list = list(self.glance_client.images.list())
         except Exception as e:
             LOG.exception(e)
-            raise OpenstackVimAdapterError('Unable to get details for image %s - %s' % (image_id, e))
+            raise OpenstackVimAdapterError('Unable to get the list of images - %s' % e)
+
+        images = {}
+        for image in image_list:
+            images[str(image.id)] = self.image_details(image)
+            IMAGE_CACHE.put((self.auth_url, self.project_name, str(image.id)), images[str(image.id)])
+        return images
+
+    @log_entry_exit(LOG)
+    def query_image(self, image_id):
+        """
+        This function retrieves the information of the image with the given ID. The image details are cached for the
+        whole process, since images do not change, and a new SoftwareImageInformation object is built from them for
+        every call. The first image looked up for the project warms up the cache with all the images of the project.
+
+        :param image_id:    ID of the image.
+        :return:            SoftwareImageInformation object.
+        """
+        def load_image(_):
+            with _warm_up_lock:
+                warmed_up = (self.auth_url, self.project_name) in _warmed_up_image_scopes
+            if not warmed_up:
+                try:
+                    image_details = self.warm_up_image_cache().get(str(image_id))
+                except OpenstackVimAdapterError:
+                    LOG.debug('Unable to warm up the image cache, getting image %s by ID' % image_id)
+                    image_details = None
+                if image_details is not None:
+                    return image_details
+
+            try:
+                image = self.glance_client.images.get(image_id)
+            except Exception as e:
+                if getattr(e, 'code', None) == 404 or getattr(e, 'http_status', None) == 404:
+                    return None
+                LOG.exception(e)
+                raise OpenstackVimAdapterError('Unable to get details for image %s - %s' % (image_id, e))
+            return self.image_details(image)
+
+        image_details = IMAGE_CACHE.get((self.auth_url, self.project_name, str(image_id)), load_image)
+        if image_details is None:
+            raise OpenstackVimAdapterError('Unable to get details for image %s - image not found' % image_id)
 
         software_image_information = SoftwareImageInformation()
         software_image_information.id = image_id
-        software_image_information.name = str(image.name)
-        software_image_information.created_at = str(image.created_at)
-        software_image_information.updated_at = str(image.updated_at)
-        software_image_information.min_disk = image.min_disk
-        software_image_information.min_ram = image.min_ram
-
+        software_image_information.name = image_details['name']
+        software_image_information.created_at = image_details['created_at']
+        software_image_information.updated_at = image_details['updated_at']
+        software_image_information.min_disk = image_details['min_disk']
+        software_image_information.min_ram = image_details['min_ram']
         return software_image_information
+
+    @staticmethod
+    def image_details(image):
+        return {
+            'name': str(image.name),
+            'created_at': str(image.created_at),
+            'updated_at': str(image.updated_at),
+            'min_disk': image.min_disk,
+            'min_ram': image.min_ram
+        }
@@ -11,12 +11,13 @@
 
 
 import logging
-import time
 
 from api.adapter import construct_adapter
 from api.generic import ApiGenericError
 from api.generic import constants
+from utils import tracing
 from utils.logging_module import log_entry_exit
+from utils.polling import poll_for_completion
 
 # Instantiate logger
 LOG = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class Em(object):
         Construct the EM object corresponding to the specified vendor.
         """
         self.set_generic_config(**generic_config)
+        self.vendor = vendor
         self.em_adapter = construct_adapter(vendor, module_type='em', **adapter_config)
 
     def set_generic_config(self, VNF_SCALE_TIMEOUT=constants.VNF_SCALE_TIMEOUT, POLL_INTERVAL=constants.POLL_INTERVAL):
@@ -72,22 +74,8 @@ class Em(object):
         :param poll_interval:                       Interval of time in seconds between consecutive polls.
         :return:                                    Operation status.
         """
-        operation_pending = True
-        elapsed_time = 0
-
-        while operation_pending and elapsed_time < max_wait_time:
-            operation_status = self.get_operation_status(lifecycle_operation_occurrence_id)
-            LOG.debug('Got status %s for operation with ID %s' % (operation_status, lifecycle_operation_occurrence_id))
-            if operation_status in final_states:
-                operation_pending = False
-            else:
-                LOG.debug('Expected state to be one of %s, got %s' % (final_states, operation_status))
-                LOG.debug('Sleeping %s seconds' % poll_interval)
-                time.sleep(poll_interval)
-                elapsed_time += poll_interval
-                LOG.debug('Elapsed time %s seconds out of %s' % (elapsed_time, max_wait_time))
-
-        return operation_status
+        return poll_for_completion(self.get_operation_status, lifecycle_operation_occurrence_id, final_states,
+                                   max_wait_time, poll_interval, operation_name=tracing.caller_name())
 
     @log_entry_exit(LOG)
     def modify_vnf_configuration(self, vnf_instance_id, vnf_configuration_data=None, ext_virtual_link=None,
@@ -12,15 +12,18 @@
 
 import logging
 import re
-import time
 from collections import OrderedDict
 from threading import Thread, Event, Lock
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from api.adapter import construct_adapter
 from api.generic import ApiGenericError
 from api.generic import constants
+from utils import tracing
 from utils.logging_module import log_entry_exit
 from utils.misc import recursive_map, tee
+from utils.polling import poll_for_completion
 
 # Instantiate logger
 LOG = logging.getLogger(__name__)
@@ -37,12 +40,14 @@ class Mano(object):
     """
     Class of generic functions representing operations exposed by the MANO.
     """
+    MAX_PARALLEL_VALIDATIONS = 8
 
     def __init__(self, vendor, generic_config, adapter_config):
         """
         Construct the Mano object corresponding to the specified vendor.
         """
         self.set_generic_config(**generic_config)
+        self.vendor = vendor
         self.mano_adapter = construct_adapter(vendor, module_type='mano', **adapter_config)
         self.notification_queues = {}
 
@@ -201,22 +206,91 @@ class Mano(object):
         :param poll_interval:                       Interval of time in seconds between consecutive polls.
         :return:                                    Operation status.
         """
-        operation_pending = True
-        elapsed_time = 0
-
-        while operation_pending and elapsed_time < max_wait_time:
-            operation_status = self.get_operation_status(lifecycle_operation_occurrence_id)
-            LOG.debug('Got status %s for operation with ID %s' % (operation_status, lifecycle_operation_occurrence_id))
-            if operation_status in final_states:
-                operation_pending = False
-            else:
-                LOG.debug('Expected state to be one of %s, got %s' % (final_states, operation_status))
-                LOG.debug('Sleeping %s seconds' % poll_interval)
-                time.sleep(poll_interval)
-                elapsed_time += poll_interval
-                LOG.debug('Elapsed time %s seconds out of %s' % (elapsed_time, max_wait_time))
+        return poll_for_completion(self.get_operation_status, lifecycle_operation_occurrence_id, final_states,
+                                   max_wait_time, poll_interval, operation_name=tracing.caller_name())
 
-        return operation_status
+    def call_all(self, func, items):
+        """
+        This function calls func for each of the items concurrently, on a bounded thread pool, and waits for all the
+        calls to complete.
+
+        :param func:    Function taking an item as argument.
+        :param items:   Items to call func for.
+        :return:        List with one (result, exception) tuple per item, in the order of the items.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            outcomes = []
+            for item in items:
+                try:
+                    outcomes.append((func(item), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_VALIDATIONS, len(items))) as executor:
+            futures = [executor.submit(tracing.bind(func), item) for item in items]
+            wait(futures)
+        return [(None, future.exception()) if future.exception() is not None else (future.result(), None)
+                for future in futures]
+
+    def verify_all(self, verify_func, items):
+        """
+        This function calls verify_func for each of the items concurrently and combines the results. As soon as a call
+        returns False or raises an exception, the calls that have not started yet are cancelled and the running ones
+        are waited for. The outcome is the one of the first failed call in the order of the items, among the calls that
+        completed, whatever the order in which they completed.
+
+        :param verify_func: Function taking an item as argument and returning True if the item is valid.
+        :param items:       Items to verify.
+        :return:            True if verify_func returned True for all items, False otherwise.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return all(verify_func(item) for item in items)
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_VALIDATIONS, len(items))) as executor:
+            futures = [executor.submit(tracing.bind(verify_func), item) for item in items]
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if any(future.exception() is not None or not future.result() for future in done):
+                    for future in pending:
+                        future.cancel()
+                    break
+
+        for future in futures:
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                raise future.exception()
+            if not future.result():
+                return False
+        return True
+
+    def query_vnfc_compute_resources(self, vnfc_resource_info_list):
+        """
+        This function queries the compute resources of the VNFCs with one bulk query per VIM. The VIMs are queried
+        concurrently.
+
+        :param vnfc_resource_info_list: List of VnfcResourceInfo structures.
+        :return:                        Dictionary with the IDs of the compute resources found in the VIMs as keys
+                                        and the VirtualCompute structures as values.
+        """
+        resource_id_lists = OrderedDict()
+        for vnfc_resource_info in vnfc_resource_info_list:
+            resource_id_lists.setdefault(vnfc_resource_info.compute_resource.vim_id, []).append(
+                vnfc_resource_info.compute_resource.resource_id)
+
+        def query_vim(vim_id):
+            return self.get_vim_helper(vim_id).query_virtualised_compute_resources(resource_id_lists[vim_id])
+
+        virtual_computes = {}
+        for result, exception in self.call_all(query_vim, resource_id_lists.keys()):
+            if exception is not None:
+                raise exception
+            virtual_computes.update(result)
+        return virtual_computes
 
     @log_entry_exit(LOG)
     def validate_vnf_allocated_vresources(self, vnf_instance_id, additional_param=None):
@@ -241,13 +315,15 @@ class Mano(object):
         :return:                    True if the allocated resources are as expected, False otherwise.
         """
         ns_info = self.ns_query(query_filter={'ns_instance_id': ns_instance_id, 'additional_param': additional_param})
-        for vnf_info in ns_info.vnf_info:
+
+        def validate_vnf(vnf_info):
             if not self.mano_adapter.validate_vnf_allocated_vresources(vnf_info, additional_param):
                 LOG.debug('For VNF instance ID %s expected resources do not match the actual ones'
                           % vnf_info.vnf_instance_id)
                 return False
+            return True
 
-        return True
+        return self.verify_all(validate_vnf, ns_info.vnf_info)
 
     @log_entry_exit(LOG)
     def validate_ns_released_vresources(self, ns_info):
@@ -257,10 +333,7 @@ class Mano(object):
         :param ns_info: NsInfo structure holding information about the NS instance.
         :return:        True if the resources have been released, False otherwise.
         """
-        for vnf_info in ns_info.vnf_info:
-            if not self.validate_vnf_released_vresources(vnf_info):
-                return False
-        return True
+        return self.verify_all(self.validate_vnf_released_vresources, ns_info.vnf_info)
 
     @log_entry_exit(LOG)
     def validate_vnf_released_vresources(self, vnf_info_initial, vnf_info_final=None):
@@ -285,17 +358,18 @@ class Mano(object):
             LOG.debug('Cannot perform validation because vnf_info_initial reports the VNF instantiation state as %s'
                       % constants.VNF_NOT_INSTANTIATED)
             return False
+
+        vnfc_resource_info_list = []
         for vnfc_resource_info in vnf_info_initial.instantiated_vnf_info.vnfc_resource_info:
             if vnfc_resource_info.compute_resource.resource_id not in vnfc_resource_id_list_final:
-                vim_id = vnfc_resource_info.compute_resource.vim_id
-                vim = self.get_vim_helper(vim_id)
-                resource_id = vnfc_resource_info.compute_resource.resource_id
-                try:
-                    vim.query_virtualised_compute_resource(query_compute_filter={'compute_id': resource_id})
-                    LOG.debug('Resource ID %s found in VIM, not as expected' % resource_id)
-                    return False
-                except Exception:
-                    LOG.debug('Resource ID %s not found in VIM, as expected' % resource_id)
+                vnfc_resource_info_list.append(vnfc_resource_info)
+        virtual_computes = self.query_vnfc_compute_resources(vnfc_resource_info_list)
+        for vnfc_resource_info in vnfc_resource_info_list:
+            resource_id = vnfc_resource_info.compute_resource.resource_id
+            if resource_id in virtual_computes:
+                LOG.debug('Resource ID %s found in VIM, not as expected' % resource_id)
+                return False
+            LOG.debug('Resource ID %s not found in VIM, as expected' % resource_id)
         return True
 
     @log_entry_exit(LOG)
@@ -323,19 +397,22 @@ class Mano(object):
 
         # Validate the state of the VNF and its resources
         vnf_state = vnf_info.instantiated_vnf_info.vnf_state
-        for vnfc_resource_info in vnf_info.instantiated_vnf_info.vnfc_resource_info:
-            vim_id = vnfc_resource_info.compute_resource.vim_id
-            vim = self.get_vim_helper(vim_id)
+        vnfc_resource_info_list = vnf_info.instantiated_vnf_info.vnfc_resource_info
+        try:
+            virtual_computes = self.query_vnfc_compute_resources(vnfc_resource_info_list)
+        except Exception as e:
+            LOG.debug('Unable to query the resources corresponding to VNF %s in VIM' % vnf_info.vnf_product_name)
+            LOG.exception(e)
+            return False
+        for vnfc_resource_info in vnfc_resource_info_list:
             resource_id = vnfc_resource_info.compute_resource.resource_id
-            try:
-                virtual_compute = vim.query_virtualised_compute_resource(
-                    query_compute_filter={'compute_id': resource_id})
-                if virtual_compute.operational_state != VNF_TO_VRESOURCE_MAPPING[vnf_state]:
-                    return False
-            except Exception:
+            virtual_compute = virtual_computes.get(resource_id)
+            if virtual_compute is None:
                 LOG.debug('Resource ID %s corresponding to VNF %s not found in VIM' %
                           (resource_id, vnf_info.vnf_product_name))
                 return False
+            if virtual_compute.operational_state != VNF_TO_VRESOURCE_MAPPING[vnf_state]:
+                return False
         return True
 
     @log_entry_exit(LOG)
@@ -358,29 +435,40 @@ class Mano(object):
             return vresources
 
         # Retrieve the allocated resources
-        for vnfc_resource_info in vnf_info.instantiated_vnf_info.vnfc_resource_info:
-            vim_id = vnfc_resource_info.compute_resource.vim_id
-            vim = self.get_vim_helper(vim_id)
+        vnfc_resource_info_list = vnf_info.instantiated_vnf_info.vnfc_resource_info
+        virtual_computes = self.query_vnfc_compute_resources(vnfc_resource_info_list)
 
+        def get_vnfc_vresources(vnfc_resource_info):
+            vim_id = vnfc_resource_info.compute_resource.vim_id
             resource_id = vnfc_resource_info.compute_resource.resource_id
-            virtual_compute = vim.query_virtualised_compute_resource(query_compute_filter={'compute_id': resource_id})
+            virtual_compute = virtual_computes.get(resource_id)
+            if virtual_compute is None:
+                raise ManoGenericError('Resource ID %s not found in VIM' % resource_id)
 
-            resource_string = '%s (%s)' % (resource_id, vnfc_resource_info.vdu_id)
-            vresources[resource_string] = OrderedDict()
+            vnfc_vresources = OrderedDict()
 
             num_virtual_cpu = virtual_compute.virtual_cpu.num_virtual_cpu
             virtual_memory = virtual_compute.virtual_memory.virtual_mem_size
             size_of_storage = virtual_compute.virtual_disks[0].size_of_storage
             num_vnics = len(virtual_compute.virtual_network_interface)
             vc_image_id = virtual_compute.vc_image_id
-            software_image_information = vim.query_image(vc_image_id)
+            software_image_information = self.get_vim_helper(vim_id).query_image(vc_image_id)
             vc_image_name = software_image_information.name
 
-            vresources[resource_string]['vCPU'] = num_virtual_cpu
-            vresources[resource_string]['vMemory'] = str(virtual_memory) + ' MB'
-            vresources[resource_string]['vStorage'] = str(size_of_storage) + ' GB'
-            vresources[resource_string]['vNIC'] = str(num_vnics)
-            vresources[resource_string]['Image name'] = str(vc_image_name)
+            vnfc_vresources['vCPU'] = num_virtual_cpu
+            vnfc_vresources['vMemory'] = str(virtual_memory) + ' MB'
+            vnfc_vresources['vStorage'] = str(size_of_storage) + ' GB'
+            vnfc_vresources['vNIC'] = str(num_vnics)
+            vnfc_vresources['Image name'] = str(vc_image_name)
+            return vnfc_vresources
+
+        # The images of the VNFCs are looked up concurrently
+        outcomes = self.call_all(get_vnfc_vresources, vnfc_resource_info_list)
+        for vnfc_resource_info, (vnfc_vresources, exception) in zip(vnfc_resource_info_list, outcomes):
+            if exception is not None:
+                raise exception
+            resource_string = '%s (%s)' % (vnfc_resource_info.compute_resource.resource_id, vnfc_resource_info.vdu_id)
+            vresources[resource_string] = vnfc_vresources
 
         return vresources
 
@@ -1395,11 +1483,14 @@ class Mano(object):
         :return:                    True if all VNFCs use the correct images, False otherwise.
         """
         ns_info = self.ns_query(query_filter={'ns_instance_id': ns_instance_id, 'additional_param': additional_param})
-        for vnf_info in ns_info.vnf_info:
+
+        def verify_vnf(vnf_info):
             if not self.mano_adapter.verify_vnf_sw_images(vnf_info, additional_param):
                 LOG.error('Not all VNFCs in VNF with instance ID %s use the correct images' % vnf_info.vnf_instance_id)
                 return False
-        return True
+            return True
+
+        return self.verify_all(verify_vnf, ns_info.vnf_info)
 
     @log_entry_exit(LOG)
     def get_vnfd_name_from_nsd_vnf_name(self, nsd_id, vnf_name):
@@ -1490,12 +1581,15 @@ class Mano(object):
             vnf_name = scale_to_level['target_vnf_name']
             target_instantiation_level_id = scale_to_level['target_instantiation_level_id']
             vnf_name_level_id_mapping[vnf_name] = target_instantiation_level_id
-        for vnf_info in ns_info.vnf_info:
+
+        def validate_vnf(vnf_info):
             instantiation_level_id = vnf_name_level_id_mapping.get(vnf_info.vnf_product_name)
             if not self.validate_vnf_instantiation_level(vnf_info, instantiation_level_id, additional_param):
                 LOG.debug('Incorrect number of VNFC instances for VNF %s' % vnf_info.vnf_product_name)
                 return False
-        return True
+            return True
+
+        return self.verify_all(validate_vnf, ns_info.vnf_info)
 
     @log_entry_exit(LOG)
     def vnf_change_flavour(self, vnf_instance_id, new_flavour_id, instantiation_level_id=None, ext_virtual_link=None,
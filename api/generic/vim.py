@@ -11,12 +11,13 @@
 
 
 import logging
-import time
 
 from api.adapter import construct_adapter
 from api.generic import ApiGenericError, constants
 from api.structures.objects import ComputePoolReservation, StoragePoolReservation
+from utils import tracing
 from utils.logging_module import log_entry_exit
+from utils.polling import poll_for_completion
 
 # Instantiate logger
 LOG = logging.getLogger(__name__)
@@ -63,22 +64,8 @@ class Vim(object):
         :param poll_interval:   Interval of time in seconds between consecutive polls.
         :return:                Operation status.
         """
-        operation_pending = True
-        elapsed_time = 0
-
-        while operation_pending and elapsed_time < max_wait_time:
-            operation_status = self.get_operation_status(operation_id)
-            LOG.debug('Got status %s for operation with ID %s' % (operation_status, operation_id))
-            if operation_status in final_states:
-                operation_pending = False
-            else:
-                LOG.debug('Expected state to be one of %s, got %s' % (final_states, operation_status))
-                LOG.debug('Sleeping %s seconds' % poll_interval)
-                time.sleep(poll_interval)
-                elapsed_time += poll_interval
-                LOG.debug('Elapsed time %s seconds out of %s' % (elapsed_time, max_wait_time))
-
-        return operation_status
+        return poll_for_completion(self.get_operation_status, operation_id, final_states, max_wait_time, poll_interval,
+                                   operation_name=tracing.caller_name())
 
     @log_entry_exit(LOG)
     def get_resource_group_id(self):
@@ -284,6 +271,17 @@ class Vim(object):
         """
         return self.vim_adapter.query_virtualised_compute_resource(query_compute_filter)
 
+    @log_entry_exit(LOG)
+    def query_virtualised_compute_resources(self, compute_id_list):
+        """
+        This function queries information about several instantiated virtualised compute resources in bulk.
+
+        :param compute_id_list: List of identifiers of the virtualised compute resources.
+        :return:                Ordered dictionary with the identifiers of the virtualised compute resources found as
+                                keys and the elements containing information about them as values.
+        """
+        return self.vim_adapter.query_virtualised_compute_resources(compute_id_list)
+
     @log_entry_exit(LOG)
     def trigger_compute_resource_terminate(self, compute_id):
         """
@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import errno
+import logging
+import os
+import select
+from threading import Lock, Thread
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+class Dispatcher(object):
+    """
+    Single thread that waits on the pipes of all the workers running an execution.
+
+    Every object received on a worker pipe is a (kind, object) tuple that is passed to the handler registered for the
+    pipe: handler(kind, obj). When the worker reports 'done', or when the pipe is closed because the worker process is
+    gone, the handler is called with kind 'done' and the pipe is unregistered.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.lock = Lock()
+        self.wake_up_reader, self.wake_up_writer = os.pipe()
+
+        self.thread = Thread(target=self._loop, name='execution-dispatcher')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def register(self, connection, handler):
+        """
+        This method starts routing the objects received on the connection to the handler.
+        """
+        with self.lock:
+            self.handlers[connection] = handler
+        self._wake_up()
+
+    def unregister(self, connection):
+        with self.lock:
+            self.handlers.pop(connection, None)
+
+    def _wake_up(self):
+        os.write(self.wake_up_writer, b'x')
+
+    def _loop(self):
+        while True:
+            with self.lock:
+                connections = list(self.handlers.keys())
+
+            try:
+                readable, _, _ = select.select([self.wake_up_reader] + connections, [], [])
+            except select.error as e:
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+
+            for connection in readable:
+                if connection == self.wake_up_reader:
+                    os.read(self.wake_up_reader, 4096)
+                    continue
+                try:
+                    self._receive(connection)
+                except Exception as e:
+                    LOG.exception(e)
+
+    def _receive(self, connection):
+        with self.lock:
+            handler = self.handlers.get(connection)
+        if handler is None:
+            return
+
+        try:
+            kind, obj = connection.recv()
+        except (EOFError, IOError):
+            kind, obj = 'done', None
+
+        if kind == 'done':
+            self.unregister(connection)
+        handler(kind, obj)
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import json
+from threading import Condition
+
+KEEPALIVE_INTERVAL = 15
+
+
+class EventBuffer(object):
+    """
+    Replay buffer holding all the step messages of an execution. Each message gets an ID equal to its position in the
+    buffer, so that a client can resume a stream from the last ID it has seen.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.closed = False
+        self.condition = Condition()
+
+    def append(self, event):
+        with self.condition:
+            self.events.append(event)
+            self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def wait(self, next_event_id, timeout):
+        """
+        This method waits until events with ID greater or equal to next_event_id are available, the buffer is closed or
+        the timeout expires.
+
+        :return:    Tuple containing the list of the new events and the closed flag.
+        """
+        with self.condition:
+            if len(self.events) <= next_event_id and not self.closed:
+                self.condition.wait(timeout)
+            return self.events[next_event_id:], self.closed
+
+
+def format_event(event_name, data, event_id=None):
+    """
+    This function serializes an event in the text/event-stream format.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append('id: %s' % event_id)
+    lines.append('event: %s' % event_name)
+    lines.append('data: %s' % json.dumps(data))
+    return '\n'.join(lines) + '\n\n'
+
+
+def stream_events(event_buffer, last_event_id=None):
+    """
+    This function is a generator producing the text/event-stream representation of the events in the buffer, starting
+    after last_event_id. It ends with a 'done' event once the buffer is closed.
+    """
+    if last_event_id is None:
+        next_event_id = 0
+    else:
+        next_event_id = last_event_id + 1
+
+    while True:
+        events, closed = event_buffer.wait(next_event_id, KEEPALIVE_INTERVAL)
+        for event in events:
+            yield format_event('step', event, event_id=next_event_id)
+            next_event_id += 1
+
+        if closed and not events:
+            yield format_event('done', {'status': 'DONE'})
+            return
+
+        if not events:
+            yield ': keepalive\n\n'
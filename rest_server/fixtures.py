@@ -0,0 +1,328 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import logging
+import time
+import uuid
+from threading import Condition, Thread
+
+from api.generic import constants, construct_generic
+
+DEFAULT_POOL_SIZE = 1
+DEFAULT_LEASE_TIMEOUT = constants.NS_INSTANTIATE_TIMEOUT
+
+# Store document recording the NS instances created by the pool, so that they can be terminated after a restart. Only
+# the fixture keys are recorded: the MANO credentials are resolved by MANO name when the instances are terminated.
+FIXTURES_DOCUMENT = 'fixtures'
+
+Fixture = collections.namedtuple('Fixture', 'key ns_instance_id mano_config created')
+Lease = collections.namedtuple('Lease', 'lease_id execution_id fixture leased')
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+class FixtureError(Exception):
+    pass
+
+
+class FixturePending(FixtureError):
+    """
+    The lease timed out while an NS instance was still being created for it.
+    """
+    pass
+
+
+def fixture_key(mano_config, nsd_id, flavour_id=None, ns_instantiation_level_id=None):
+    return mano_config.get('name'), nsd_id, flavour_id, ns_instantiation_level_id
+
+
+def _construct_mano(mano_config):
+    return construct_generic(vendor=mano_config['type'], module_type='mano',
+                             adapter_config=mano_config.get('adapter_config', {}),
+                             generic_config=mano_config.get('generic_config', {}))
+
+
+class FixturePool(object):
+    """
+    Pool of pre-instantiated NS instances shared by the test case executions.
+
+    The instances are kept per (MANO, NSD ID, flavour ID, NS instantiation level ID) key. A leased instance is verified
+    to be instantiated before being handed out and is replaced by a new one if it is not. After each lease the pool is
+    replenished in the background up to the size returned by get_size(), so that the next lease finds an instance ready.
+    The instances are always created on background threads, and recorded in the store until they are terminated.
+    get_mano_config(mano_name) returns the config of a MANO, so that the instances recorded by a previous run of the
+    server can be terminated.
+    """
+
+    def __init__(self, get_size, store=None, get_mano_config=None):
+        self.get_size = get_size
+        self.store = store
+        self.get_mano_config = get_mano_config
+        self.idle = collections.defaultdict(list)
+        self.creating = collections.Counter()
+        self.failures = collections.Counter()
+        self.errors = {}
+        self.mano_configs = {}
+        self.leases = {}
+        self.condition = Condition()
+
+    def lease(self, execution_id, mano_config, nsd_id, flavour_id=None, ns_instantiation_level_id=None,
+              timeout=DEFAULT_LEASE_TIMEOUT):
+        """
+        This method leases an instantiated NS, waiting up to timeout seconds for one to be created if the pool does not
+        hold one.
+
+        :return:    Lease named tuple.
+        :raises:    FixturePending if an NS instance is still being created when the timeout expires, FixtureError if
+                    the NS instance could not be created.
+        """
+        key = fixture_key(mano_config, nsd_id, flavour_id, ns_instantiation_level_id)
+        deadline = time.time() + timeout
+        with self.condition:
+            self.mano_configs[key] = mano_config
+
+        while True:
+            fixture = self._wait_idle(key, deadline)
+            if self._verify(fixture):
+                break
+            LOG.debug('NS instance %s of the fixture pool is not instantiated, replacing it' % fixture.ns_instance_id)
+            self._start_thread(self._destroy, fixture)
+
+        lease = Lease(lease_id=str(uuid.uuid4()), execution_id=execution_id, fixture=fixture, leased=time.time())
+        with self.condition:
+            self.leases[lease.lease_id] = lease
+        self.replenish(key)
+        return lease
+
+    def release(self, lease_id, reusable=True):
+        """
+        This method ends a lease. A reusable instance that is still instantiated goes back to the pool, any other
+        instance is terminated and replaced.
+        """
+        with self.condition:
+            lease = self.leases.pop(lease_id, None)
+        if lease is None:
+            raise KeyError(lease_id)
+        self._start_thread(self._return, lease.fixture, reusable)
+
+    def release_execution(self, execution_id):
+        """
+        This method ends the leases left by an execution. Their instances are not reused, since the execution did not
+        release them.
+        """
+        with self.condition:
+            lease_ids = [lease.lease_id for lease in self.leases.values() if lease.execution_id == execution_id]
+        for lease_id in lease_ids:
+            try:
+                self.release(lease_id, reusable=False)
+            except KeyError:
+                pass
+
+    def replenish(self, key):
+        """
+        This method starts creating instances for the key until the pool size is reached.
+        """
+        with self.condition:
+            missing = (self.get_size() or DEFAULT_POOL_SIZE) - len(self.idle[key]) - self.creating[key]
+            for _ in range(max(0, missing)):
+                self._start_creation(key)
+
+    def drain(self):
+        """
+        This method terminates all the idle instances.
+
+        :return:    Number of instances being terminated.
+        """
+        with self.condition:
+            fixtures = [fixture for key_fixtures in self.idle.values() for fixture in key_fixtures]
+            self.idle.clear()
+        for fixture in fixtures:
+            self._start_thread(self._destroy, fixture)
+        return len(fixtures)
+
+    def drain_stored(self):
+        """
+        This method terminates the instances recorded in the store by a previous run of the server. Their leases ended
+        with that run, so they are not put back in the pool. The instances whose MANO is no longer configured are left
+        in the store.
+
+        :return:    Number of instances being terminated.
+        """
+        if self.store is None or self.get_mano_config is None:
+            return 0
+        fixtures = []
+        for ns_instance_id, record in self.store.get_all(FIXTURES_DOCUMENT).items():
+            key = tuple(record['key'])
+            mano_config = self.get_mano_config(key[0])
+            if mano_config is None:
+                LOG.debug('Unable to terminate NS instance %s of the fixture pool - MANO %s is not configured'
+                          % (ns_instance_id, key[0]))
+                continue
+            fixtures.append(Fixture(key=key, ns_instance_id=ns_instance_id, mano_config=mano_config,
+                                    created=record['created']))
+        for fixture in fixtures:
+            self._start_thread(self._destroy, fixture)
+        return len(fixtures)
+
+    def state(self):
+        with self.condition:
+            pool_state = []
+            for key in sorted(set(self.idle.keys()) | set(self.creating.keys())):
+                mano_name, nsd_id, flavour_id, ns_instantiation_level_id = key
+                pool_state.append({
+                    'mano': mano_name,
+                    'nsd_id': nsd_id,
+                    'flavour_id': flavour_id,
+                    'ns_instantiation_level_id': ns_instantiation_level_id,
+                    'idle': [fixture.ns_instance_id for fixture in self.idle[key]],
+                    'creating': self.creating[key],
+                    'leased': [{'lease_id': lease.lease_id, 'execution_id': lease.execution_id,
+                                'ns_instance_id': lease.fixture.ns_instance_id} for lease in self.leases.values()
+                               if lease.fixture.key == key]
+                })
+            return pool_state
+
+    def _start_thread(self, target, *args):
+        thread = Thread(target=target, args=args, name='fixture-pool')
+        thread.daemon = True
+        thread.start()
+
+    def _start_creation(self, key):
+        """
+        This method starts creating an instance for the key. It must be called holding the condition, which makes the
+        instance count as being created before the thread starts.
+        """
+        self.creating[key] += 1
+        self._start_thread(self._create, key, self.mano_configs[key])
+
+    def _wait_idle(self, key, deadline):
+        """
+        This method takes an idle instance for the key, starting the creation of one whenever none is being created,
+        and waiting for it until the deadline.
+        """
+        nsd_id = key[1]
+        with self.condition:
+            failures = self.failures[key]
+            while not self.idle[key]:
+                if self.creating[key] == 0:
+                    if self.failures[key] != failures:
+                        raise FixtureError('Unable to create an NS instance of NSD %s - %s'
+                                           % (nsd_id, self.errors[key]))
+                    self._start_creation(key)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise FixturePending('Timed out waiting for an NS instance of NSD %s' % nsd_id)
+                self.condition.wait(remaining)
+            return self.idle[key].pop(0)
+
+    def _create(self, key, mano_config):
+        _, nsd_id, flavour_id, ns_instantiation_level_id = key
+        fixture = None
+        error = None
+        try:
+            mano = _construct_mano(mano_config)
+            ns_instance_id, operation_status = mano.ns_create_and_instantiate(
+                nsd_id=nsd_id, ns_name='fixture-%s' % str(uuid.uuid4())[:8], ns_description=None,
+                flavour_id=flavour_id, sap_data=mano_config.get('sap_data'),
+                additional_param_for_ns=mano_config.get('instantiation_params_for_ns'),
+                additional_param_for_vnf=mano_config.get('instantiation_params_for_vnf'),
+                ns_instantiation_level_id=ns_instantiation_level_id)
+            created_fixture = Fixture(key=key, ns_instance_id=ns_instance_id, mano_config=mano_config,
+                                      created=time.time())
+            self._remember(created_fixture)
+            if operation_status != constants.OPERATION_SUCCESS:
+                self._destroy(created_fixture)
+                raise FixtureError('NS instantiation operation failed for NSD %s' % nsd_id)
+            fixture = created_fixture
+        except Exception as e:
+            LOG.debug('Unable to add an NS instance of NSD %s to the fixture pool' % nsd_id)
+            LOG.exception(e)
+            error = e
+        finally:
+            with self.condition:
+                self.creating[key] -= 1
+                if self.creating[key] == 0:
+                    del self.creating[key]
+                if fixture is not None:
+                    self.idle[key].append(fixture)
+                else:
+                    self.failures[key] += 1
+                    self.errors[key] = str(error)
+                self.condition.notify_all()
+
+    def _remember(self, fixture):
+        if self.store is None:
+            return
+        try:
+            self.store.set(FIXTURES_DOCUMENT, fixture.ns_instance_id, {
+                'key': list(fixture.key),
+                'created': fixture.created
+            })
+        except Exception as e:
+            LOG.debug('Unable to record NS instance %s of the fixture pool' % fixture.ns_instance_id)
+            LOG.exception(e)
+
+    def _forget(self, fixture):
+        if self.store is None:
+            return
+        try:
+            self.store.delete(FIXTURES_DOCUMENT, fixture.ns_instance_id)
+        except Exception as e:
+            LOG.debug('Unable to remove the record of NS instance %s of the fixture pool' % fixture.ns_instance_id)
+            LOG.exception(e)
+
+    def _verify(self, fixture):
+        try:
+            mano = _construct_mano(fixture.mano_config)
+            ns_info = mano.ns_query(query_filter={'ns_instance_id': fixture.ns_instance_id,
+                                                  'additional_param': fixture.mano_config.get('query_params')})
+            return ns_info.ns_state == constants.NS_INSTANTIATED
+        except Exception as e:
+            LOG.exception(e)
+            return False
+
+    def _destroy(self, fixture):
+        try:
+            mano = _construct_mano(fixture.mano_config)
+            ns_info = mano.ns_query(query_filter={'ns_instance_id': fixture.ns_instance_id,
+                                                  'additional_param': fixture.mano_config.get('query_params')})
+            # The lessee may have terminated the instance already
+            if ns_info.ns_state == constants.NS_NOT_INSTANTIATED:
+                mano.ns_delete_id(fixture.ns_instance_id)
+            else:
+                mano.ns_terminate_and_delete(fixture.ns_instance_id,
+                                             additional_param=fixture.mano_config.get('termination_params'))
+        except Exception as e:
+            LOG.debug('Unable to terminate NS instance %s of the fixture pool' % fixture.ns_instance_id)
+            LOG.exception(e)
+        # The instance is forgotten even if it could not be terminated, as it may have been deleted by its lessee
+        self._forget(fixture)
+
+    def _return(self, fixture, reusable):
+        """
+        This method puts a released instance back in the pool, ahead of the idle instances, so that it is the next one
+        leased. The pool was replenished when the instance was leased, so the surplus idle instances are terminated.
+        """
+        if reusable and self._verify(fixture):
+            with self.condition:
+                idle = self.idle[fixture.key]
+                idle.insert(0, fixture)
+                surplus = idle[self.get_size() or DEFAULT_POOL_SIZE:]
+                del idle[len(idle) - len(surplus):]
+                self.condition.notify_all()
+            for surplus_fixture in surplus:
+                self._destroy(surplus_fixture)
+            return
+        self._destroy(fixture)
+        self.replenish(fixture.key)
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import json
+import logging
+import time
+from threading import Lock
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+# Maximum number of evicted executions whose JSON dump path is remembered. The older ones are only in the history.
+MAX_EVICTED_ENTRIES = 10000
+
+
+class RetentionPolicy(object):
+    """
+    Bounded retention for the bookkeeping of completed executions.
+
+    Completed executions are kept in least recently used order. When there are more than max_entries of them, or when
+    they completed more than max_age seconds ago, they are evicted from memory. The path of the JSON dump of each
+    evicted execution is remembered, up to MAX_EVICTED_ENTRIES of them, so that its result can still be loaded from
+    disk.
+    """
+
+    def __init__(self, evict_func, get_limits):
+        """
+        :param evict_func:  Callable that receives an execution ID and removes it from the in-memory bookkeeping.
+        :param get_limits:  Callable returning a (max_entries, max_age) tuple. A None value means the default.
+        """
+        self.evict_func = evict_func
+        self.get_limits = get_limits
+        self.completed_executions = collections.OrderedDict()
+        self.evicted_executions = collections.OrderedDict()
+        self.lock = Lock()
+
+    def completed(self, execution_id, json_file_path):
+        """
+        This method records the completion of an execution whose result is dumped at json_file_path.
+        """
+        with self.lock:
+            self.completed_executions[execution_id] = (time.time(), json_file_path)
+        self.prune()
+
+    def touch(self, execution_id):
+        """
+        This method marks the execution as the most recently used one.
+        """
+        with self.lock:
+            entry = self.completed_executions.pop(execution_id, None)
+            if entry is not None:
+                self.completed_executions[execution_id] = entry
+
+    def prune(self):
+        """
+        This method evicts the completed executions that exceed the configured limits.
+        """
+        max_entries, max_age = self.get_limits()
+        if max_entries is None:
+            max_entries = DEFAULT_MAX_ENTRIES
+        if max_age is None:
+            max_age = DEFAULT_MAX_AGE
+
+        expired = []
+        oldest_allowed = time.time() - max_age
+        with self.lock:
+            excess = len(self.completed_executions) - max_entries
+            for execution_id, (completion_time, json_file_path) in self.completed_executions.items():
+                if excess > 0 or completion_time < oldest_allowed:
+                    expired.append(execution_id)
+                    excess -= 1
+
+            for execution_id in expired:
+                _, json_file_path = self.completed_executions.pop(execution_id)
+                self.evicted_executions[execution_id] = json_file_path
+            while len(self.evicted_executions) > MAX_EVICTED_ENTRIES:
+                self.evicted_executions.popitem(last=False)
+
+        for execution_id in expired:
+            try:
+                self.evict_func(execution_id)
+            except Exception as e:
+                LOG.exception(e)
+
+    def is_evicted(self, execution_id):
+        with self.lock:
+            return execution_id in self.evicted_executions
+
+    def load(self, execution_id):
+        """
+        This method returns the JSON dump of an evicted execution, or None if it cannot be read.
+        """
+        with self.lock:
+            json_file_path = self.evicted_executions.get(execution_id)
+        if json_file_path is None:
+            return None
+
+        try:
+            with open(json_file_path, 'r') as json_file:
+                return json.load(json_file)
+        except (IOError, ValueError) as e:
+            LOG.debug('Unable to load the result of execution %s from %s: %s' % (execution_id, json_file_path, e))
+            return None
@@ -0,0 +1,164 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import itertools
+import logging
+from threading import RLock
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+QueuedExecution = collections.namedtuple('QueuedExecution', 'priority sequence execution_id resources start_func')
+
+
+class Scheduler(object):
+    """
+    Admission control for test case executions.
+
+    Each execution holds a list of resources, given as (resource type, resource name) tuples, for example
+    ('env', 'lab1') or ('mano', 'tacker1'). An execution is started only when, for each of its resources, the number of
+    running executions holding that resource is below the limit configured for the resource type. Executions waiting
+    for admission are kept in priority order (higher priority first) and in FIFO order for equal priorities.
+
+    A limit can also be set for a single resource, for example ('suite', <suite ID>), and takes precedence over the
+    limit of its resource type.
+    """
+
+    def __init__(self, get_limits, start_failed=None):
+        """
+        :param get_limits:      Callable returning a dictionary with the resource types as keys and the maximum number
+                                of concurrent executions per resource of that type as values. Resource types that are
+                                missing from the dictionary are not limited.
+        :param start_failed:    Callable receiving the ID of an admitted execution whose start function raised an
+                                exception, and the exception. The resources of the execution are released before.
+        """
+        self.get_limits = get_limits
+        self.start_failed = start_failed
+        self.queue = []
+        self.running = {}
+        self.usage = collections.defaultdict(int)
+        self.resource_limits = {}
+        self.sequence = itertools.count()
+        self.lock = RLock()
+
+    def submit(self, execution_id, resources, start_func, priority=0):
+        """
+        This method queues the execution and starts it right away if the limits allow it.
+
+        :param execution_id:    ID of the execution.
+        :param resources:       List of (resource type, resource name) tuples used by the execution.
+        :param start_func:      Callable, without arguments, that starts the execution.
+        :param priority:        Executions with higher priority are admitted first.
+        """
+        with self.lock:
+            self.queue.append(QueuedExecution(priority=-priority, sequence=next(self.sequence),
+                                              execution_id=execution_id, resources=list(resources),
+                                              start_func=start_func))
+            self.queue.sort()
+        self.dispatch()
+
+    def set_resource_limit(self, resource, limit):
+        """
+        This method sets the maximum number of concurrent executions holding the specified resource.
+        """
+        with self.lock:
+            self.resource_limits[resource] = limit
+
+    def clear_resource_limit(self, resource):
+        with self.lock:
+            self.resource_limits.pop(resource, None)
+
+    def release(self, execution_id):
+        """
+        This method releases the resources held by a finished execution and admits the waiting ones.
+        """
+        with self.lock:
+            freed = self._free(execution_id)
+        if freed:
+            self.dispatch()
+
+    def cancel(self, execution_id):
+        """
+        This method removes a waiting execution from the queue.
+
+        :return:    True if the execution was waiting and has been removed, False otherwise.
+        """
+        with self.lock:
+            for queued_execution in self.queue:
+                if queued_execution.execution_id == execution_id:
+                    self.queue.remove(queued_execution)
+                    return True
+            return False
+
+    def position(self, execution_id):
+        """
+        This method returns the position (starting from 1) of the execution in the queue, or None if the execution is
+        not waiting.
+        """
+        with self.lock:
+            for position, queued_execution in enumerate(self.queue, 1):
+                if queued_execution.execution_id == execution_id:
+                    return position
+            return None
+
+    def queued(self):
+        """
+        This method returns the IDs of the waiting executions, in admission order.
+        """
+        with self.lock:
+            return [queued_execution.execution_id for queued_execution in self.queue]
+
+    def _free(self, execution_id):
+        resources = self.running.pop(execution_id, None)
+        if resources is None:
+            return False
+        for resource in resources:
+            self.usage[resource] -= 1
+            if self.usage[resource] <= 0:
+                del self.usage[resource]
+        return True
+
+    def _admissible(self, resources, limits):
+        for resource in resources:
+            limit = self.resource_limits.get(resource, limits.get(resource[0]))
+            if limit is not None and self.usage.get(resource, 0) >= limit:
+                return False
+        return True
+
+    def dispatch(self):
+        """
+        This method starts all the waiting executions that fit in the limits, in queue order. An execution that does
+        not fit does not block the ones behind it that use other resources. The executions are admitted under the lock
+        and started after releasing it, since starting an execution may fork a worker process.
+        """
+        admitted = []
+        with self.lock:
+            limits = self.get_limits() or {}
+            for queued_execution in list(self.queue):
+                if not self._admissible(queued_execution.resources, limits):
+                    continue
+
+                self.queue.remove(queued_execution)
+                self.running[queued_execution.execution_id] = queued_execution.resources
+                for resource in queued_execution.resources:
+                    self.usage[resource] += 1
+                admitted.append(queued_execution)
+
+        for queued_execution in admitted:
+            try:
+                queued_execution.start_func()
+            except Exception as e:
+                LOG.exception(e)
+                self.release(queued_execution.execution_id)
+                if self.start_failed is not None:
+                    self.start_failed(queued_execution.execution_id, e)
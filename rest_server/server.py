@@ -10,101 +10,112 @@
 #
 
 
-import json
+import gzip
 import logging
+import mimetypes
 import os
+import shutil
+import time
 import uuid
+from functools import partial
 from datetime import datetime
-from glob import glob
-from multiprocessing import Process, Queue, Event
-from threading import Lock, Thread
+from io import BytesIO
+from threading import Event, Lock, Thread
 from Queue import Queue as InternalQueue
 
-from bottle import route, request, response, run, static_file
-
-from api.adapter import construct_adapter
-from utils import reporting, logging_module
+from bottle import HTTPResponse, route, request, response, run, static_file
+
+from api.adapter import construct_adapter, replay
+from api.generic import constants
+from rest_server.dispatcher import Dispatcher
+from rest_server.events import EventBuffer, stream_events
+from rest_server.fixtures import DEFAULT_LEASE_TIMEOUT, FixtureError, FixturePending, FixturePool
+from rest_server.retention import RetentionPolicy
+from rest_server.scheduler import Scheduler
+from rest_server.store import JsonFileStore
+from rest_server.suites import DEFAULT_PARALLELISM, Suite, select_tcs
+from rest_server.workers import DEFAULT_POOL_SIZE, WorkerPool, reset_logging
+from utils import history, reporting, logging_module, profiling
 from utils.constructors.mapping import get_constructor_mapping, get_tc_constructor_class
+from utils.metrics import REGISTRY
 from utils.misc import generate_timestamp
 
-result_queues = {}
-message_queues = {}
 step_queues = {}
+step_events = {}
 step_triggers = {}
 execution_processes = {}
+execution_events = {}
+execution_reports = {}
 tc_results = {}
 tc_inputs = {}
+suites = {}
+execution_suites = {}
 
 json_file_path = '/etc/vnflcv'
-config_file_name = 'config.json'
+config_document = 'config'
 reports_dir = '/var/log/vnflcv'
 
+# Interval of time in seconds between the passes that remove the reports deleted from disk from the report catalogue
+REPORT_CATALOGUE_INTERVAL = 300
+
+store = JsonFileStore(json_file_path)
+
+timeout_timers = ['VNF_INSTANTIATE_TIMEOUT', 'VNF_SCALE_TIMEOUT', 'VNF_STOP_TIMEOUT', 'VNF_START_TIMEOUT',
+                  'VNF_TERMINATE_TIMEOUT', 'VNF_STABLE_STATE_TIMEOUT', 'NS_INSTANTIATE_TIMEOUT', 'NS_SCALE_TIMEOUT',
+                  'NS_UPDATE_TIMEOUT', 'NS_TERMINATE_TIMEOUT', 'NS_STABLE_STATE_TIMEOUT', 'POLL_INTERVAL']
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
 lock_types = ['vim', 'mano', 'em', 'vnf', 'traffic', 'env', 'config']
 lock = {}
 for lock_type in lock_types:
     lock[lock_type] = Lock()
 
 
-def _read_config(key):
+class ExecRequestError(Exception):
     """
-    This function returns the content of the JSON config file.
+    A problem occurred while preparing the execution of a test case.
     """
-    config_file_path = os.path.join(json_file_path, config_file_name)
-    try:
-        with open(config_file_path, 'r') as config_file:
-            config = json.load(config_file)
-    except Exception:
-        config = {}
 
-    return config.get(key)
+    def __init__(self, status, response_body):
+        super(ExecRequestError, self).__init__(response_body)
+        self.status = status
+        self.response_body = response_body
 
 
-def _write_config(key, value):
+def _read_config(key):
     """
-    This function adds the specified key and value to the JSON config file.
+    This function returns the value corresponding to the specified key in the JSON config file.
     """
-    config_file_path = os.path.join(json_file_path, config_file_name)
-    try:
-        with open(config_file_path, 'r') as config_file:
-            config = json.load(config_file)
-    except Exception:
-        config = {}
+    return store.get(config_document, key)
 
-    config[key] = value
 
-    with open(config_file_path, 'w') as config_file:
-        json.dump(config, config_file, sort_keys=True, indent=2)
+def _write_config(key, value):
+    """
+    This function adds the specified key and value to the JSON config file.
+    """
+    store.set(config_document, key, value)
 
 
 def _delete_config(key):
     """
     This function deletes the specified key from the JSON config file.
     """
-    config_file_path = os.path.join(json_file_path, config_file_name)
-    try:
-        with open(config_file_path, 'r') as config_file:
-            config = json.load(config_file)
-    except Exception:
-        config = {}
-
-    config.pop(key, None)
-
-    with open(config_file_path, 'w') as config_file:
-        json.dump(config, config_file, sort_keys=True, indent=2)
+    store.delete(config_document, key)
 
 
-def execute_test(tc_exec_request, tc_input, result_queue, message_queue, step_trigger):
+def execute_test(execution_id, tc_exec_request, tc_input, report_name, result_queue, message_queue, step_trigger):
     """
     This function is used as a process target and it starts the execution of a test case.
     """
     tc_name = tc_exec_request['tc_name']
     tc_class = get_tc_constructor_class(tc_name)
 
-    timestamp = generate_timestamp()
-    log_file_name = '%s_%s.log' % (timestamp, str(tc_name))
-    report_file_name = '%s_%s.txt' % (timestamp, str(tc_name))
-    html_report_file_name = '%s_%s.html' % (timestamp, str(tc_name))
-    json_file_name = '%s_%s.json' % (timestamp, str(tc_name))
+    log_file_name = '%s.log' % report_name
+    report_file_name = '%s.txt' % report_name
+    html_report_file_name = '%s.html' % report_name
+    json_file_name = '%s.json' % report_name
 
     root_logger = logging.getLogger()
     logging_module.configure_logger(root_logger, file_level='DEBUG', log_filename=log_file_name)
@@ -113,13 +124,33 @@ def execute_test(tc_exec_request, tc_input, result_queue, message_queue, step_tr
     tc_instance = tc_class(tc_input)
     tc_instance.message_queue = message_queue
     tc_instance.step_trigger = step_trigger
+    tc_instance.execution_id = execution_id
+    if _read_config('profiling'):
+        tc_instance.profiler = profiling.Profiler(report_name, top_n=_read_config('profiling_top_n') or
+                                                  profiling.DEFAULT_TOP_N)
+    cassette = None
+    if _read_config('record_cassettes'):
+        cassette = replay.Cassette()
+        replay.activate(cassette)
     tc_result = tc_instance.execute()
     tc_end_time = datetime.utcnow()
 
+    if cassette is not None:
+        replay.deactivate()
+        try:
+            cassette.save(os.path.join(reports_dir, '%s.cassette' % report_name))
+        except Exception as e:
+            LOG.debug('Unable to save the cassette of execution %s' % execution_id)
+            LOG.exception(e)
+
     tc_result['tc_start_time'] = tc_start_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
     tc_result['tc_end_time'] = tc_end_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
     tc_result['tc_duration'] = str(tc_end_time - tc_start_time)
 
+    REGISTRY.inc('vnflcv_executions_total', tc_name=tc_name, status=tc_result['overall_status'])
+    REGISTRY.observe('vnflcv_execution_duration_seconds', (tc_end_time - tc_start_time).total_seconds(),
+                     tc_name=tc_name)
+
     result_queue.put(tc_result)
 
     kibana_srv = _read_config('kibana-srv')
@@ -129,39 +160,161 @@ def execute_test(tc_exec_request, tc_input, result_queue, message_queue, step_tr
     reporting.report_test_case(report_file_name, tc_exec_request, tc_input, tc_result)
     reporting.html_report_test_case(html_report_file_name, tc_exec_request, tc_input, tc_result)
     reporting.dump_raw_json(json_file_name, tc_exec_request, tc_input, tc_result)
+    history.record_execution(execution_id, report_name, tc_exec_request, tc_input, tc_result)
 
+    # The log file is closed before the reports are catalogued, so that its final size is recorded
+    reset_logging()
+    history.record_reports(reports_dir, report_name, tc_name, tc_result)
 
-def process_reaper(execution_id):
-    execution_process = execution_processes.get(execution_id)
-    if execution_process is None:
-        return
 
-    execution_process.join()
+def handle_worker_message(execution_id, worker, kind, obj):
+    """
+    This function is called by the dispatcher for every object the worker running the execution sends to the server.
+    """
+    if kind == 'message':
+        step_queues[execution_id].put(obj)
+        step_events[execution_id].append(obj)
+    elif kind == 'result':
+        tc_results[execution_id] = obj
+    elif kind == 'metrics':
+        REGISTRY.merge(*obj)
+    elif kind == 'done':
+        finish_execution(execution_id, worker)
+
+
+def finish_execution(execution_id, worker):
+    """
+    This function updates the bookkeeping of a finished execution and puts the worker back in the pool.
+    """
     execution_processes[execution_id] = None
-    message_queue = message_queues[execution_id]
-    message_queue.put(None)
+    step_triggers[execution_id] = None
+    step_queues[execution_id].put(None)
+    step_events[execution_id].close()
 
-    result_queue = result_queues[execution_id]
-    if not result_queue.empty():
-        tc_result = result_queue.get_nowait()
-        tc_results[execution_id] = tc_result
-    result_queues[execution_id] = None
+    worker_pool.release(worker)
+    execution_events[execution_id].set()
+    scheduler.release(execution_id)
+    retention.completed(execution_id, _get_json_report_path(execution_id))
+    fixture_pool.release_execution(execution_id)
+    _complete_suite_execution(execution_id)
 
+
+def fail_execution(execution_id, error):
+    """
+    This function is called by the scheduler when an admitted execution could not be started. The execution is
+    recorded as finished with an error, so that its status can be queried and the clients waiting for it return.
+    """
+    worker = execution_processes.get(execution_id)
+    if worker is not None:
+        dispatcher.unregister(worker.connection)
+        worker_pool.release(worker)
+
+    tc_results[execution_id] = {
+        'overall_status': constants.TEST_ERROR,
+        'error_info': 'Unable to start the execution - %s: %s' % (type(error).__name__, error)
+    }
+    execution_processes[execution_id] = None
     step_triggers[execution_id] = None
+    step_queues[execution_id].put(None)
+    step_events[execution_id].close()
 
+    execution_events[execution_id].set()
+    retention.completed(execution_id, _get_json_report_path(execution_id))
+    fixture_pool.release_execution(execution_id)
+    _complete_suite_execution(execution_id)
 
-def step_consumer(execution_id):
-    message_queue = message_queues[execution_id]
-    step_queue = step_queues[execution_id]
 
-    while True:
-        msg = message_queue.get()
-        step_queue.put(msg)
+def _complete_suite_execution(execution_id):
+    """
+    This function records the completion of the execution in the suite it belongs to, if any.
+    """
+    suite = suites.get(execution_suites.get(execution_id))
+    if suite is not None and suite.completed(execution_id):
+        scheduler.clear_resource_limit(('suite', suite.suite_id))
+
+
+def start_execution(execution_id, tc_exec_request, tc_input, debug):
+    """
+    This function is called by the scheduler when the execution is admitted and hands it to a worker process.
+    """
+    report_name = '%s_%s' % (generate_timestamp(), str(tc_exec_request['tc_name']))
+    execution_reports[execution_id] = report_name
+
+    # The worker reads the config from disk, so the pending writes must be flushed before it is forked or dispatched
+    try:
+        store.flush()
+    except Exception as e:
+        LOG.exception(e)
+    worker = worker_pool.acquire()
+    execution_processes[execution_id] = worker
+    step_triggers[execution_id] = worker.step_trigger if debug else None
+
+    dispatcher.register(worker.connection, partial(handle_worker_message, execution_id, worker))
+    worker.submit(debug, execution_id, tc_exec_request, tc_input, report_name)
+
+
+def _get_json_report_path(execution_id):
+    """
+    This function returns the path of the JSON dump of the execution, or None if the execution was never started.
+    """
+    report_name = execution_reports.get(execution_id)
+    if report_name is None:
+        return None
+
+    return os.path.join(reports_dir, '%s.json' % report_name)
+
+
+def evict_execution(execution_id):
+    """
+    This function removes a completed execution from memory. If the worker did not get to dump the JSON report, the
+    data known to the server is dumped instead, so that it can still be loaded later.
+    """
+    json_file_path = _get_json_report_path(execution_id)
+    if json_file_path is not None and not os.path.isfile(json_file_path):
+        reporting.dump_raw_json(os.path.basename(json_file_path), {'execution_id': execution_id},
+                                tc_inputs.get(execution_id), tc_results.get(execution_id))
+
+    suite_id = execution_suites.get(execution_id)
+    for bookkeeping_dict in [tc_results, tc_inputs, execution_processes, execution_events, execution_reports,
+                             step_queues, step_events, step_triggers, execution_suites]:
+        bookkeeping_dict.pop(execution_id, None)
+
+    # The suite is forgotten with the last of its executions
+    suite = suites.get(suite_id)
+    if suite is not None and not any(suite_execution_id in execution_suites
+                                     for suite_execution_id in suite.executions):
+        suites.pop(suite_id, None)
+
+
+def _get_retention_limits():
+    """
+    This function returns the maximum number of completed executions kept in memory and the maximum time, in seconds,
+    they are kept for.
+    """
+    return _read_config('retention_max_entries'), _read_config('retention_max_age')
+
+
+def _get_concurrency_limits():
+    """
+    This function returns the maximum number of concurrent executions for each resource type.
+    Example: {"env": 2, "mano": 4, "vim": 4, "traffic": 1}
+    """
+    return _read_config('concurrency_limits')
+
 
-        if msg is None:
-            break
+def _execution_resources(tc_input, env_name):
+    """
+    This function returns the list of (resource type, resource name) tuples the scheduler accounts the execution for.
+    """
+    resources = []
+    if env_name is not None:
+        resources.append(('env', env_name))
+    for resource_type in ['mano', 'vim', 'traffic']:
+        resource_name = tc_input.get(resource_type, {}).get('name')
+        if resource_name is not None:
+            resources.append((resource_type, resource_name))
 
-    message_queues[execution_id] = None
+    return resources
 
 
 @route('/version')
@@ -172,29 +325,23 @@ def get_version():
     return {'versions': ['v1.0']}
 
 
-@route('/v1.0/exec', method='POST')
-def do_exec():
+def _build_tc_input(tc_exec_request):
     """
-    Request mapped function that starts the execution of a test case in a new process.
+    This function returns the test case input for the execution request and the name of the environment it was built
+    from. If the request does not contain the test case input, it is built from the active environment.
     """
-    tc_exec_request = request.json
-    timeout_timers = ['VNF_INSTANTIATE_TIMEOUT', 'VNF_SCALE_TIMEOUT', 'VNF_STOP_TIMEOUT', 'VNF_START_TIMEOUT',
-                      'VNF_TERMINATE_TIMEOUT', 'VNF_STABLE_STATE_TIMEOUT', 'NS_INSTANTIATE_TIMEOUT', 'NS_SCALE_TIMEOUT',
-                      'NS_UPDATE_TIMEOUT', 'NS_TERMINATE_TIMEOUT', 'NS_STABLE_STATE_TIMEOUT', 'POLL_INTERVAL']
-
     tc_name = tc_exec_request.get('tc_name')
     try:
         get_tc_constructor_class(tc_name)
     except KeyError:
-        response.status = 404
-        return {'error': 'Test case %s not found' % tc_name}
+        raise ExecRequestError(404, {'error': 'Test case %s not found' % tc_name})
 
+    active_env = None
     tc_input = tc_exec_request.get('tc_input')
     if tc_input is None:
         active_env = _read_config('active-env')
         if active_env is None:
-            response.status = 400
-            return {'error': 'Active environment not set'}
+            raise ExecRequestError(400, {'error': 'Active environment not set'})
 
         tc_input = {}
         for resource_type, resource_name in _read_resource('env', active_env).items():
@@ -237,8 +384,7 @@ def do_exec():
                             tc_input['nsd_params']['vendor_nsd'] = nsd_file.read()
                             tc_input['nsd_params'].pop('vendor_nsd_file')
                     except Exception as e:
-                        response.status = 504
-                        return {'Error': '%s' % e}
+                        raise ExecRequestError(504, {'Error': '%s' % e})
                 tc_input[resource_type]['generic_config'] = {}
                 for timeout_timer in timeout_timers:
                     timeout = _read_config(timeout_timer)
@@ -246,6 +392,8 @@ def do_exec():
                         tc_input[resource_type]['generic_config'][timeout_timer] = timeout
 
         tc_input['scaling_policy_name'] = _read_config('scaling_policy_name')
+        tc_input['fixture_server_url'] = _read_config('fixture_server_url')
+        tc_input['use_fixture_pool'] = _read_config('use_fixture_pool')
         tc_input['scaling_policy_list'] = _read_config('scaling_policy_list')
         if tc_input['operate_vnf_data'] is None:
             tc_input['operate_vnf_data'] = _read_config('operate_vnf_data')
@@ -255,32 +403,50 @@ def do_exec():
             tc_input['vnf'] = {
                 'instance_name': tc_exec_request['tc_name']
             }
-    execution_id = str(uuid.uuid4())
-    result_queue = Queue()
-    message_queue = Queue()
-    step_queue = InternalQueue()
-    if _read_config('debug') is True:
-        step_trigger = Event()
-    else:
-        step_trigger = None
-    execution_process = Process(target=execute_test,
-                                args=(tc_exec_request, tc_input, result_queue, message_queue, step_trigger))
-    execution_process.start()
+
+    return tc_input, active_env
+
+
+def _submit_execution(tc_exec_request, tc_input, active_env, execution_id=None, extra_resources=()):
+    """
+    This function registers a new execution and hands it to the scheduler.
+
+    :param execution_id:    ID of the execution. A new one is generated if not specified.
+    :param extra_resources: Resources the execution holds besides the ones in its environment.
+    :return:                The execution ID.
+    """
+    if execution_id is None:
+        execution_id = str(uuid.uuid4())
+    debug = _read_config('debug') is True
 
     tc_inputs[execution_id] = tc_input
     tc_results[execution_id] = {}
+    execution_events[execution_id] = Event()
+    step_queues[execution_id] = InternalQueue()
+    step_events[execution_id] = EventBuffer()
+    step_triggers[execution_id] = None
 
-    execution_processes[execution_id] = execution_process
-    result_queues[execution_id] = result_queue
-    message_queues[execution_id] = message_queue
-    step_queues[execution_id] = step_queue
-    step_triggers[execution_id] = step_trigger
+    scheduler.submit(execution_id, _execution_resources(tc_input, active_env) + list(extra_resources),
+                     partial(start_execution, execution_id, tc_exec_request, tc_input, debug),
+                     priority=tc_exec_request.get('priority', 0))
 
-    process_reaper_thread = Thread(target=process_reaper, args=(execution_id,))
-    process_reaper_thread.start()
+    return execution_id
 
-    step_consumer_thread = Thread(target=step_consumer, args=(execution_id,))
-    step_consumer_thread.start()
+
+@route('/v1.0/exec', method='POST')
+def do_exec():
+    """
+    Request mapped function that queues the execution of a test case. The execution is started in a worker process as
+    soon as the concurrency limits of the resources it uses allow it.
+    """
+    tc_exec_request = request.json
+    try:
+        tc_input, active_env = _build_tc_input(tc_exec_request)
+    except ExecRequestError as e:
+        response.status = e.status
+        return e.response_body
+
+    execution_id = _submit_execution(tc_exec_request, tc_input, active_env)
 
     return {'execution_id': execution_id}
 
@@ -290,18 +456,37 @@ def get_status(execution_id):
     """
     Request mapped function that returns the status of the specified test execution ID.
     """
-    try:
-        execution_process = execution_processes[execution_id]
-    except KeyError:
+    position = scheduler.position(execution_id)
+    if position is not None:
+        return {
+            'status': 'QUEUED',
+            'position': position,
+            'tc_input': tc_inputs[execution_id]
+        }
+
+    if retention.is_evicted(execution_id):
+        raw_json = retention.load(execution_id)
+        if raw_json is None:
+            response.status = 404
+            return {'status': 'NOT_FOUND'}
+        return {
+            'status': 'DONE',
+            'tc_result': raw_json['tc_result'],
+            'tc_input': raw_json['tc_input']
+        }
+
+    if execution_id not in tc_inputs:
         response.status = 404
         return {'status': 'NOT_FOUND'}
 
-    if execution_process is not None:
+    # An execution that was admitted but whose worker is not assigned yet is reported as pending
+    if execution_processes.get(execution_id, True) is not None:
         return {
             'status': 'PENDING',
             'tc_input': tc_inputs[execution_id]
         }
     else:
+        retention.touch(execution_id)
         return {
             'status': 'DONE',
             'tc_result': tc_results[execution_id],
@@ -314,7 +499,21 @@ def do_stop_exec(execution_id):
     """
     Request mapped function that stops the test execution with the specified ID.
     """
-    execution_process = execution_processes[execution_id]
+    if scheduler.cancel(execution_id):
+        execution_processes[execution_id] = None
+        step_queues[execution_id].put(None)
+        step_events[execution_id].close()
+        execution_events[execution_id].set()
+        retention.completed(execution_id, None)
+        _complete_suite_execution(execution_id)
+        response.status = 200
+        return {}
+
+    if execution_id not in tc_inputs:
+        response.status = 404
+        return {'status': 'NOT_FOUND'}
+
+    execution_process = execution_processes.get(execution_id)
     if execution_process is not None:
         execution_process.terminate()
     response.status = 200
@@ -326,7 +525,15 @@ def all_status():
     """
     Request mapped function that returns the status of all test execution IDs.
     """
+    retention.prune()
+
     status_list = []
+    for execution_id in scheduler.queued():
+        status_list.append({
+            'execution_id': execution_id,
+            'status': 'QUEUED'
+        })
+
     for execution_id, execution_process in execution_processes.items():
         execution_status = {
             'execution_id': execution_id
@@ -341,6 +548,67 @@ def all_status():
     return {'status_list': status_list}
 
 
+@route('/v1.0/exec/<execution_id>/events')
+def get_events(execution_id):
+    """
+    Request mapped function that streams the step transitions of the specified test execution ID as server-sent events.
+    A client can resume the stream by sending the ID of the last event it received in the Last-Event-ID header.
+    """
+    if retention.is_evicted(execution_id):
+        event_buffer = EventBuffer()
+        event_buffer.close()
+    else:
+        try:
+            event_buffer = step_events[execution_id]
+        except KeyError:
+            response.status = 404
+            return {'error': 'NOT_FOUND'}
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.query.last_event_id
+    try:
+        last_event_id = int(last_event_id)
+    except ValueError:
+        last_event_id = None
+
+    response.content_type = 'text/event-stream'
+    response.set_header('Cache-Control', 'no-cache')
+    return stream_events(event_buffer, last_event_id)
+
+
+@route('/v1.0/exec/<execution_id>/position')
+def get_queue_position(execution_id):
+    """
+    Request mapped function that returns the position of the specified test execution ID in the execution queue.
+    """
+    position = scheduler.position(execution_id)
+    if position is not None:
+        return {
+            'status': 'QUEUED',
+            'position': position,
+            'queue_length': len(scheduler.queued())
+        }
+
+    if execution_id not in tc_inputs:
+        response.status = 404
+        return {'status': 'NOT_FOUND'}
+
+    return {'status': 'PENDING' if execution_processes.get(execution_id, True) is not None else 'DONE'}
+
+
+@route('/metrics')
+def get_metrics():
+    """
+    Request mapped function that returns the execution server metrics in the Prometheus text exposition format.
+    """
+    running_executions = len([worker for worker in execution_processes.values() if worker is not None])
+    REGISTRY.set('vnflcv_queued_executions', len(scheduler.queued()))
+    REGISTRY.set('vnflcv_running_executions', running_executions)
+    REGISTRY.set('vnflcv_live_workers', running_executions + worker_pool.idle_count())
+
+    response.content_type = 'text/plain; version=0.0.4'
+    return REGISTRY.render()
+
+
 @route('/v1.0/tcs')
 def get_tcs():
     """
@@ -356,19 +624,251 @@ def get_tcs():
     return tc_list
 
 
+def _get_execution_result(execution_id):
+    """
+    This function returns the status of the specified execution and its result, or None if the execution is not done.
+    """
+    if scheduler.position(execution_id) is not None:
+        return 'QUEUED', None
+
+    if retention.is_evicted(execution_id):
+        raw_json = retention.load(execution_id)
+        if raw_json is None:
+            return 'NOT_FOUND', None
+        return 'DONE', raw_json['tc_result']
+
+    if execution_id not in tc_inputs:
+        return 'NOT_FOUND', None
+
+    if execution_processes.get(execution_id, True) is not None:
+        return 'PENDING', None
+
+    return 'DONE', tc_results.get(execution_id, {})
+
+
+@route('/v1.0/suites', method='POST')
+def do_exec_suite():
+    """
+    Request mapped function that queues the execution of a suite of test cases. The test cases are selected by name
+    ("tc_names") or by glob patterns over the names and paths returned by /v1.0/tcs ("tc_globs"). At most "parallelism"
+    test cases of the suite run at the same time.
+    Example: {"tc_globs": ["tst_007/ns/inst/*"], "run_id": "42", "suite_name": "nslcm", "parallelism": 4}
+    """
+    tc_suite_request = request.json
+    if tc_suite_request.get('run_id') is None:
+        response.status = 400
+        return {'error': 'Missing run_id'}
+
+    tc_names = select_tcs(get_tcs(), tc_suite_request.get('tc_names'), tc_suite_request.get('tc_globs'))
+    if len(tc_names) == 0:
+        response.status = 400
+        return {'error': 'No test cases selected'}
+
+    suite_id = str(uuid.uuid4())
+    suite_name = tc_suite_request.get('suite_name', suite_id)
+    tc_exec_requests = []
+    for tc_name in tc_names:
+        tc_exec_request = {
+            'tc_name': tc_name,
+            'run_id': tc_suite_request['run_id'],
+            'suite_name': suite_name,
+            'priority': tc_suite_request.get('priority', 0)
+        }
+        try:
+            tc_input, active_env = _build_tc_input(tc_exec_request)
+        except ExecRequestError as e:
+            response.status = e.status
+            return e.response_body
+        tc_exec_requests.append((str(uuid.uuid4()), tc_exec_request, tc_input, active_env))
+
+    suite = Suite(suite_id, suite_name, tc_suite_request['run_id'],
+                  tc_suite_request.get('parallelism', DEFAULT_PARALLELISM))
+    suites[suite_id] = suite
+    scheduler.set_resource_limit(('suite', suite_id), suite.parallelism)
+    for execution_id, tc_exec_request, _, _ in tc_exec_requests:
+        suite.add(execution_id, tc_exec_request['tc_name'])
+        execution_suites[execution_id] = suite_id
+
+    for execution_id, tc_exec_request, tc_input, active_env in tc_exec_requests:
+        _submit_execution(tc_exec_request, tc_input, active_env, execution_id=execution_id,
+                          extra_resources=[('suite', suite_id)])
+
+    return {
+        'suite_id': suite_id,
+        'executions': [{'tc_name': tc_name, 'execution_id': execution_id}
+                       for execution_id, tc_name in suite.executions.items()]
+    }
+
+
+@route('/v1.0/suites/<suite_id>')
+def get_suite_status(suite_id):
+    """
+    Request mapped function that returns the aggregate status of the specified suite and the results of its test cases.
+    """
+    try:
+        suite = suites[suite_id]
+    except KeyError:
+        response.status = 404
+        return {'status': 'NOT_FOUND'}
+
+    executions = []
+    overall_statuses = {}
+    done = True
+    for execution_id, tc_name in suite.executions.items():
+        execution_status, tc_result = _get_execution_result(execution_id)
+        execution_summary = {
+            'execution_id': execution_id,
+            'tc_name': tc_name,
+            'status': execution_status
+        }
+        if tc_result is not None:
+            overall_status = tc_result.get('overall_status', 'N/A')
+            execution_summary['overall_status'] = overall_status
+            execution_summary['error_info'] = tc_result.get('error_info')
+            execution_summary['tc_duration'] = tc_result.get('tc_duration')
+            overall_statuses[overall_status] = overall_statuses.get(overall_status, 0) + 1
+        else:
+            done = False
+        executions.append(execution_summary)
+
+    return {
+        'suite_id': suite_id,
+        'suite_name': suite.suite_name,
+        'run_id': suite.run_id,
+        'parallelism': suite.parallelism,
+        'status': 'DONE' if done else 'PENDING',
+        'duration': suite.duration,
+        'overall_statuses': overall_statuses,
+        'executions': executions
+    }
+
+
+@route('/v1.0/suites')
+def all_suites():
+    """
+    Request mapped function that returns the IDs and names of all the suites.
+    """
+    return {'suite_list': [{'suite_id': suite_id, 'suite_name': suite.suite_name, 'run_id': suite.run_id}
+                           for suite_id, suite in suites.items()]}
+
+
+@route('/v1.0/fixtures/leases', method='POST')
+def lease_fixture():
+    """
+    Request mapped function that leases an instantiated NS from the fixture pool. The NS is verified to be instantiated
+    or re-created if it is not. The pool is replenished in the background. If no NS is ready before the timeout, the
+    response status is 202 while an NS is still being created, so that the lease can be requested again, and 503 if the
+    NS could not be created.
+    Example: {"execution_id": "...", "mano": {...}, "nsd_id": "...", "flavour_id": "...",
+              "ns_instantiation_level_id": "..."}
+    """
+    lease_request = request.json
+    if lease_request.get('mano') is None or lease_request.get('nsd_id') is None:
+        response.status = 400
+        return {'error': 'Missing mano or nsd_id'}
+
+    try:
+        lease = fixture_pool.lease(lease_request.get('execution_id'), lease_request['mano'], lease_request['nsd_id'],
+                                   flavour_id=lease_request.get('flavour_id'),
+                                   ns_instantiation_level_id=lease_request.get('ns_instantiation_level_id'),
+                                   timeout=lease_request.get('timeout', DEFAULT_LEASE_TIMEOUT))
+    except FixturePending as e:
+        response.status = 202
+        return {'error': str(e)}
+    except FixtureError as e:
+        response.status = 503
+        return {'error': str(e)}
+    except Exception as e:
+        LOG.exception(e)
+        response.status = 500
+        return {'error': '%s: %s' % (type(e).__name__, e)}
+
+    return {'lease_id': lease.lease_id, 'ns_instance_id': lease.fixture.ns_instance_id}
+
+
+@route('/v1.0/fixtures/leases/<lease_id>', method='DELETE')
+def release_fixture(lease_id):
+    """
+    Request mapped function that ends a fixture lease. The NS goes back to the pool unless the query parameter reusable
+    is false, in which case it is terminated and replaced.
+    """
+    reusable = request.query.get('reusable', 'true').lower() != 'false'
+    try:
+        fixture_pool.release(lease_id, reusable=reusable)
+    except KeyError:
+        response.status = 404
+        return {'error': 'Lease %s not found' % lease_id}
+    return {'lease_id': lease_id, 'reusable': reusable}
+
+
+@route('/v1.0/fixtures')
+def all_fixtures():
+    """
+    Request mapped function that returns the idle, creating and leased NS instances of the fixture pool.
+    """
+    return {'fixtures': fixture_pool.state()}
+
+
+@route('/v1.0/fixtures', method='DELETE')
+def drain_fixtures():
+    """
+    Request mapped function that terminates all the idle NS instances of the fixture pool.
+    """
+    return {'terminating': fixture_pool.drain()}
+
+
+@route('/v1.0/history')
+def query_history():
+    """
+    Request mapped function that returns one page of the execution history, most recent first. The query parameters
+    tc_name, run_id, suite_name and status filter the executions, start_after and start_before limit their start time
+    and limit and offset select the page.
+    Example: /v1.0/history?tc_name=TC_VNF_STATE_INST_001&status=FAILED&limit=20&offset=40
+    """
+    filters = {}
+    for column in history.FILTER_COLUMNS:
+        value = request.query.get(column)
+        if value is not None:
+            filters[column] = value
+
+    try:
+        limit = int(request.query.get('limit', history.DEFAULT_PAGE_SIZE))
+        offset = int(request.query.get('offset', 0))
+    except ValueError:
+        response.status = 400
+        return {'error': 'limit and offset must be integers'}
+
+    executions, total = history.query_executions(filters, start_after=request.query.get('start_after'),
+                                                 start_before=request.query.get('start_before'), limit=limit,
+                                                 offset=offset)
+
+    return {
+        'executions': executions,
+        'total': total,
+        'limit': limit,
+        'offset': offset
+    }
+
+
+@route('/v1.0/history/<execution_id>')
+def get_history(execution_id):
+    """
+    Request mapped function that returns the recorded execution with the specified ID, including its steps and events.
+    """
+    execution = history.get_execution(execution_id)
+    if execution is None:
+        response.status = 404
+        return {'status': 'NOT_FOUND'}
+
+    return execution
+
+
 def _read_resources(resource):
     """
     This function returns the contents of the JSON resource file corresponding to the specified resource.
     Example: if resource is 'mano', the function will return the contents of the file mano.json.
     """
-    resource_file_path = os.path.join(json_file_path, '%s.json' % resource)
-    try:
-        with open(resource_file_path, 'r') as resource_file:
-            all_resources = json.load(resource_file)
-    except IOError:
-        all_resources = {}
-
-    return all_resources
+    return store.get_all(resource)
 
 
 def _read_resource(resource, name):
@@ -377,18 +877,25 @@ def _read_resource(resource, name):
     Example: if resource is 'mano' and name is tacker1 the function will return the details about the MANO with the name
     tacker1.
     """
-    all_resources = _read_resources(resource)
+    return store.get(resource, name, {})
 
-    return all_resources.get(name, {})
 
+def _write_resource(resource, name, resource_params):
+    """
+    This function adds or replaces the resource with the specified type and name.
+    """
+    store.set(resource, name, resource_params)
 
-def _write_resources(resource, all_resources):
+
+def _delete_resource(resource, name):
     """
-    This function creates a JSON resource file containing the specified resources.
+    This function removes the resource with the specified type and name and returns its details.
     """
-    resource_file_path = os.path.join(json_file_path, '%s.json' % resource)
-    with open(resource_file_path, 'w') as resource_file:
-        json.dump(all_resources, resource_file, sort_keys=True, indent=2)
+    resource_params = store.delete(resource, name)
+    if resource_params is None:
+        resource_params = {}
+
+    return resource_params
 
 
 @route('/v1.0/<resource:re:vim|mano|em|vnf|traffic|env>/<name>')
@@ -421,10 +928,7 @@ def set_resource(resource, name):
     Request mapped function that adds a new resource with the specified name.
     """
     with lock[resource]:
-        all_resources = _read_resources(resource)
-        all_resources[name] = request.json
-
-        _write_resources(resource, all_resources)
+        _write_resource(resource, name, request.json)
 
         return {name: request.json}
 
@@ -435,10 +939,7 @@ def delete_resource(resource, name):
     Request mapped function that deletes the resource with the specified name.
     """
     with lock[resource]:
-        all_resources = _read_resources(resource)
-        resource_params = all_resources.pop(name, {})
-
-        _write_resources(resource, all_resources)
+        resource_params = _delete_resource(resource, name)
 
         if resource_params == {}:
             response.status = 404
@@ -501,13 +1002,12 @@ def wait_for_exec(execution_id):
     ID to finish.
     """
     try:
-        execution_process = execution_processes[execution_id]
+        execution_event = execution_events[execution_id]
     except KeyError:
         response.status = 404
         return {'status': 'NOT_FOUND'}
 
-    if execution_process is not None:
-        execution_process.join()
+    execution_event.wait()
     return {'status': 'DONE'}
 
 
@@ -552,22 +1052,155 @@ def trigger_step(execution_id):
 
 @route('/v1.0/reports')
 def list_reports():
+    """
+    Request mapped function that returns the names of the reports of the specified type from the report catalogue,
+    sorted by name. The query parameters tc_name and status filter the reports and limit and offset select a page. All
+    the matching reports are returned if limit is not specified.
+    Example: /v1.0/reports?type=html&status=FAILED&limit=100&offset=0
+    """
     extension = request.query.type or 'html'
-    report_files_list = glob('%s/*.%s' % (reports_dir, extension))
+    filters = {}
+    for column in history.REPORT_FILTER_COLUMNS:
+        value = request.query.get(column)
+        if value is not None:
+            filters[column] = value
 
-    def get_basename(absolute_path):
-        return os.path.splitext(os.path.basename(absolute_path))[0]
+    try:
+        limit = request.query.get('limit')
+        if limit is not None:
+            limit = int(limit)
+        offset = int(request.query.get('offset', 0))
+    except ValueError:
+        response.status = 400
+        return {'error': 'limit and offset must be integers'}
 
-    report_names = map(get_basename, report_files_list)
-    report_names.sort()
+    # Reports deleted from disk are removed from the catalogue by the periodic catalogue pass
+    reports, total = history.query_reports(extension, filters, limit=limit, offset=offset)
 
-    return {'reports': report_names}
+    return {
+        'reports': [report['report_name'] for report in reports],
+        'details': reports,
+        'total': total
+    }
 
 
 @route('/v1.0/reports/<name>')
 def get_report(name):
+    """
+    Request mapped function that returns the report with the specified name and type. Reports do not change once they
+    are generated, so they are served with an ETag and compressed with gzip if the client accepts it.
+    """
     extension = request.query.type or 'html'
-    return static_file('%s.%s' % (name, extension), root=os.path.abspath(reports_dir))
+    report_file_name = '%s.%s' % (name, extension)
+    root = os.path.abspath(reports_dir)
+    report_file_path = os.path.abspath(os.path.join(root, report_file_name))
+    if not report_file_path.startswith(root + os.sep) or not os.path.isfile(report_file_path):
+        # Let bottle build the error response
+        return static_file(report_file_name, root=root)
+
+    stats = os.stat(report_file_path)
+    etag = '"%x-%x"' % (int(stats.st_mtime), stats.st_size)
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'no-cache',
+        'Vary': 'Accept-Encoding'
+    }
+
+    if_none_match = request.headers.get('If-None-Match', '')
+    if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+        return HTTPResponse(status=304, **headers)
+
+    if 'gzip' not in request.headers.get('Accept-Encoding', ''):
+        report_response = static_file(report_file_name, root=root)
+        for header, value in headers.items():
+            report_response.set_header(header, value)
+        return report_response
+
+    mimetype = mimetypes.guess_type(report_file_path)[0] or 'text/plain'
+    if mimetype.startswith('text/'):
+        mimetype += '; charset=UTF-8'
+
+    compressed_report = BytesIO()
+    with open(report_file_path, 'rb') as report_file:
+        gzip_file = gzip.GzipFile(fileobj=compressed_report, mode='wb')
+        try:
+            shutil.copyfileobj(report_file, gzip_file)
+        finally:
+            gzip_file.close()
+
+    return HTTPResponse(compressed_report.getvalue(), content_type=mimetype, content_encoding='gzip', **headers)
 
 
+def catalogue_reports():
+    """
+    This function adds the existing report files that are missing from the report catalogue and removes the reports
+    whose file was deleted.
+    """
+    try:
+        history.catalogue_directory(reports_dir)
+    except Exception as e:
+        LOG.debug('Unable to catalogue the reports in %s' % reports_dir)
+        LOG.exception(e)
+
+
+def catalogue_reports_periodically():
+    """
+    This function is used as the target of the thread that keeps the report catalogue in sync with the report
+    directory, so that the report listing does not have to check the files on disk.
+    """
+    while True:
+        time.sleep(REPORT_CATALOGUE_INTERVAL)
+        catalogue_reports()
+
+
+def _fixture_mano_config(mano_name):
+    """
+    This function returns the config of the MANO with the specified name, as used by the fixture pool for terminating
+    the NS instances recorded by a previous run of the server, or None if the MANO is not configured.
+    """
+    mano_params = _read_resource('mano', mano_name) if mano_name is not None else None
+    if not mano_params:
+        return None
+
+    generic_config = {}
+    for timeout_timer in timeout_timers:
+        timeout = _read_config(timeout_timer)
+        if timeout is not None:
+            generic_config[timeout_timer] = timeout
+    return {
+        'type': mano_params['type'],
+        'name': mano_name,
+        'adapter_config': mano_params['client_config'],
+        'generic_config': generic_config,
+        'query_params': mano_params.get('query_params', {}),
+        'termination_params': mano_params.get('termination_params', {})
+    }
+
+
+def drain_stored_fixtures():
+    """
+    This function terminates the NS instances the fixture pool held when the server was stopped.
+    """
+    try:
+        LOG.debug('Terminating %s NS instances left by the fixture pool' % fixture_pool.drain_stored())
+    except Exception as e:
+        LOG.debug('Unable to terminate the NS instances left by the fixture pool')
+        LOG.exception(e)
+
+
+# The initial workers are forked before any thread is started, so that they cannot inherit a lock held by another thread
+worker_pool = WorkerPool(execute_test, size=_read_config('worker_pool_size') or DEFAULT_POOL_SIZE)
+dispatcher = Dispatcher()
+scheduler = Scheduler(_get_concurrency_limits, start_failed=fail_execution)
+retention = RetentionPolicy(evict_execution, _get_retention_limits)
+fixture_pool = FixturePool(partial(_read_config, 'fixture_pool_size'), store=store,
+                           get_mano_config=_fixture_mano_config)
+
+catalogue_reports()
+drain_stored_fixtures()
+
+catalogue_thread = Thread(target=catalogue_reports_periodically, name='report-catalogue')
+catalogue_thread.daemon = True
+catalogue_thread.start()
+
 run(host='0.0.0.0', port=8080, server='paste')
@@ -0,0 +1,209 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import atexit
+import copy
+import json
+import logging
+import os
+import tempfile
+import time
+from threading import Condition, Event, RLock, Thread
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+class StoreError(Exception):
+    """
+    A document of the JSON store could not be written to disk.
+    """
+    pass
+
+
+class JsonFileStore(object):
+    """
+    In-memory store for the JSON resource and config files of the REST server.
+
+    Each JSON file (document) is parsed once and kept in memory, indexed by document name and key. External edits are
+    detected by comparing the file modification time. Writes update the in-memory copy immediately and are flushed to
+    disk by a background thread, using a temporary file that is renamed over the original. A write returns once the
+    flush that includes it has completed, and raises StoreError if that flush failed, so that concurrent writes share
+    a single disk write without being lost silently.
+    """
+
+    def __init__(self, directory, flush_delay=0.2):
+        """
+        :param directory:   Directory holding the JSON files.
+        :param flush_delay: Time in seconds to wait after a write before flushing, so that bursts of writes are
+                            coalesced into a single disk write.
+        """
+        self.directory = directory
+        self.flush_delay = flush_delay
+        self.documents = {}
+        self.mtimes = {}
+        self.dirty = set()
+        self.versions = {}
+        self.flushed_versions = {}
+        self.flush_errors = {}
+        self.lock = RLock()
+        self.flushed = Condition(self.lock)
+        self.flush_event = Event()
+        self.pid = os.getpid()
+
+        # The flusher thread is started by the first write, so that processes can be forked safely until then
+        self.flush_thread = None
+        atexit.register(self.flush)
+
+    def _path(self, document):
+        return os.path.join(self.directory, '%s.json' % document)
+
+    def _mtime(self, document):
+        try:
+            return os.stat(self._path(document)).st_mtime
+        except OSError:
+            return None
+
+    def _load(self, document):
+        """
+        This method returns the in-memory copy of the document, reloading it from disk if the file was changed.
+        Pending writes take precedence over the file on disk, except in a forked process, which drops the copies it
+        inherited and reads the files again.
+        """
+        if os.getpid() != self.pid:
+            self.documents, self.mtimes, self.dirty = {}, {}, set()
+            self.flush_thread = None
+            self.pid = os.getpid()
+
+        if document in self.dirty:
+            return self.documents[document]
+
+        mtime = self._mtime(document)
+        if document in self.documents and self.mtimes.get(document) == mtime:
+            return self.documents[document]
+
+        try:
+            with open(self._path(document), 'r') as json_file:
+                contents = json.load(json_file)
+        except (IOError, ValueError):
+            contents = {}
+
+        self.documents[document] = contents
+        self.mtimes[document] = mtime
+        return contents
+
+    def get_all(self, document):
+        """
+        This method returns a copy of the whole document.
+        """
+        with self.lock:
+            return copy.deepcopy(self._load(document))
+
+    def get(self, document, key, default=None):
+        """
+        This method returns a copy of the value stored under the specified key of the document.
+        """
+        with self.lock:
+            return copy.deepcopy(self._load(document).get(key, default))
+
+    def set(self, document, key, value):
+        """
+        This method stores the value under the specified key of the document.
+        """
+        with self.lock:
+            self._load(document)[key] = copy.deepcopy(value)
+            self._wait_flushed(document, self._mark_dirty(document))
+
+    def delete(self, document, key):
+        """
+        This method removes the specified key from the document and returns its value, or None if it did not exist.
+        """
+        with self.lock:
+            value = self._load(document).pop(key, None)
+            self._wait_flushed(document, self._mark_dirty(document))
+            return value
+
+    def _mark_dirty(self, document):
+        """
+        This method schedules the flush of the document.
+
+        :return:    Version of the document including the last change.
+        """
+        if self.flush_thread is None:
+            self.flush_thread = Thread(target=self._flusher, name='json-store-flusher')
+            self.flush_thread.daemon = True
+            self.flush_thread.start()
+        self.dirty.add(document)
+        self.versions[document] = self.versions.get(document, 0) + 1
+        self.flush_event.set()
+        return self.versions[document]
+
+    def _wait_flushed(self, document, version):
+        """
+        This method waits until the specified version of the document has been written to disk.
+        """
+        while self.flushed_versions.get(document, 0) < version:
+            failed_version, error = self.flush_errors.get(document, (0, None))
+            if failed_version >= version:
+                raise StoreError('Unable to write %s - %s' % (self._path(document), error))
+            self.flushed.wait()
+
+    def _flusher(self):
+        while True:
+            self.flush_event.wait()
+            time.sleep(self.flush_delay)
+            self.flush_event.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                LOG.exception(e)
+
+    def flush(self):
+        """
+        This method writes all the documents with pending changes to disk.
+        """
+        errors = []
+        with self.lock:
+            for document in list(self.dirty):
+                version = self.versions.get(document, 0)
+                try:
+                    self._write(document, self.documents[document])
+                except Exception as e:
+                    self.flush_errors[document] = (version, e)
+                    errors.append(e)
+                    continue
+                self.mtimes[document] = self._mtime(document)
+                self.flushed_versions[document] = version
+                self.flush_errors.pop(document, None)
+                self.dirty.discard(document)
+            self.flushed.notify_all()
+
+        if errors:
+            raise errors[0]
+
+    def _write(self, document, contents):
+        """
+        This method atomically replaces the file of the document with the specified contents.
+        """
+        fd, temp_path = tempfile.mkstemp(prefix='.%s.' % document, suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w') as temp_file:
+                json.dump(contents, temp_file, sort_keys=True, indent=2)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.rename(temp_path, self._path(document))
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import fnmatch
+import time
+from threading import Lock
+
+DEFAULT_PARALLELISM = 1
+
+
+def select_tcs(tc_paths, tc_names=None, tc_globs=None):
+    """
+    This function returns the sorted list of test case names selected by name or by glob pattern.
+
+    :param tc_paths:    Dictionary with the test case names as keys and their module path as values, as returned by
+                        /v1.0/tcs. Ex. {"TC_VNF_STATE_TERM_003": "vnf/state/term"}
+    :param tc_names:    List of test case names.
+    :param tc_globs:    List of glob patterns matched against the test case names and against their full path,
+                        including the test case name. Ex. "vnf/state/term/*" or "TD_NFV_NSLCM_SCALE_*"
+    :return:            List of test case names. Unknown names are kept, so the caller can report them.
+    """
+    selected = []
+    for tc_name in tc_names or []:
+        if tc_name not in selected:
+            selected.append(tc_name)
+
+    for tc_glob in tc_globs or []:
+        for tc_name, tc_path in sorted(tc_paths.items()):
+            full_path = '%s/%s' % (tc_path, tc_name)
+            if fnmatch.fnmatchcase(tc_name, tc_glob) or fnmatch.fnmatchcase(full_path, tc_glob):
+                if tc_name not in selected:
+                    selected.append(tc_name)
+
+    return selected
+
+
+class Suite(object):
+    """
+    Group of test case executions submitted together.
+    """
+
+    def __init__(self, suite_id, suite_name, run_id, parallelism):
+        self.suite_id = suite_id
+        self.suite_name = suite_name
+        self.run_id = run_id
+        self.parallelism = parallelism
+        self.executions = collections.OrderedDict()
+        self.pending = set()
+        self.start_time = time.time()
+        self.end_time = None
+        self.lock = Lock()
+
+    def add(self, execution_id, tc_name):
+        with self.lock:
+            self.executions[execution_id] = tc_name
+            self.pending.add(execution_id)
+
+    def completed(self, execution_id):
+        """
+        This method records the completion of one of the executions of the suite.
+
+        :return:    True if this was the last execution of the suite to complete, False otherwise.
+        """
+        with self.lock:
+            if execution_id not in self.pending:
+                return False
+            self.pending.discard(execution_id)
+            if self.pending:
+                return False
+            self.end_time = time.time()
+            return True
+
+    @property
+    def duration(self):
+        end_time = self.end_time
+        if end_time is None:
+            end_time = time.time()
+        return end_time - self.start_time
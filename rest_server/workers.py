@@ -0,0 +1,255 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import gc
+import importlib
+import logging
+import time
+from multiprocessing import Event, Pipe, Process, Queue
+from threading import Condition, Lock, Thread
+
+from api.adapter import replay
+from utils.constructors.mapping import get_constructor_mapping, get_tc_constructor_class
+from utils.metrics import REGISTRY
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+
+# Interval of time in seconds between the reports of the metrics recorded by a worker during an execution
+METRICS_REPORT_INTERVAL = 15
+
+
+def preload():
+    """
+    This function imports the modules needed by the test cases, so that their import and schema load cost is paid
+    before the worker receives any work.
+    """
+    importlib.import_module('api.structures.objects')
+    for tc_name in get_constructor_mapping('tc').keys():
+        try:
+            get_tc_constructor_class(tc_name)
+        except Exception as e:
+            LOG.debug('Unable to preload test case %s: %s' % (tc_name, e))
+
+
+def reset_logging():
+    """
+    This function removes the handlers added to the root logger during a test case execution.
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+
+
+class Channel(object):
+    """
+    Queue-like write end of the pipe a worker uses for reporting to the server. Every object is sent as a (kind, object)
+    tuple, so that step messages and results can share the same pipe and keep their relative order.
+    """
+
+    def __init__(self, connection, kind, lock):
+        self.connection = connection
+        self.kind = kind
+        self.lock = lock
+
+    def put(self, obj):
+        with self.lock:
+            self.connection.send((self.kind, obj))
+
+
+def report_metrics(metrics_queue):
+    """
+    This function is used as the target of the worker thread that sends the metrics recorded since the last report to
+    the server every METRICS_REPORT_INTERVAL seconds, so that long executions are visible before they finish.
+    """
+    while True:
+        time.sleep(METRICS_REPORT_INTERVAL)
+        counters, histograms = REGISTRY.drain()
+        if counters or histograms:
+            metrics_queue.put((counters, histograms))
+
+
+def worker_loop(target, task_queue, connection, step_trigger):
+    """
+    This function is used as the worker process target. It runs the executions received on the task queue one after
+    another and sends a 'done' notification after each of them to signal that the worker is idle again. The metrics
+    recorded during the execution are sent to the server periodically and right before the 'done' notification.
+    """
+    # Discard the metrics inherited from the server process
+    REGISTRY.drain()
+    preload()
+
+    lock = Lock()
+    result_queue = Channel(connection, 'result', lock)
+    message_queue = Channel(connection, 'message', lock)
+    metrics_queue = Channel(connection, 'metrics', lock)
+    done_queue = Channel(connection, 'done', lock)
+
+    metrics_thread = Thread(target=report_metrics, args=(metrics_queue,), name='metrics-reporter')
+    metrics_thread.daemon = True
+    metrics_thread.start()
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+
+        debug, args = task
+        step_trigger.clear()
+        try:
+            target(*(args + (result_queue, message_queue, step_trigger if debug else None)))
+        except Exception as e:
+            LOG.exception(e)
+        finally:
+            reset_logging()
+            replay.restore_timing()
+            gc.collect()
+            metrics_queue.put(REGISTRY.drain())
+            done_queue.put(None)
+
+
+class Worker(object):
+    """
+    Pre-forked process that executes test cases. Each worker owns the task queue, the step trigger and the pipe used
+    for communicating with the execution it is running.
+
+    The server only keeps the read end of the pipe, so the pipe also reports the end of the worker process: reading
+    from it raises EOFError once the process is gone.
+    """
+
+    def __init__(self, target):
+        self.task_queue = Queue()
+        self.step_trigger = Event()
+        self.connection, child_connection = Pipe(duplex=False)
+        self.process = Process(target=worker_loop, args=(target, self.task_queue, child_connection,
+                                                         self.step_trigger))
+        self.process.daemon = True
+        self.process.start()
+        child_connection.close()
+
+    def submit(self, debug, *args):
+        """
+        This method hands an execution to the worker. The target is called with the provided arguments followed by the
+        result queue, the message queue and, if debug is True, the step trigger (None otherwise). Both queues write to
+        the worker pipe.
+        """
+        self.task_queue.put((debug, args))
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def join(self, timeout=None):
+        self.process.join(timeout)
+
+    def terminate(self):
+        self.process.terminate()
+
+    def stop(self):
+        self.task_queue.put(None)
+
+
+class WorkerPool(object):
+    """
+    Pool of warm workers. The initial workers are forked when the pool is created, and the replacements are forked by
+    a single dedicated thread, which keeps the pool filled up to its size: the server threads acquiring a worker never
+    fork themselves, they wait for an idle worker instead. Workers that are released while the pool is already full
+    are stopped.
+    """
+
+    def __init__(self, target, size=DEFAULT_POOL_SIZE):
+        self.target = target
+        self.size = size
+        self.idle_workers = [Worker(target) for _ in range(size)]
+        self.pending_acquisitions = 0
+        self.condition = Condition()
+        self.spawner = Thread(target=self._spawn_workers, name='worker-spawner')
+        self.spawner.daemon = True
+        self.spawner.start()
+
+    def _missing_count(self):
+        """
+        This method drops the idle workers that are no longer alive and returns the number of workers the spawner has
+        to start so that the pool is full again once the pending acquisitions are served. It must be called with the
+        condition held.
+        """
+        alive_workers = []
+        for worker in self.idle_workers:
+            if worker.is_alive():
+                alive_workers.append(worker)
+            else:
+                worker.connection.close()
+        self.idle_workers = alive_workers
+        return self.size + self.pending_acquisitions - len(self.idle_workers)
+
+    def _spawn_workers(self):
+        """
+        This method is used as the target of the spawner thread. It is the only place where worker processes are
+        forked.
+        """
+        while True:
+            with self.condition:
+                while self._missing_count() <= 0:
+                    self.condition.wait()
+            try:
+                worker = Worker(self.target)
+            except Exception as e:
+                LOG.exception(e)
+                time.sleep(1)
+                continue
+            with self.condition:
+                self.idle_workers.append(worker)
+                self.condition.notify_all()
+
+    def acquire(self):
+        """
+        This method returns an idle worker, waiting for the spawner thread to start one if none is available.
+        """
+        with self.condition:
+            self.pending_acquisitions += 1
+            try:
+                while True:
+                    while self.idle_workers:
+                        worker = self.idle_workers.pop()
+                        if worker.is_alive():
+                            return worker
+                        worker.connection.close()
+                    self.condition.notify_all()
+                    self.condition.wait()
+            finally:
+                self.pending_acquisitions -= 1
+                self.condition.notify_all()
+
+    def idle_count(self):
+        """
+        This method returns the number of idle workers that are alive.
+        """
+        with self.condition:
+            return len([worker for worker in self.idle_workers if worker.is_alive()])
+
+    def release(self, worker):
+        """
+        This method puts the worker back in the pool, or stops it if the pool is full or the worker is no longer alive.
+        """
+        if not worker.is_alive():
+            worker.connection.close()
+            with self.condition:
+                self.condition.notify_all()
+            return
+        with self.condition:
+            if len(self.idle_workers) < self.size:
+                self.idle_workers.append(worker)
+                self.condition.notify_all()
+                return
+        worker.stop()
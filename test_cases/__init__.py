@@ -13,13 +13,25 @@
 import collections
 import importlib
 import time
+from threading import RLock
+
+import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from api import ApiError
 from api.generic import constants, construct_generic
-from utils import timestamps
+from utils import polling, timestamps, tracing
+from utils.metrics import REGISTRY
+from utils.net import ping
+
+DEFAULT_FIXTURE_SERVER_URL = 'http://localhost:8080/v1.0/fixtures'
+
+# Interval of time in seconds the fixture server waits for an NS instance before the lease has to be requested again
+LEASE_REQUEST_TIMEOUT = 60
 
 Function = collections.namedtuple('Function',
-                                  'function_reference verify_result expected_result function_args function_kwargs')
+                                  'function_reference verify_result expected_result function_args function_kwargs '
+                                  'cleanup_group')
 
 
 class TestExecutionError(Exception):
@@ -63,6 +75,13 @@ class TestRequirementsError(TestExecutionError):
 
 
 class Step(object):
+    """
+    Test case step.
+
+    By default a step starts only after all the steps declared before it have completed. A step that declares the
+    steps it depends on in depends_on starts as soon as those steps have completed, so it may run in parallel with other
+    steps. Ex. @Step(name='Verify software images', description='...', depends_on=(step1,))
+    """
     global_index = 0
 
     @classmethod
@@ -70,11 +89,12 @@ class Step(object):
         cls.global_index += 1
         return cls.global_index
 
-    def __init__(self, name, description, runnable=True):
+    def __init__(self, name, description, runnable=True, depends_on=None):
         self.index = self.generate_index()
         self.name = name
         self.description = description
         self.runnable = runnable
+        self.depends_on = depends_on
 
     def __call__(self, run_func):
         self.run_func = run_func
@@ -99,6 +119,14 @@ class TestMeta(type):
 
             normalized_index = 1
             for step in steps:
+                if step.depends_on is None:
+                    step.dependencies = list(steps[:normalized_index - 1])
+                else:
+                    step.dependencies = list(step.depends_on)
+                    for dependency in step.dependencies:
+                        if dependency not in steps:
+                            raise ValueError('Step "%s" of %s depends on a step that does not belong to the test case'
+                                             % (step.name, name))
                 step.index = normalized_index
                 normalized_index += 1
 
@@ -116,6 +144,8 @@ class TestCase(object):
     REQUIRED_APIS = ()
     REQUIRED_ELEMENTS = ()
     TESTCASE_EVENTS = ()
+    MAX_PARALLEL_STEPS = 4
+    MAX_PARALLEL_CLEANUPS = 8
 
     def __init__(self, tc_input):
         self.tc_input = tc_input
@@ -134,7 +164,10 @@ class TestCase(object):
             'timestamps': collections.OrderedDict(),
             'steps': collections.OrderedDict()
         }
+        # Guards the updates of tc_result made by steps that may run concurrently
+        self.tc_result_lock = RLock()
         self.time_record = timestamps.TimeRecord()
+        self.trace = tracing.TraceBuffer()
         self.traffic = None
         self.em = None
         self.mano = None
@@ -144,6 +177,8 @@ class TestCase(object):
         self.cleanup_registrations = {}
         self.message_queue = None
         self.step_trigger = None
+        self.profiler = None
+        self.execution_id = None
 
     # @classmethod
     # def initialize(cls):
@@ -170,9 +205,10 @@ class TestCase(object):
         """
         self._LOG.debug('Building objects for %s' % self.__class__.__name__)
         for element in self.REQUIRED_APIS:
-            setattr(self, element, construct_generic(vendor=self.tc_input[element]['type'], module_type=element,
-                                                     adapter_config=self.tc_input[element].get('adapter_config', {}),
-                                                     generic_config=self.tc_input[element].get('generic_config', {})))
+            api = construct_generic(vendor=self.tc_input[element]['type'], module_type=element,
+                                    adapter_config=self.tc_input[element].get('adapter_config', {}),
+                                    generic_config=self.tc_input[element].get('generic_config', {}))
+            setattr(self, element, api)
 
         self._LOG.debug('Finished building objects for %s' % self.__class__.__name__)
 
@@ -194,57 +230,248 @@ class TestCase(object):
         pass
 
     def run(self):
-        for step in self.steps:
-            step_dict = {
-                'name': step.name,
-                'description': step.description,
-                'index': step.index
-            }
+        """
+        This method runs the test case steps. Steps whose dependencies have completed run in parallel, unless the test
+        case is executed in debug mode, in which case the steps run one at a time, in index order. After a step fails no
+        other step is started and the error of the failed step is raised once the running steps have completed.
+        Concurrent steps call the same API objects at the same time, and their updates of tc_result must hold
+        tc_result_lock.
+        """
+        if self.step_trigger is not None or all(step.dependencies == self.steps[:step.index - 1]
+                                                 for step in self.steps):
+            for step in self.steps:
+                self.run_step(step)
+            return
+
+        completed = set()
+        pending = list(self.steps)
+        running = {}
+        failure = None
+        executor = ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_STEPS)
+        try:
+            while pending or running:
+                if failure is None:
+                    for step in list(pending):
+                        if all(dependency in completed for dependency in step.dependencies):
+                            pending.remove(step)
+                            running[executor.submit(self.run_step, step)] = step
+                if not running:
+                    break
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: running[f].index):
+                    step = running.pop(future)
+                    if future.exception() is not None:
+                        if failure is None:
+                            failure = future.exception()
+                    else:
+                        completed.add(step)
+        finally:
+            executor.shutdown(wait=True)
 
-            if self.step_trigger is not None:
-                step_dict['status'] = 'PAUSED'
-                self.message_queue.put(dict(step_dict))
-                self.step_trigger.wait()
-                self.step_trigger.clear()
+        if failure is not None:
+            raise failure
 
-            self._LOG.info('Entering step %s' % step.name)
-            if self.message_queue is not None:
-                step_dict['status'] = 'RUNNING'
-                self.message_queue.put(dict(step_dict))
+    def run_step(self, step):
+        """
+        This method runs one test case step and reports its status.
+        """
+        step_dict = {
+            'name': step.name,
+            'description': step.description,
+            'index': step.index
+        }
 
-            try:
-                step_start_time = time.time()
-                if step.runnable is True:
-                    step.run_func(self)
-                    step_status = 'PASS'
+        if self.step_trigger is not None:
+            step_dict['status'] = 'PAUSED'
+            self.message_queue.put(dict(step_dict))
+            self.step_trigger.wait()
+            self.step_trigger.clear()
+
+        self._LOG.info('Entering step %s' % step.name)
+        tracing.set_step(step.index)
+        if self.message_queue is not None:
+            step_dict['status'] = 'RUNNING'
+            self.message_queue.put(dict(step_dict))
+
+        try:
+            step_start_time = time.time()
+            if step.runnable is True:
+                if self.profiler is not None:
+                    self.profiler.profile('step%s' % step.index, step.name, step.run_func, self)
                 else:
-                    step_status = 'NOT RUNNABLE'
-            except TestRunError as e:
-                step_status = 'FAIL'
-                self._LOG.exception(e)
-                raise e
-            except Exception as e:
-                step_status = 'ERROR'
-                self._LOG.exception(e)
-                raise e
-            finally:
-                step_end_time = time.time()
-                step_duration = step_end_time - step_start_time
-                if self.message_queue is not None:
-                    step_dict['status'] = step_status
-                    self.message_queue.put(dict(step_dict))
+                    step.run_func(self)
+                step_status = 'PASS'
+            else:
+                step_status = 'NOT RUNNABLE'
+        except TestRunError as e:
+            step_status = 'FAIL'
+            self._LOG.exception(e)
+            raise e
+        except Exception as e:
+            step_status = 'ERROR'
+            self._LOG.exception(e)
+            raise e
+        finally:
+            step_end_time = time.time()
+            step_duration = step_end_time - step_start_time
+            if self.message_queue is not None:
+                step_dict['status'] = step_status
+                self.message_queue.put(dict(step_dict))
+            with self.tc_result_lock:
                 self.tc_result['steps'][step.index]['status'] = step_status
                 self.tc_result['steps'][step.index]['duration'] = step_duration
-                self._LOG.info('Exiting step %s' % step.name)
+            REGISTRY.observe('vnflcv_step_duration_seconds', step_duration, tc_name=self.tc_name, step=step.name,
+                             status=step_status)
+            self._LOG.info('Exiting step %s' % step.name)
+
+    def wait_until(self, condition, timeout, poll_interval=None, time_record_label=None):
+        """
+        This method evaluates the condition until it holds or the timeout expires. The condition is evaluated again
+        after adaptive intervals, growing up to poll_interval, and as soon as a lifecycle change notification arrives.
+        Conditions can be composed with polling.all_of() and polling.any_of().
+
+        :param condition:           Function without arguments returning a value that is true when the condition holds.
+        :param timeout:             Maximum interval of time in seconds to wait for the condition to hold.
+        :param poll_interval:       Maximum interval of time in seconds between consecutive evaluations of the
+                                    condition. Defaults to constants.POLL_INTERVAL.
+        :param time_record_label:   Label of the time record in which the time the condition took to hold is stored.
+                                    The time record is started now, unless it was already started by the caller, and
+                                    ended when the condition holds.
+        :return:                    Value returned by the condition when it held, or None if the timeout expired.
+        """
+        if time_record_label is not None and time_record_label not in self.time_record.time_records:
+            self.time_record.START(time_record_label)
+        value = polling.wait_until(condition, timeout, poll_interval or constants.POLL_INTERVAL,
+                                   condition_name=time_record_label)
+        if value is not None and time_record_label is not None:
+            self.time_record.END(time_record_label)
+        return value
+
+    def wait_for_ns_boot(self, ns_instance_id, timeout=None, time_record_label=None):
+        """
+        This method waits until the management addresses of all the VNF instances in the NS answer to ping, instead of
+        sleeping for the whole boot time. The addresses are resolved once, before waiting, and then only pinged. If the
+        timeout expires the test case goes on, leaving the verification of the VNF instances to the following steps.
+
+        :param ns_instance_id:      Identifier of the NS instance.
+        :param timeout:             Maximum interval of time in seconds to wait. Defaults to
+                                    constants.INSTANCE_FIRST_BOOT_TIME.
+        :param time_record_label:   Label of the time record in which the boot time is stored.
+        :return:                    True if all the management addresses answered, False otherwise.
+        """
+        if timeout is None:
+            timeout = constants.INSTANCE_FIRST_BOOT_TIME
+        query_params = self.tc_input['mano'].get('query_params')
+        mgmt_addrs = {}
+        reachable_addrs = set()
+
+        def resolve_mgmt_addrs():
+            try:
+                ns_info = self.mano.ns_query(query_filter={'ns_instance_id': ns_instance_id,
+                                                           'additional_param': query_params})
+                mgmt_addrs['resolved'] = set(mgmt_addr for vnf_info in ns_info.vnf_info
+                                             for mgmt_addr in self.mano.get_vnf_mgmt_addr_list(
+                                                 vnf_info.vnf_instance_id, query_params))
+            except ApiError as e:
+                self._LOG.debug('Unable to resolve the management addresses of the VNF instances in NS %s - %s'
+                                % (ns_instance_id, e))
+
+        def vnf_instances_reachable():
+            # The addresses are resolved again only as long as resolving them fails
+            if 'resolved' not in mgmt_addrs:
+                resolve_mgmt_addrs()
+                if 'resolved' not in mgmt_addrs:
+                    return False
+            reachable_addrs.update(mgmt_addr for mgmt_addr in mgmt_addrs['resolved'] - reachable_addrs
+                                   if ping(mgmt_addr))
+            return reachable_addrs == mgmt_addrs['resolved']
+
+        resolve_mgmt_addrs()
+        self._LOG.debug('Waiting up to %s seconds for the VNF instances in NS %s to boot' % (timeout, ns_instance_id))
+        if self.wait_until(vnf_instances_reachable, timeout, time_record_label=time_record_label) is None:
+            self._LOG.debug('VNF instances in NS %s not reachable after %s seconds' % (ns_instance_id, timeout))
+            return False
+        return True
+
+    def fixture_server_url(self):
+        """
+        This method returns the URL of the fixture pool of the REST server, as configured in the server.
+        """
+        return self.tc_input.get('fixture_server_url') or DEFAULT_FIXTURE_SERVER_URL
+
+    def lease_ns(self, cleanup_index, nsd_id, flavour_id=None, ns_instantiation_level_id=None, reusable=True):
+        """
+        This method leases an instantiated NS from the fixture pool of the execution server instead of instantiating
+        one, and registers the release of the lease for cleanup at the specified index. The pool terminates the NS when
+        it is not reused, so no termination must be registered for cleanup. The time the lease took is recorded as the
+        lease_ns event.
+
+        :param cleanup_index:               Cleanup index of the lease release.
+        :param nsd_id:                      Reference to the NSD of the NS instance.
+        :param flavour_id:                  Identifier of the NS deployment flavour.
+        :param ns_instantiation_level_id:   Identifier of the NS instantiation level.
+        :param reusable:                    False if the test case changes the NS, so that it is terminated and
+                                            replaced, instead of going back to the pool, when the lease ends.
+        :return:                            Dictionary with the lease_id and the ns_instance_id of the lease.
+        """
+        lease_request = {
+            'execution_id': self.execution_id,
+            'mano': self.tc_input['mano'],
+            'nsd_id': nsd_id,
+            'flavour_id': flavour_id,
+            'ns_instantiation_level_id': ns_instantiation_level_id,
+            'timeout': LEASE_REQUEST_TIMEOUT
+        }
+        self._LOG.debug('Leasing an NS instance of NSD %s from the fixture pool' % nsd_id)
+        self.time_record.START('lease_ns')
+        deadline = time.time() + constants.NS_INSTANTIATE_TIMEOUT
+        while True:
+            response = requests.post('%s/leases' % self.fixture_server_url(), json=lease_request)
+            if response.status_code != 202 or time.time() >= deadline:
+                break
+            self._LOG.debug('The fixture pool is still creating an NS instance of NSD %s' % nsd_id)
+        if response.status_code != 200:
+            raise TestSetupError('Unable to lease an NS instance of NSD %s' % nsd_id,
+                                 err_details=response.json().get('error'))
+        lease = response.json()
+        self.register_for_cleanup(index=cleanup_index, function_reference=self.release_ns, lease_id=lease['lease_id'],
+                                  reusable=reusable)
+        self.time_record.END('lease_ns')
+
+        self.tc_result['events']['lease_ns'] = {
+            'duration': self.time_record.duration('lease_ns'),
+            'details': 'Leased from the fixture pool'
+        }
+        return lease
+
+    def release_ns(self, lease_id, reusable=True):
+        """
+        This method ends a lease of an NS instance from the fixture pool.
+        """
+        response = requests.delete('%s/leases/%s' % (self.fixture_server_url(), lease_id),
+                                   params={'reusable': str(reusable).lower()})
+        response.raise_for_status()
 
     def register_for_cleanup(self, index, function_reference, verify_result=False, expected_result=None, *args,
                              **kwargs):
         """
         This method adds a "Function" named tuple to the cleanup_registrations dictionary as a value to the key
         indicated in the index (the index must be an integer).
+
+        The optional cleanup_group keyword argument (an integer) places the function in a cleanup group. Functions in
+        the same group are called concurrently during cleanup. Each function without a group forms a group on its own.
+        Groups are processed in reverse order of the highest index of their functions.
         """
         if type(index) is not int:
             raise ValueError('Function register_for_cleanup "index" input must be an integer')
+        if 'cleanup_group' in kwargs:
+            cleanup_group = kwargs.pop('cleanup_group')
+            if type(cleanup_group) is not int:
+                raise ValueError('Function register_for_cleanup "cleanup_group" input must be an integer')
+            cleanup_group = ('group', cleanup_group)
+        else:
+            cleanup_group = ('index', index)
         self._LOG.debug('Registering function %s.%s for test cleanup'
                         % (function_reference.__module__, function_reference.__name__))
         if args:
@@ -255,7 +482,8 @@ class TestCase(object):
                 kv_args.append('%s=%s' % (key, value))
             self._LOG.debug('Function will be called with keyword arguments: (%s)' % ', '.join(map(str, kv_args)))
         new_function = Function(function_reference=function_reference, verify_result=verify_result,
-                                expected_result=expected_result, function_args=args, function_kwargs=kwargs)
+                                expected_result=expected_result, function_args=args, function_kwargs=kwargs,
+                                cleanup_group=cleanup_group)
         self.cleanup_registrations[index] = new_function
 
     def unregister_from_cleanup(self, index):
@@ -268,27 +496,57 @@ class TestCase(object):
         self._LOG.debug('Unregistered function %s.%s from test cleanup'
                         % (function_reference.__module__, function_reference.__name__))
 
+    def call_cleanup_function(self, cleanup_func):
+        """
+        This method calls one function that was registered for cleanup and verifies its result, if required.
+
+        :return:    Error message if the function crashed or returned an unexpected result, None otherwise.
+        """
+        try:
+            actual_result = cleanup_func.function_reference(*cleanup_func.function_args,
+                                                            **cleanup_func.function_kwargs)
+            if cleanup_func.verify_result:
+                self._LOG.debug('Expected result for cleanup function %s.%s: %s; actual result: %s'
+                                % (cleanup_func.function_reference.__module__,
+                                   cleanup_func.function_reference.__name__,
+                                   cleanup_func.expected_result, actual_result))
+                assert actual_result == cleanup_func.expected_result
+        except Exception as e:
+            self._LOG.exception(e)
+            return 'Function %s.%s crashed during cleanup - %s' % (
+                cleanup_func.function_reference.__module__, cleanup_func.function_reference.__name__, e)
+        return None
+
     def cleanup(self):
         """
-        This method calls in reverse order all the functions that were registered for cleanup.
+        This method calls in reverse order all the groups of functions that were registered for cleanup. The functions
+        in the same group are called concurrently. All groups are processed even if some functions fail; the failures
+        are reported together at the end.
         """
         self._LOG.info('Starting main cleanup')
+        # Groups are ordered by the highest index of their functions, as the indexes are visited in reverse order
+        cleanup_groups = collections.OrderedDict()
         for index in reversed(sorted(self.cleanup_registrations.keys())):
             cleanup_func = self.cleanup_registrations[index]
-            try:
-                actual_result = cleanup_func.function_reference(*cleanup_func.function_args,
-                                                                **cleanup_func.function_kwargs)
-                if cleanup_func.verify_result:
-                    self._LOG.debug('Expected result for cleanup function %s.%s: %s; actual result: %s'
-                                    % (cleanup_func.function_reference.__module__,
-                                       cleanup_func.function_reference.__name__,
-                                       cleanup_func.expected_result, actual_result))
-                    assert actual_result == cleanup_func.expected_result
-            except Exception as e:
-                self._LOG.exception(e)
-                raise TestCleanupError('Function %s.%s crashed during cleanup - %s' % (
-                    cleanup_func.function_reference.__module__, cleanup_func.function_reference.__name__, e))
+            cleanup_groups.setdefault(cleanup_func.cleanup_group, []).append(cleanup_func)
+
+        errors = []
+        for cleanup_group, cleanup_funcs in cleanup_groups.items():
+            if len(cleanup_funcs) == 1:
+                results = [self.call_cleanup_function(cleanup_funcs[0])]
+            else:
+                self._LOG.debug('Calling %s cleanup functions of group %s concurrently'
+                                % (len(cleanup_funcs), cleanup_group[1]))
+                executor = ThreadPoolExecutor(max_workers=min(len(cleanup_funcs), self.MAX_PARALLEL_CLEANUPS))
+                try:
+                    results = list(executor.map(tracing.bind(self.call_cleanup_function), cleanup_funcs))
+                finally:
+                    executor.shutdown(wait=True)
+            errors.extend(error for error in results if error is not None)
+
         self._LOG.info('Finished main cleanup')
+        if errors:
+            raise TestCleanupError('; '.join(errors))
 
     def collect_timestamps(self):
         """
@@ -300,6 +558,8 @@ class TestCase(object):
         """
         This method implements the test case execution logic.
         """
+        tracing.activate(self.trace)
+        tracing.set_step(tracing.SETUP_LABEL)
         try:
             self.check_requirements()
             self.build_apis()
@@ -349,8 +609,12 @@ class TestCase(object):
                 cleanup_dict['status'] = 'RUNNING'
                 self.message_queue.put(dict(cleanup_dict))
 
+            tracing.set_step(tracing.CLEANUP_LABEL)
             try:
-                self.cleanup()
+                if self.profiler is not None:
+                    self.profiler.profile('cleanup', cleanup_dict['name'], self.cleanup)
+                else:
+                    self.cleanup()
                 cleanup_status = 'PASS'
             except TestCleanupError as e:
                 self._LOG.error('%s cleanup failed' % self.tc_name)
@@ -361,5 +625,9 @@ class TestCase(object):
                     cleanup_dict['status'] = cleanup_status
                     self.message_queue.put(dict(cleanup_dict))
                 self.collect_timestamps()
+                self.tc_result['api_calls'] = self.trace.summary()
+                tracing.deactivate()
+                if self.profiler is not None:
+                    self.tc_result['profile'] = self.profiler.results
                 self._LOG.info('RESULT: %s' % self.tc_result['overall_status'])
                 return self.tc_result
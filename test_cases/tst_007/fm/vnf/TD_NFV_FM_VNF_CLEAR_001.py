@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError, Step
@@ -84,8 +83,7 @@ class TD_NFV_FM_VNF_CLEAR_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
 
     @Step(name='Verify NS instantiation was successful',
           description='Verify that the NFVO indicates NS instantiation operation result as successful')
@@ -139,21 +137,18 @@ class TD_NFV_FM_VNF_CLEAR_001(TestCase):
         self.nfvo_alarm_filter = self.tc_input['mano'].get('alarm_list_params', {})
         self.nfvo_alarm_filter.update({'ns_instance_id': self.ns_instance_id})
         self.nfvo_alarm_filter.update({'alarm_state': 'ALARM_CLEARED'})
-        elapsed_time = 0
-        while elapsed_time < constants.ALARM_CLEAR_TIMEOUT:
-            nfvo_alarm_list = self.mano.ns_get_alarm_list(query_filter=self.nfvo_alarm_filter)
-            if len(nfvo_alarm_list) != 0:
-                for alarm in nfvo_alarm_list:
-                    resource_type = alarm.root_cause_faulty_resource.faulty_resource_type
-                    resource_id = alarm.root_cause_faulty_resource.faulty_resource.resource_id
-
-                    if resource_type == 'COMPUTE' and resource_id == self.resource_id:
-                        raise TestRunError('Fault alarm for compute resource %s cleared on the NFVO before resolving '
-                                           'the failure' % self.resource_id)
-            else:
-                LOG.debug('Sleeping %s seconds before querying the MANO again for alarms' % constants.POLL_INTERVAL)
-                sleep(constants.POLL_INTERVAL)
-                elapsed_time += constants.POLL_INTERVAL
+
+        def compute_alarm_cleared():
+            for alarm in self.mano.ns_get_alarm_list(query_filter=self.nfvo_alarm_filter):
+                resource_type = alarm.root_cause_faulty_resource.faulty_resource_type
+                resource_id = alarm.root_cause_faulty_resource.faulty_resource.resource_id
+                if resource_type == 'COMPUTE' and resource_id == self.resource_id:
+                    return alarm
+            return None
+
+        if self.wait_until(compute_alarm_cleared, constants.ALARM_CLEAR_TIMEOUT) is not None:
+            raise TestRunError('Fault alarm for compute resource %s cleared on the NFVO before resolving the failure'
+                               % self.resource_id)
 
     @Step(name='Start the virtualized resource that was previously stopped',
           description='Resolve the failure of the virtualized resource allocated to the relevant VNF')
@@ -200,17 +195,12 @@ class TD_NFV_FM_VNF_CLEAR_001(TestCase):
         # --------------------------------------------------------------------------------------------------------------
         LOG.info('Verifying that the relevant NS fault alarm has been cleared on the NFVO by querying the list of NS '
                  'fault alarms')
-        elapsed_time = 0
-        while elapsed_time < constants.ALARM_CLEAR_TIMEOUT:
-            alarm_list = self.mano.ns_get_alarm_list(query_filter=self.nfvo_alarm_filter)
-            if len(alarm_list) != 0:
-                break
-            else:
-                LOG.debug('Sleeping %s seconds before querying the MANO again for alarms' % constants.POLL_INTERVAL)
-                sleep(constants.POLL_INTERVAL)
-                elapsed_time += constants.POLL_INTERVAL
-            if elapsed_time == constants.ALARM_CLEAR_TIMEOUT:
-                raise TestRunError('No fault alarm cleared on the NFVO after %s seconds' % elapsed_time)
+        def alarm_cleared():
+            return self.mano.ns_get_alarm_list(query_filter=self.nfvo_alarm_filter)
+
+        alarm_list = self.wait_until(alarm_cleared, constants.ALARM_CLEAR_TIMEOUT)
+        if alarm_list is None:
+            raise TestRunError('No fault alarm cleared on the NFVO after %s seconds' % constants.ALARM_CLEAR_TIMEOUT)
 
         notification_matched = False
         for alarm in alarm_list:
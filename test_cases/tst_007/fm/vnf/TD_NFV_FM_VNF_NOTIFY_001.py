@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError, Step
@@ -83,8 +82,7 @@ class TD_NFV_FM_VNF_NOTIFY_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
 
     @Step(name='Verify NS instantiation was successful',
           description='Verify that the NFVO indicates NS instantiation operation result as successful')
@@ -176,17 +174,12 @@ class TD_NFV_FM_VNF_NOTIFY_001(TestCase):
         # 7. Verify that a NS fault alarm has been created on the NFVO by querying the list of NS fault alarms
         # --------------------------------------------------------------------------------------------------------------
         LOG.info('Verifying that a NS fault alarm has been created on the NFVO by querying the list of NS fault alarms')
-        elapsed_time = 0
-        while elapsed_time < constants.ALARM_CREATE_TIMEOUT:
-            alarm_list = self.mano.ns_get_alarm_list(query_filter=self.nfvo_alarm_filter)
-            if len(alarm_list) != 0:
-                break
-            else:
-                LOG.debug('Sleeping %s seconds before querying the MANO again for alarms' % constants.POLL_INTERVAL)
-                sleep(constants.POLL_INTERVAL)
-                elapsed_time += constants.POLL_INTERVAL
-            if elapsed_time == constants.ALARM_CREATE_TIMEOUT:
-                raise TestRunError('No fault alarm created on the NFVO after %s seconds' % elapsed_time)
+        def alarm_created():
+            return self.mano.ns_get_alarm_list(query_filter=self.nfvo_alarm_filter)
+
+        alarm_list = self.wait_until(alarm_created, constants.ALARM_CREATE_TIMEOUT)
+        if alarm_list is None:
+            raise TestRunError('No fault alarm created on the NFVO after %s seconds' % constants.ALARM_CREATE_TIMEOUT)
 
         notification_matched = False
         for alarm in alarm_list:
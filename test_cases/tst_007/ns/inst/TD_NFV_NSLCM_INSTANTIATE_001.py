@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError, Step
@@ -72,7 +71,7 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
                                   terminate_time=self.tc_input.get('terminate_time'),
                                   additional_param=self.tc_input['mano'].get('termination_params'))
         self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
-                                  ns_instance_id=self.ns_instance_id)
+                                  ns_instance_id=self.ns_instance_id, cleanup_group=1)
 
         if operation_status != constants.OPERATION_SUCCESS:
             self.tc_result['events']['instantiate_ns']['details'] = 'Fail'
@@ -83,12 +82,12 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
 
     @Step(name='Verify software images',
           description='Verify that the software images have been successfully added to the image repository managed by '
-                      'the VIM')
+                      'the VIM',
+          depends_on=(step1,))
     def step2(self):
         # --------------------------------------------------------------------------------------------------------------
         # 2. Verify that the software images have been successfully added to the image repository managed by the VIM
@@ -99,7 +98,8 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
             raise TestRunError('Not all VNFCs use the correct images')
 
     @Step(name='Verify allocated resources',
-          description='Verify that the requested resources have been allocated by the VIM according to the descriptors')
+          description='Verify that the requested resources have been allocated by the VIM according to the descriptors',
+          depends_on=(step1,))
     def step3(self):
         # --------------------------------------------------------------------------------------------------------------
         # 3. Verify that the requested resources have been allocated by the VIM according to the descriptors
@@ -113,12 +113,16 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
                                                                             'additional_param': self.tc_input[
                                                                                 'mano'].get('query_params')})
         for vnf_info in self.ns_info_after_instantiation.vnf_info:
-            self.tc_result['resources']['%s (After instantiation)' % vnf_info.vnf_product_name] = {}
-            self.tc_result['resources']['%s (After instantiation)' % vnf_info.vnf_product_name].update(
-                self.mano.get_allocated_vresources(vnf_info.vnf_instance_id, self.tc_input['mano'].get('query_params')))
+            allocated_vresources = self.mano.get_allocated_vresources(vnf_info.vnf_instance_id,
+                                                                      self.tc_input['mano'].get('query_params'))
+            with self.tc_result_lock:
+                self.tc_result['resources']['%s (After instantiation)' % vnf_info.vnf_product_name] = {}
+                self.tc_result['resources']['%s (After instantiation)' % vnf_info.vnf_product_name].update(
+                    allocated_vresources)
 
     @Step(name='Verify VNF instance(s) have been deployed according to the NSD',
-          description='Verify that the VNF instance(s) have been deployed according to the NSD')
+          description='Verify that the VNF instance(s) have been deployed according to the NSD',
+          depends_on=(step1,))
     def step4(self):
         # --------------------------------------------------------------------------------------------------------------
         # 4. Verify that the VNF instance(s) have been deployed according to the NSD
@@ -128,7 +132,8 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
             raise TestRunError('VNF instance(s) have not been deployed according to the NSD')
 
     @Step(name='Verify VNF instance(s) are reachable via the management network',
-          description='Verify that the VNF instance(s) are reachable via the management network')
+          description='Verify that the VNF instance(s) are reachable via the management network',
+          depends_on=(step3,))
     def step5(self):
         # --------------------------------------------------------------------------------------------------------------
         # 5. Verify that the VNF instance(s) are reachable via the management network
@@ -168,7 +173,8 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
         # TODO highest priority at the moment)
 
     @Step(name='Verify NS instantiation was successful',
-          description='Verify that the NFVO indicates NS instantiation operation result as successful')
+          description='Verify that the NFVO indicates NS instantiation operation result as successful',
+          depends_on=(step3,))
     def step8(self):
         # --------------------------------------------------------------------------------------------------------------
         # 8. Verify that the NFVO indicates NS instantiation operation result as successful
@@ -180,7 +186,8 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
                                            % constants.NS_INSTANTIATED)
 
     @Step(name='Verify traffic flows',
-          description='Verify that the NS is successfully instantiated by running the end-to-end functional test')
+          description='Verify that the NS is successfully instantiated by running the end-to-end functional test',
+          depends_on=(step3,))
     def step9(self):
         # --------------------------------------------------------------------------------------------------------------
         # 9. Verify that the NS is successfully instantiated by running the end-to-end functional test
@@ -190,7 +197,7 @@ class TD_NFV_NSLCM_INSTANTIATE_001(TestCase):
                                                                data=self.tc_input['traffic']['traffic_config'])
         self.traffic.configure(traffic_load='NORMAL_TRAFFIC_LOAD', traffic_config=resolved_traffic_config)
 
-        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy)
+        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy, cleanup_group=1)
 
         # Configure stream destination address(es)
         dest_addr_list = self.mano.get_ns_ingress_cp_addr_list(
@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError, Step
@@ -90,8 +89,7 @@ class TD_NFV_NSLCM_INSTANTIATE_NEST_NS_001(TestCase):
         if operation_status != constants.OPERATION_SUCCESS:
             raise TestRunError('Nested NS instantiation operation failed')
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id_nested, time_record_label='nested_ns_boot')
 
     @Step(name='Verify nested NS instantiation was successful',
           description='Verify that the NFVO indicates nested NS instantiation operation result as successful')
@@ -134,7 +132,7 @@ class TD_NFV_NSLCM_INSTANTIATE_NEST_NS_001(TestCase):
                                   terminate_time=self.tc_input.get('terminate_time'),
                                   additional_param=self.tc_input['mano'].get('termination_params'))
         self.register_for_cleanup(index=40, function_reference=self.mano.wait_for_ns_stable_state,
-                                  ns_instance_id=self.ns_instance_id_nesting)
+                                  ns_instance_id=self.ns_instance_id_nesting, cleanup_group=1)
 
         if operation_status != constants.OPERATION_SUCCESS:
             self.tc_result['events']['instantiate_ns']['details'] = 'Fail'
@@ -145,8 +143,7 @@ class TD_NFV_NSLCM_INSTANTIATE_NEST_NS_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id_nesting, time_record_label='nesting_ns_boot')
 
     @Step(name='Verify nesting NS software images',
           description='Verify that the software images of the VNF(s) referenced in the nesting NSD have been '
@@ -282,7 +279,7 @@ class TD_NFV_NSLCM_INSTANTIATE_NEST_NS_001(TestCase):
                                                                data=resolved_traffic_config)
         self.traffic.configure(traffic_load='NORMAL_TRAFFIC_LOAD', traffic_config=resolved_traffic_config)
 
-        self.register_for_cleanup(index=50, function_reference=self.traffic.destroy)
+        self.register_for_cleanup(index=50, function_reference=self.traffic.destroy, cleanup_group=1)
 
         # Configure stream destination address(es)
         dest_addr_list_nested_ns = self.mano.get_ns_ingress_cp_addr_list(
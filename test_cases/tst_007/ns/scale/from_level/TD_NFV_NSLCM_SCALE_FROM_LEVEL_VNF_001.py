@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from api.structures.objects import ScaleVnfData, ScaleToLevelData
@@ -79,7 +78,7 @@ class TD_NFV_NSLCM_SCALE_FROM_LEVEL_VNF_001(TestCase):
                                   terminate_time=self.tc_input.get('terminate_time'),
                                   additional_param=self.tc_input['mano'].get('termination_params'))
         self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
-                                  ns_instance_id=self.ns_instance_id)
+                                  ns_instance_id=self.ns_instance_id, cleanup_group=1)
 
         if operation_status != constants.OPERATION_SUCCESS:
             self.tc_result['events']['instantiate_ns']['details'] = 'Fail'
@@ -90,8 +89,7 @@ class TD_NFV_NSLCM_SCALE_FROM_LEVEL_VNF_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
 
     @Step(name='Verify NS instantiation was successful',
           description='Verify that the NFVO indicates NS instantiation operation result as successful')
@@ -151,8 +149,7 @@ class TD_NFV_NSLCM_SCALE_FROM_LEVEL_VNF_001(TestCase):
         self.tc_result['events']['scale_to_level_ns']['duration'] = self.time_record.duration('scale_to_level_ns')
         self.tc_result['events']['scale_to_level_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='scale_to_level_ns_boot')
 
     @Step(name='Verify NS has scaled',
           description='Verify that the number of VNFC instance(s) has changed for the VNF by querying the VNFM')
@@ -222,8 +219,7 @@ class TD_NFV_NSLCM_SCALE_FROM_LEVEL_VNF_001(TestCase):
         self.tc_result['events']['scale_from_level_ns']['duration'] = self.time_record.duration('scale_from_level_ns')
         self.tc_result['events']['scale_from_level_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='scale_from_level_ns_boot')
 
     @Step(name='Verify NS has scaled',
           description='Verify that the number of VNFC instance(s) has changed for the VNF by querying the VNFM')
@@ -320,7 +316,7 @@ class TD_NFV_NSLCM_SCALE_FROM_LEVEL_VNF_001(TestCase):
                                                                data=self.tc_input['traffic']['traffic_config'])
         self.traffic.configure(traffic_load='NORMAL_TRAFFIC_LOAD', traffic_config=resolved_traffic_config)
 
-        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy)
+        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy, cleanup_group=1)
 
         # Configure stream destination address(es)
         dest_addr_list = self.mano.get_ns_ingress_cp_addr_list(
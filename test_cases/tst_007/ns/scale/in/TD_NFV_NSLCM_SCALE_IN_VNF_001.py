@@ -14,7 +14,6 @@ import logging
 
 from api.generic import constants
 from api.structures.objects import ScaleVnfData, ScaleByStepData
-from time import sleep
 from test_cases import TestCase, TestRunError, Step
 from utils.misc import generate_name
 from utils.net import ping
@@ -78,7 +77,7 @@ class TD_NFV_NSLCM_SCALE_IN_VNF_001(TestCase):
                                   terminate_time=self.tc_input.get('terminate_time'),
                                   additional_param=self.tc_input['mano'].get('termination_params'))
         self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
-                                  ns_instance_id=self.ns_instance_id)
+                                  ns_instance_id=self.ns_instance_id, cleanup_group=1)
 
         if operation_status != constants.OPERATION_SUCCESS:
             self.tc_result['events']['instantiate_ns']['details'] = 'Fail'
@@ -167,8 +166,7 @@ class TD_NFV_NSLCM_SCALE_IN_VNF_001(TestCase):
             if vnf_info.vnf_product_name in self.expected_vnfc_count.keys():
                 self.vnf_info_impacted_list.append(vnf_info)
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='scale_out_ns_boot')
 
     @Step(name='Verify NS has scaled out',
           description='Verify that the additional VNFC instance(s) have been deployed for the VNF by querying the VNFM')
@@ -325,7 +323,7 @@ class TD_NFV_NSLCM_SCALE_IN_VNF_001(TestCase):
                                                                data=self.tc_input['traffic']['traffic_config'])
         self.traffic.configure(traffic_load='NORMAL_TRAFFIC_LOAD', traffic_config=resolved_traffic_config)
 
-        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy)
+        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy, cleanup_group=1)
 
         # Configure stream destination address(es)
         dest_addr_list = self.mano.get_ns_ingress_cp_addr_list(
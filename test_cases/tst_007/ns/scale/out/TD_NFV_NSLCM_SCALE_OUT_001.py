@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from api.structures.objects import ScaleNsData, ScaleNsByStepsData
@@ -74,7 +73,7 @@ class TD_NFV_NSLCM_SCALE_OUT_001(TestCase):
                                   expected_result=constants.OPERATION_SUCCESS, ns_instance_id=self.ns_instance_id,
                                   terminate_time=self.tc_input.get('terminate_time'))
         self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
-                                  ns_instance_id=self.ns_instance_id)
+                                  ns_instance_id=self.ns_instance_id, cleanup_group=1)
 
         if operation_status != constants.OPERATION_SUCCESS:
             self.tc_result['events']['instantiate_ns']['details'] = 'Fail'
@@ -134,8 +133,7 @@ class TD_NFV_NSLCM_SCALE_OUT_001(TestCase):
         self.tc_result['events']['scale_out_ns']['duration'] = self.time_record.duration('scale_out_ns')
         self.tc_result['events']['scale_out_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='scale_out_ns_boot')
 
     @Step(name='Verify additional VNF instance(s) have been deployed',
           description='Verify that the additional VNF instance(s) have been deployed by querying the VNFM')
@@ -234,7 +232,7 @@ class TD_NFV_NSLCM_SCALE_OUT_001(TestCase):
                                                                data=self.tc_input['traffic']['traffic_config'])
         self.traffic.configure(traffic_load='NORMAL_TRAFFIC_LOAD', traffic_config=resolved_traffic_config)
 
-        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy)
+        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy, cleanup_group=1)
 
         # Configure stream destination address(es)
         dest_addr_list = self.mano.get_ns_ingress_cp_addr_list(
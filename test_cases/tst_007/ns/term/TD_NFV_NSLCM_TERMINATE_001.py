@@ -10,8 +10,8 @@
 #
 
 
+import collections
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError, Step
@@ -76,8 +76,7 @@ class TD_NFV_NSLCM_TERMINATE_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
 
     @Step(name='Verify NS instantiation was successful',
           description='Verify that the NFVO indicates NS instantiation operation result as successful')
@@ -131,17 +130,25 @@ class TD_NFV_NSLCM_TERMINATE_001(TestCase):
         # --------------------------------------------------------------------------------------------------------------
         # 4. Verify that all the VNF instance(s) have been terminated by querying the VNFM
         # --------------------------------------------------------------------------------------------------------------
-        # TODO: add this timer in constants
-        LOG.debug('Sleeping 60 seconds to allow MANO to finalize termination of resources')
-        sleep(60)
         LOG.info('Verifying that all the VNF instance(s) have been terminated')
-        for vnf_info in self.ns_info_after_instantiation.vnf_info:
-            vnf_instance_id = vnf_info.vnf_instance_id
-            vnf_info = self.mano.vnf_query(query_filter={'vnf_instance_id': vnf_instance_id,
-                                                         'additional_param': self.tc_input['mano'].get('query_params')})
-            if vnf_info.instantiation_state != constants.VNF_NOT_INSTANTIATED:
-                raise TestRunError('VNF instance %s was not terminated correctly. Expected state was %s but got %s'
-                                   % (vnf_instance_id, constants.VNF_NOT_INSTANTIATED, vnf_info.instantiation_state))
+        instantiation_states = collections.OrderedDict((vnf_info.vnf_instance_id, None)
+                                                       for vnf_info in self.ns_info_after_instantiation.vnf_info)
+
+        def vnf_instances_terminated():
+            for vnf_instance_id, instantiation_state in instantiation_states.items():
+                if instantiation_state != constants.VNF_NOT_INSTANTIATED:
+                    vnf_info = self.mano.vnf_query(query_filter={'vnf_instance_id': vnf_instance_id,
+                                                                 'additional_param': self.tc_input['mano'].get(
+                                                                     'query_params')})
+                    instantiation_states[vnf_instance_id] = vnf_info.instantiation_state
+            return all(instantiation_state == constants.VNF_NOT_INSTANTIATED
+                       for instantiation_state in instantiation_states.values())
+
+        if self.wait_until(vnf_instances_terminated, constants.VNF_TERMINATE_TIMEOUT) is None:
+            for vnf_instance_id, instantiation_state in instantiation_states.items():
+                if instantiation_state != constants.VNF_NOT_INSTANTIATED:
+                    raise TestRunError('VNF instance %s was not terminated correctly. Expected state was %s but got %s'
+                                       % (vnf_instance_id, constants.VNF_NOT_INSTANTIATED, instantiation_state))
 
     @Step(name='Verify allocated resources have been released',
           description='Verify that the resources allocated to the NS and VNF instance(s) have been released by the VIM')
@@ -150,7 +157,8 @@ class TD_NFV_NSLCM_TERMINATE_001(TestCase):
         # 5. Verify that the resources allocated to the NS and VNF instance(s) have been released by the VIM
         # --------------------------------------------------------------------------------------------------------------
         LOG.info('Verifying that the resources allocated to the NS and VNF instance(s) have been released by the VIM')
-        if not self.mano.validate_ns_released_vresources(self.ns_info_after_instantiation):
+        if self.wait_until(lambda: self.mano.validate_ns_released_vresources(self.ns_info_after_instantiation),
+                           constants.COMPUTE_TERMINATE_TIMEOUT) is None:
             raise TestRunError('NS resources have not been released by the VIM')
 
     @Step(name='Verify NS termination was successful',
@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError, Step
@@ -83,8 +82,7 @@ class TD_NFV_NSLCM_TERMINATE_NESTED_NS_001(TestCase):
         if operation_status != constants.OPERATION_SUCCESS:
             raise TestRunError('Nested NS instantiation operation failed')
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id_nested, time_record_label='nested_ns_boot')
 
     @Step(name='Verify nested NS instantiation was successful',
           description='Verify that the NFVO indicates nested NS instantiation operation result as successful')
@@ -138,8 +136,7 @@ class TD_NFV_NSLCM_TERMINATE_NESTED_NS_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id_nesting, time_record_label='nesting_ns_boot')
 
     @Step(name='Verify nesting NS instantiation was successful',
           description='Verify that the NFVO indicates nesting NS instantiation operation result as successful')
@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from api.structures.objects import OperateVnfData
@@ -45,6 +44,10 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
         end-to-end functional test
     13. Trigger the termination of the NS instance on the NFVO
     14. Verify that the NS is terminated and that all resources have been released by the VIM
+
+    If use_fixture_pool is set, the NS is leased from the fixture pool instead of being instantiated. Since the target
+    VNF instance is started again, the NS is handed back to the pool for reuse instead of being terminated, and the
+    termination is not verified.
     """
 
     REQUIRED_APIS = ('mano', 'traffic')
@@ -58,6 +61,10 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
         # --------------------------------------------------------------------------------------------------------------
         # 1. Trigger NS instantiation on the NFVO
         # --------------------------------------------------------------------------------------------------------------
+        if self.tc_input.get('use_fixture_pool'):
+            self.lease_instantiated_ns()
+            return
+
         LOG.info('Triggering NS instantiation on the NFVO')
         self.time_record.START('instantiate_ns')
         self.ns_instance_id, operation_status = self.mano.ns_create_and_instantiate(
@@ -78,7 +85,7 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
                                   terminate_time=self.tc_input.get('terminate_time'),
                                   additional_param=self.tc_input['mano'].get('termination_params'))
         self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
-                                  ns_instance_id=self.ns_instance_id)
+                                  ns_instance_id=self.ns_instance_id, cleanup_group=1)
 
         if operation_status != constants.OPERATION_SUCCESS:
             self.tc_result['events']['instantiate_ns']['details'] = 'Fail'
@@ -89,8 +96,22 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
+
+    def lease_instantiated_ns(self):
+        """
+        This method leases an instantiated NS from the fixture pool instead of instantiating one. Until the NS is handed
+        back in step 13, the lease is released as not reusable, since the target VNF instance may be left stopped.
+        """
+        LOG.info('Leasing an instantiated NS from the fixture pool')
+        self.lease = self.lease_ns(cleanup_index=10, nsd_id=self.tc_input['nsd_id'],
+                                   flavour_id=self.tc_input.get('flavour_id'),
+                                   ns_instantiation_level_id=self.tc_input.get('ns_instantiation_level_id'),
+                                   reusable=False)
+        self.ns_instance_id = self.lease['ns_instance_id']
+
+        self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
+                                  ns_instance_id=self.ns_instance_id, cleanup_group=1)
 
     @Step(name='Verify NS instantiation was successful',
           description='Verify that the NFVO indicates NS instantiation operation result as successful')
@@ -210,8 +231,8 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
         self.tc_result['events']['ns_update_start_vnf']['duration'] = self.time_record.duration('ns_update_start_vnf')
         self.tc_result['events']['ns_update_start_vnf']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to boot' % constants.INSTANCE_BOOT_TIME)
-        sleep(constants.INSTANCE_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, constants.INSTANCE_BOOT_TIME,
+                              time_record_label='ns_update_start_vnf_boot')
 
     @Step(name='Verify target VNF was started',
           description='Verify that the VNF instance operational state on the VNFM is indicated as "started"')
@@ -283,7 +304,7 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
                                                                data=self.tc_input['traffic']['traffic_config'])
         self.traffic.configure(traffic_load='NORMAL_TRAFFIC_LOAD', traffic_config=resolved_traffic_config)
 
-        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy)
+        self.register_for_cleanup(index=30, function_reference=self.traffic.destroy, cleanup_group=1)
 
         # Configure stream destination address(es)
         dest_addr_list = self.mano.get_ns_ingress_cp_addr_list(
@@ -315,6 +336,14 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
         # --------------------------------------------------------------------------------------------------------------
         # 13. Trigger the termination of the NS instance on the NFVO
         # --------------------------------------------------------------------------------------------------------------
+        if self.tc_input.get('use_fixture_pool'):
+            LOG.info('Handing the NS instance back to the fixture pool instead of terminating it')
+            self.unregister_from_cleanup(index=20)
+            self.unregister_from_cleanup(index=10)
+            self.release_ns(self.lease['lease_id'], reusable=True)
+            self.tc_result['events']['terminate_ns']['details'] = 'Handed back to the fixture pool'
+            return
+
         LOG.info('Triggering the termination of the NS instance on the NFVO')
         self.time_record.START('terminate_ns')
         if self.mano.ns_terminate_sync(ns_instance_id=self.ns_instance_id,
@@ -342,6 +371,11 @@ class TD_NFV_NSLCM_UPDATE_START_001(TestCase):
         # --------------------------------------------------------------------------------------------------------------
         # 14. Verify that the NS is terminated and that all resources have been released by the VIM
         # --------------------------------------------------------------------------------------------------------------
+        if self.tc_input.get('use_fixture_pool'):
+            LOG.info('The NS instance was handed back to the fixture pool, so its termination is not verified')
+            LOG.info('%s execution completed successfully' % self.tc_name)
+            return
+
         LOG.info('Verifying that the NS is terminated')
         ns_info_after_termination = self.mano.ns_query(query_filter={'ns_instance_id': self.ns_instance_id,
                                                                      'additional_param': self.tc_input['mano'].get(
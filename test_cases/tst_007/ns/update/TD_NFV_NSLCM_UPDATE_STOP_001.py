@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from api.structures.objects import OperateVnfData
@@ -51,6 +50,10 @@ class TD_NFV_NSLCM_UPDATE_STOP_001(TestCase):
         # --------------------------------------------------------------------------------------------------------------
         # 1. Trigger NS instantiation on the NFVO
         # --------------------------------------------------------------------------------------------------------------
+        if self.tc_input.get('use_fixture_pool'):
+            self.lease_instantiated_ns()
+            return
+
         LOG.info('Triggering NS instantiation on the NFVO')
         self.time_record.START('instantiate_ns')
         self.ns_instance_id, operation_status = self.mano.ns_create_and_instantiate(
@@ -82,8 +85,23 @@ class TD_NFV_NSLCM_UPDATE_STOP_001(TestCase):
         self.tc_result['events']['instantiate_ns']['duration'] = self.time_record.duration('instantiate_ns')
         self.tc_result['events']['instantiate_ns']['details'] = 'Success'
 
-        LOG.debug('Sleeping %s seconds to allow the VDUs to complete first boot' % constants.INSTANCE_FIRST_BOOT_TIME)
-        sleep(constants.INSTANCE_FIRST_BOOT_TIME)
+        self.wait_for_ns_boot(self.ns_instance_id, time_record_label='instantiate_ns_boot')
+
+    def lease_instantiated_ns(self):
+        """
+        This method leases an instantiated NS from the fixture pool instead of instantiating one. The NS is not returned
+        to the pool, since the test case stops one of its VNF instances and terminates it: the pool deletes it when the
+        lease is released.
+        """
+        LOG.info('Leasing an instantiated NS from the fixture pool')
+        lease = self.lease_ns(cleanup_index=10, nsd_id=self.tc_input['nsd_id'],
+                              flavour_id=self.tc_input.get('flavour_id'),
+                              ns_instantiation_level_id=self.tc_input.get('ns_instantiation_level_id'),
+                              reusable=False)
+        self.ns_instance_id = lease['ns_instance_id']
+
+        self.register_for_cleanup(index=20, function_reference=self.mano.wait_for_ns_stable_state,
+                                  ns_instance_id=self.ns_instance_id)
 
     @Step(name='Verify NS instantiation was successful',
           description='Verify that the NFVO indicates NS instantiation operation result as successful')
@@ -212,6 +230,9 @@ class TD_NFV_NSLCM_UPDATE_STOP_001(TestCase):
         self.tc_result['events']['terminate_ns']['details'] = 'Success'
 
         self.unregister_from_cleanup(index=20)
+        if self.tc_input.get('use_fixture_pool'):
+            # The release of the lease makes the fixture pool delete the NS instance ID
+            return
         self.unregister_from_cleanup(index=10)
 
         self.register_for_cleanup(index=10, function_reference=self.mano.ns_delete_id,
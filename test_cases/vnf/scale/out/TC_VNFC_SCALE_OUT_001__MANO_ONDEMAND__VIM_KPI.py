@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError
@@ -161,21 +160,16 @@ class TC_VNFC_SCALE_OUT_001__MANO_ONDEMAND__VIM_KPI(TestCase):
         # - the time it takes the VNF CPU load to increase (caused by the max traffic load)
         # - the time after which the scaling alarm is triggered
         # - the time it takes the VNF to scale out
-        self.time_record.START('scale_out_vnf')
-        elapsed_time = 0
-        while elapsed_time < constants.VNF_SCALE_TIMEOUT:
+        def scale_out_vnf_done():
             vnf_info = self.mano.vnf_query(query_filter={'vnf_instance_id': self.vnf_instance_id,
                                                          'additional_param': self.tc_input['mano'].get('query_params')})
             if len(vnf_info.instantiated_vnf_info.vnfc_resource_info) == sp['default_instances'] + sp['increment']:
-                break
-            else:
-                sleep(constants.POLL_INTERVAL)
-                elapsed_time += constants.POLL_INTERVAL
-            if elapsed_time == constants.VNF_SCALE_TIMEOUT:
-                self.tc_result['scaling_out']['status'] = 'Fail'
-                raise TestRunError('VNFCs not added after traffic load was increased to the maximum')
-
-        self.time_record.END('scale_out_vnf')
+                return vnf_info
+
+        vnf_info = self.wait_until(scale_out_vnf_done, constants.VNF_SCALE_TIMEOUT, time_record_label='scale_out_vnf')
+        if vnf_info is None:
+            self.tc_result['scaling_out']['status'] = 'Fail'
+            raise TestRunError('VNFCs not added after traffic load was increased to the maximum')
 
         self.tc_result['events']['scale_out_vnf']['duration'] = self.time_record.duration('scale_out_vnf')
 
@@ -11,7 +11,6 @@
 
 
 import logging
-from time import sleep
 
 from api.generic import constants
 from test_cases import TestCase, TestRunError
@@ -177,20 +176,15 @@ class TC_VNF_SCALE_OUT_002__MANO_ONDEMAND__VIM_KPI(TestCase):
         # - the time it takes the VNF CPU load to increase (caused by the max traffic load)
         # - the time after which the scaling alarm is triggered
         # - the time it takes the NS to scale out
-        self.time_record.START('scale_out_ns')
-        elapsed_time = 0
-        while elapsed_time < constants.NS_SCALE_TIMEOUT:
+        def scale_out_ns_done():
             ns_info = self.mano.ns_query(query_filter={'ns_instance_id': self.ns_instance_id})
             if len(ns_info.vnf_info_id) == sp['max_instances']:
-                break
-            else:
-                sleep(constants.POLL_INTERVAL)
-                elapsed_time += constants.POLL_INTERVAL
-            if elapsed_time == constants.NS_SCALE_TIMEOUT:
-                self.tc_result['scaling_out']['status'] = 'Fail'
-                raise TestRunError('NS did not scale out to the max')
-
-        self.time_record.END('scale_out_ns')
+                return ns_info
+
+        ns_info = self.wait_until(scale_out_ns_done, constants.NS_SCALE_TIMEOUT, time_record_label='scale_out_ns')
+        if ns_info is None:
+            self.tc_result['scaling_out']['status'] = 'Fail'
+            raise TestRunError('NS did not scale out to the max')
 
         self.tc_result['events']['scale_out_ns']['duration'] = self.time_record.duration('scale_out_ns')
 
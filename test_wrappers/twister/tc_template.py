@@ -10,6 +10,7 @@
 #
 
 
+import json
 import os
 import requests
 from datetime import datetime
@@ -48,16 +49,23 @@ def twister_run():
         _RESULT = 'FAIL'
         return
 
-    # Iterate throught step by step execution and print status
+    # Follow the step by step execution events and print status
     current_step_index = 0
-    while True:
-        response = requests.get(url='http://%s:8080/v1.0/step/%s' % (vnf_lcv_srv, execution_id))
-        if response.status_code == 204:
+    event_name = None
+    response = requests.get(url='http://%s:8080/v1.0/exec/%s/events' % (vnf_lcv_srv, execution_id), stream=True)
+    for line in response.iter_lines():
+        if line.startswith('event: '):
+            event_name = line[len('event: '):]
+            continue
+        if not line.startswith('data: '):
+            continue
+
+        if event_name == 'done':
             print '-' * 32 + '[ %s ]' % datetime.now().strftime('%Y-%m-%d %H:%M:%S') + '-' * 32
             print '=== Test case steps completed ==='
             break
         else:
-            step_details = response.json()
+            step_details = json.loads(line[len('data: '):])
             step_index = step_details['index']
             if step_index != current_step_index:
                 step_name = step_details['name']
@@ -77,6 +85,7 @@ def twister_run():
                 print '   *** TC execution paused. Send the following request to resume:'
                 print '       curl -XPOST http://<IP ADDRESS>:8080/v1.0/step/%s' % execution_id
             current_step_index = step_index
+    response.close()
 
     # Wait for the test case execution to finish
     print '=== Waiting for test case execution to fully finish ==='
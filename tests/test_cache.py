@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import unittest
+
+import mock
+
+from api.adapter.vim import openstack
+from utils import cache
+from utils.cache import LruCache
+
+from test_openstack import build_adapter
+
+
+class LruCacheTest(unittest.TestCase):
+
+    def test_least_recently_used_entry_evicted(self):
+        lru_cache = LruCache('test', max_size=2)
+        lru_cache.put('a', 1)
+        lru_cache.put('b', 2)
+        lru_cache.lookup('a')
+        lru_cache.put('c', 3)
+
+        self.assertEqual((True, 1), lru_cache.lookup('a'))
+        self.assertEqual((False, None), lru_cache.lookup('b'))
+        self.assertEqual((True, 3), lru_cache.lookup('c'))
+
+    def test_negative_entry_expires(self):
+        lru_cache = LruCache('test', max_size=2, negative_ttl=60)
+        load = mock.Mock(return_value=None)
+        with mock.patch.object(cache, 'monotonic', return_value=100):
+            self.assertIsNone(lru_cache.get('missing', load))
+            self.assertIsNone(lru_cache.get('missing', load))
+        self.assertEqual(1, load.call_count)
+
+        with mock.patch.object(cache, 'monotonic', return_value=161):
+            self.assertEqual((False, None), lru_cache.lookup('missing'))
+
+    def test_stats(self):
+        lru_cache = LruCache('test', max_size=2)
+        lru_cache.get('a', lambda key: 1)
+        lru_cache.get('a', lambda key: 1)
+        lru_cache.get('b', lambda key: None)
+
+        self.assertEqual({'hits': 1, 'misses': 2, 'size': 2}, lru_cache.stats())
+
+
+class FlavorCacheWarmUpTest(unittest.TestCase):
+
+    def setUp(self):
+        patchers = [
+            mock.patch.object(openstack, 'FLAVOR_CACHE', LruCache('test_flavor', max_size=10)),
+            mock.patch.object(openstack, '_warmed_up_flavor_scopes', set())
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_falls_back_to_get_when_listing_fails(self):
+        adapter = build_adapter()
+        adapter.nova_client.flavors.list.side_effect = Exception('Forbidden')
+        flavor = mock.Mock(vcpus=1, ram=512, disk=1)
+        flavor.name = 'm1.tiny'
+        adapter.nova_client.flavors.get.return_value = flavor
+
+        self.assertEqual({'name': 'm1.tiny', 'vcpus': 1, 'ram': 512, 'disk': 1}, adapter.flavor_get('1'))
+        adapter.flavor_get('2')
+
+        self.assertEqual(1, adapter.nova_client.flavors.list.call_count)
+        self.assertEqual([mock.call('1'), mock.call('2')], adapter.nova_client.flavors.get.call_args_list)
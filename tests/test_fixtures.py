@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import itertools
+import threading
+import time
+import unittest
+
+import mock
+
+from api.generic import constants
+from rest_server import fixtures
+from rest_server.fixtures import FIXTURES_DOCUMENT, FixturePool
+
+MANO_CONFIG = {'type': 'tacker', 'name': 'tacker1', 'adapter_config': {'username': 'admin', 'password': 'secret'}}
+
+
+class FakeStore(object):
+
+    def __init__(self):
+        self.documents = {}
+
+    def get_all(self, document):
+        return dict(self.documents.get(document, {}))
+
+    def set(self, document, key, value):
+        self.documents.setdefault(document, {})[key] = value
+
+    def delete(self, document, key):
+        self.documents.get(document, {}).pop(key, None)
+
+
+class FakeMano(object):
+    """
+    MANO shared by all the adapters the pool constructs, recording the state of the NS instances.
+    """
+
+    def __init__(self):
+        self.ns_states = {}
+        self.deleted = []
+        self.terminated = []
+        self.ids = itertools.count()
+        self.lock = threading.Lock()
+
+    def ns_create_and_instantiate(self, **kwargs):
+        with self.lock:
+            ns_instance_id = 'ns-%s' % next(self.ids)
+            self.ns_states[ns_instance_id] = constants.NS_INSTANTIATED
+        return ns_instance_id, constants.OPERATION_SUCCESS
+
+    def ns_query(self, query_filter):
+        return mock.Mock(ns_state=self.ns_states[query_filter['ns_instance_id']])
+
+    def ns_terminate_and_delete(self, ns_instance_id, additional_param=None):
+        self.terminated.append(ns_instance_id)
+        self.ns_delete_id(ns_instance_id)
+
+    def ns_delete_id(self, ns_instance_id):
+        self.deleted.append(ns_instance_id)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError('Condition not met in %s seconds' % timeout)
+        time.sleep(0.01)
+
+
+class FixturePoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mano = FakeMano()
+        patcher = mock.patch.object(fixtures, '_construct_mano', return_value=self.mano)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = FakeStore()
+        self.pool = FixturePool(lambda: 1, store=self.store, get_mano_config={'tacker1': MANO_CONFIG}.get)
+
+    def idle_ns_instance_ids(self):
+        return [ns_instance_id for key_state in self.pool.state() for ns_instance_id in key_state['idle']]
+
+    def test_reusable_lease_is_reused(self):
+        lease = self.pool.lease('execution-1', MANO_CONFIG, 'nsd', timeout=5)
+        self.pool.release(lease.lease_id, reusable=True)
+        wait_for(lambda: lease.fixture.ns_instance_id in self.idle_ns_instance_ids())
+
+        self.assertEqual(lease.fixture.ns_instance_id,
+                         self.pool.lease('execution-2', MANO_CONFIG, 'nsd', timeout=5).fixture.ns_instance_id)
+        self.assertNotIn(lease.fixture.ns_instance_id, self.mano.terminated)
+
+    def test_terminated_lease_is_only_deleted(self):
+        lease = self.pool.lease('execution-1', MANO_CONFIG, 'nsd', timeout=5)
+        self.mano.ns_states[lease.fixture.ns_instance_id] = constants.NS_NOT_INSTANTIATED
+        self.pool.release(lease.lease_id, reusable=False)
+        wait_for(lambda: lease.fixture.ns_instance_id in self.mano.deleted)
+
+        self.assertEqual([], self.mano.terminated)
+        wait_for(lambda: lease.fixture.ns_instance_id not in self.store.get_all(FIXTURES_DOCUMENT))
+
+    def test_store_holds_no_credentials(self):
+        lease = self.pool.lease('execution-1', MANO_CONFIG, 'nsd', timeout=5)
+        wait_for(lambda: len(self.store.get_all(FIXTURES_DOCUMENT)) == 2)
+
+        record = self.store.get_all(FIXTURES_DOCUMENT)[lease.fixture.ns_instance_id]
+        self.assertEqual({'key', 'created'}, set(record.keys()))
+        self.assertNotIn('secret', repr(self.store.documents))
+
+    def test_drain_stored_resolves_mano_config(self):
+        self.mano.ns_states.update({'ns-left': constants.NS_INSTANTIATED, 'ns-orphan': constants.NS_INSTANTIATED})
+        self.store.set(FIXTURES_DOCUMENT, 'ns-left', {'key': ['tacker1', 'nsd', None, None], 'created': 0})
+        self.store.set(FIXTURES_DOCUMENT, 'ns-orphan', {'key': ['removed', 'nsd', None, None], 'created': 0})
+
+        self.assertEqual(1, self.pool.drain_stored())
+        wait_for(lambda: 'ns-left' in self.mano.terminated)
+        wait_for(lambda: list(self.store.get_all(FIXTURES_DOCUMENT).keys()) == ['ns-orphan'])
@@ -0,0 +1,38 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import unittest
+
+import mock
+
+from api.adapter import keystone
+
+
+class SharedSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(keystone, '_create_shared_session', side_effect=lambda **kwargs: mock.Mock())
+        self.create_shared_session = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(keystone._shared_sessions.clear)
+
+    def test_session_shared_per_credentials(self):
+        session = keystone.get_shared_session(auth_url='http://keystone:5000/v3', username='admin', password='secret')
+        self.assertIs(session, keystone.get_shared_session(auth_url='http://keystone:5000/v3', username='admin',
+                                                           password='secret'))
+        self.assertIsNot(session, keystone.get_shared_session(auth_url='http://keystone:5000/v3', username='admin',
+                                                              password='changed'))
+        self.assertEqual(2, self.create_shared_session.call_count)
+
+    def test_password_not_in_registry(self):
+        keystone.get_shared_session(auth_url='http://keystone:5000/v3', username='admin', password='secret')
+        self.assertFalse(any('secret' in repr(key) for key in keystone._shared_sessions))
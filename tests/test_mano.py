@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import threading
+import time
+import unittest
+
+from api.generic.mano import Mano
+
+
+class VerifyAllTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mano = Mano('dummy', generic_config={}, adapter_config={})
+        self.mano.MAX_PARALLEL_VALIDATIONS = 2
+        self.verified = []
+        self.lock = threading.Lock()
+
+    def verify(self, item):
+        delay, result = item
+        time.sleep(delay)
+        with self.lock:
+            self.verified.append(item)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def test_all_valid(self):
+        self.assertTrue(self.mano.verify_all(self.verify, [(0, True)] * 5))
+        self.assertEqual(5, len(self.verified))
+
+    def test_cancels_pending_calls_after_failure(self):
+        items = [(0, False), (0.2, True)] + [(0, True)] * 6
+        self.assertFalse(self.mano.verify_all(self.verify, items))
+        self.assertLess(len(self.verified), len(items))
+
+    def test_first_failure_in_item_order(self):
+        # The exception completes first, but the False result comes first in the order of the items
+        items = [(0.2, False), (0, ValueError('invalid'))]
+        self.assertFalse(self.mano.verify_all(self.verify, items))
+
+        items = [(0.2, ValueError('invalid')), (0, False)]
+        self.assertRaises(ValueError, self.mano.verify_all, self.verify, items)
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import unittest
+
+import mock
+
+from api.adapter.vim import openstack
+from api.adapter.vim.openstack import OpenstackVimAdapter
+
+
+def build_adapter():
+    adapter = OpenstackVimAdapter.__new__(OpenstackVimAdapter)
+    adapter.auth_url = 'http://keystone:5000/v3'
+    adapter.project_name = 'vnflcv'
+    clients = {'compute': mock.Mock(), 'network': mock.Mock(), 'image': mock.Mock()}
+    adapter.shared_session = mock.Mock()
+    adapter.shared_session.get_client.side_effect = clients.get
+    return adapter
+
+
+def list_ports(retrieve_all, device_id):
+    return iter([{'ports': [{'id': 'port-%s' % server_id, 'device_id': server_id} for server_id in device_id]}])
+
+
+class DevicePortListTest(unittest.TestCase):
+
+    def test_ports_listed_in_chunks(self):
+        adapter = build_adapter()
+        adapter.neutron_client.list_ports.side_effect = list_ports
+        server_ids = ['server-%s' % index for index in range(openstack.PORT_QUERY_CHUNK_SIZE * 2 + 1)]
+
+        ports = adapter.device_port_list(server_ids)
+
+        self.assertEqual(3, adapter.neutron_client.list_ports.call_count)
+        self.assertTrue(all(len(call[1]['device_id']) <= openstack.PORT_QUERY_CHUNK_SIZE
+                            for call in adapter.neutron_client.list_ports.call_args_list))
+        self.assertEqual(server_ids, list(ports.keys()))
+        self.assertEqual([{'id': 'port-server-0', 'device_id': 'server-0'}], ports['server-0'])
+
+
+class ServerListTest(unittest.TestCase):
+
+    def test_limit_passed_to_nova(self):
+        adapter = build_adapter()
+        adapter.server_list(limit=-1)
+        adapter.nova_client.servers.list.assert_called_once_with(search_opts=None, limit=-1)
+
+
+class QueryVirtualisedComputeResourcesTest(unittest.TestCase):
+
+    def test_servers_listed_once_and_joined(self):
+        adapter = build_adapter()
+        nova_client = adapter.nova_client
+        nova_client.servers.list.return_value = [mock.Mock(id='server-%s' % index) for index in range(3)]
+        adapter.neutron_client.list_ports.side_effect = list_ports
+
+        with mock.patch.object(OpenstackVimAdapter, 'server_details', side_effect=lambda server: server.id), \
+                mock.patch.object(OpenstackVimAdapter, 'build_virtual_compute',
+                                  side_effect=lambda compute_id, details, ports: (details, ports)):
+            virtual_computes = adapter.query_virtualised_compute_resources(['server-2', 'missing', 'server-0'])
+
+        nova_client.servers.list.assert_called_once_with(search_opts=None, limit=-1)
+        self.assertFalse(nova_client.servers.get.called)
+        self.assertEqual(['server-2', 'server-0'], list(virtual_computes.keys()))
+        self.assertEqual(('server-2', [{'id': 'port-server-2', 'device_id': 'server-2'}]),
+                         virtual_computes['server-2'])
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import unittest
+
+import mock
+
+from utils import polling
+
+
+class FakeClock(object):
+    """
+    Clock advanced by the waits of the poller instead of real sleeps.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        clock = self
+
+        class FakeEvent(object):
+
+            def wait(self, timeout):
+                clock.sleeps.append(timeout)
+                clock.now += timeout
+
+            def set(self):
+                pass
+
+            def clear(self):
+                pass
+
+        self.event_class = FakeEvent
+
+    def monotonic(self):
+        return self.now
+
+
+class PollTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patchers = [
+            mock.patch.object(polling, 'monotonic', self.clock.monotonic),
+            mock.patch.object(polling, 'Event', self.clock.event_class),
+            mock.patch.object(polling.random, 'uniform', return_value=1)
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_interval_backs_off_up_to_poll_interval(self):
+        poll_once = mock.Mock(side_effect=[(False, 'PROCESSING')] * 5 + [(True, 'SUCCESSFULLY_DONE')])
+
+        self.assertEqual(('SUCCESSFULLY_DONE', 6), polling._poll(poll_once, max_wait_time=60, poll_interval=3))
+        self.assertEqual([0.5, 1, 2, 3, 3], self.clock.sleeps)
+
+    def test_deadline_stops_polling(self):
+        poll_once = mock.Mock(return_value=(False, 'PROCESSING'))
+
+        self.assertEqual(('PROCESSING', 5), polling._poll(poll_once, max_wait_time=5, poll_interval=2))
+        self.assertEqual([0.5, 1, 2, 1.5], self.clock.sleeps)
+
+    def test_wait_until_timeout(self):
+        condition = mock.Mock(return_value=False, __name__='condition')
+
+        self.assertIsNone(polling.wait_until(condition, timeout=1, poll_interval=1))
+        self.assertEqual(3, condition.call_count)
+        self.assertEqual([0.5, 0.5], self.clock.sleeps)
+
+    def test_all_of_and_any_of(self):
+        self.assertEqual([1, 2], polling.all_of(lambda: 1, lambda: 2)())
+        self.assertIsNone(polling.all_of(lambda: 1, lambda: 0)())
+        self.assertEqual(2, polling.any_of(lambda: 0, lambda: 2)())
+        self.assertIsNone(polling.any_of(lambda: 0, lambda: None)())
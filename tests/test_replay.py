@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from api.adapter import replay
+from api.adapter.replay import Cassette, RecordingAdapter, ReplayAdapterError, ReplayManoAdapter
+
+
+class FakeManoAdapter(object):
+
+    def ns_create_id(self, nsd_id, ns_name, ns_description):
+        return 'ns-%s' % ns_name
+
+    def ns_query(self, query_filter):
+        raise ReplayAdapterError('NS %s not found' % query_filter['ns_instance_id'])
+
+    def get_operation_status(self, lifecycle_operation_occurrence_id):
+        return lambda: 'Successfully done'
+
+
+class CassetteTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.addCleanup(replay.restore_timing)
+        self.cassette_path = os.path.join(directory, 'cassette.pkl.gz')
+
+    def test_round_trip(self):
+        cassette = Cassette()
+        mano = RecordingAdapter(FakeManoAdapter(), cassette, 'mano')
+        mano.ns_create_id('nsd', 'ns1', 'first')
+        mano.ns_create_id('nsd', 'ns2', 'second')
+        self.assertRaises(ReplayAdapterError, mano.ns_query, {'ns_instance_id': 'ns3'})
+        mano.get_operation_status('op1')
+        cassette.save(self.cassette_path)
+
+        mano = ReplayManoAdapter(self.cassette_path, time_scale=1)
+
+        # Calls with the same arguments are matched first, the others in recording order
+        self.assertEqual('ns-ns2', mano.ns_create_id('nsd', 'ns2', 'second'))
+        self.assertEqual('ns-ns1', mano.ns_create_id('nsd', 'ns-generated', 'first'))
+        self.assertRaises(ReplayAdapterError, mano.ns_query, {'ns_instance_id': 'ns3'})
+        # The result that could not be pickled is replayed as an error
+        self.assertRaises(ReplayAdapterError, mano.get_operation_status, 'op1')
+        self.assertRaises(ReplayAdapterError, mano.ns_create_id, 'nsd', 'ns1', 'first')
+
+    def test_unsupported_version(self):
+        cassette = Cassette()
+        cassette.save(self.cassette_path)
+
+        with mock.patch.object(replay, 'CASSETTE_VERSION', replay.CASSETTE_VERSION + 1):
+            self.assertRaises(ReplayAdapterError, Cassette.load, self.cassette_path)
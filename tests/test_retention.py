@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from rest_server import retention
+from rest_server.retention import RetentionPolicy
+
+
+class RetentionPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.evict = mock.Mock()
+        self.limits = (2, None)
+        self.policy = RetentionPolicy(self.evict, lambda: self.limits)
+
+    def test_least_recently_used_evicted_above_max_entries(self):
+        self.policy.completed('1', '/tmp/1.json')
+        self.policy.completed('2', '/tmp/2.json')
+        self.policy.touch('1')
+        self.policy.completed('3', '/tmp/3.json')
+
+        self.evict.assert_called_once_with('2')
+        self.assertTrue(self.policy.is_evicted('2'))
+        self.assertFalse(self.policy.is_evicted('1'))
+
+    def test_expired_evicted(self):
+        self.limits = (None, 60)
+        with mock.patch.object(retention.time, 'time', return_value=1000):
+            self.policy.completed('1', '/tmp/1.json')
+        with mock.patch.object(retention.time, 'time', return_value=1030):
+            self.policy.completed('2', '/tmp/2.json')
+
+        with mock.patch.object(retention.time, 'time', return_value=1070):
+            self.policy.prune()
+
+        self.evict.assert_called_once_with('1')
+
+    def test_evicted_entries_bounded(self):
+        self.limits = (0, None)
+        with mock.patch.object(retention, 'MAX_EVICTED_ENTRIES', 2):
+            for execution_id in ['1', '2', '3']:
+                self.policy.completed(execution_id, '/tmp/%s.json' % execution_id)
+
+        self.assertFalse(self.policy.is_evicted('1'))
+        self.assertTrue(self.policy.is_evicted('3'))
+
+    def test_load_evicted(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        json_file_path = os.path.join(directory, '1.json')
+        with open(json_file_path, 'w') as json_file:
+            json.dump({'overall_status': 'PASSED'}, json_file)
+        self.limits = (0, None)
+
+        self.policy.completed('1', json_file_path)
+        self.policy.completed('2', os.path.join(directory, 'missing.json'))
+
+        self.assertEqual({'overall_status': 'PASSED'}, self.policy.load('1'))
+        self.assertIsNone(self.policy.load('2'))
+        self.assertIsNone(self.policy.load('3'))
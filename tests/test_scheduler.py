@@ -0,0 +1,75 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import unittest
+
+import mock
+
+from rest_server.scheduler import Scheduler
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.started = []
+        self.scheduler = Scheduler(lambda: {'env': 1})
+
+    def submit(self, execution_id, resources, priority=0):
+        self.scheduler.submit(execution_id, resources, lambda: self.started.append(execution_id), priority=priority)
+
+    def test_limit_per_resource(self):
+        self.submit('1', [('env', 'lab1')])
+        self.submit('2', [('env', 'lab1')])
+        self.submit('3', [('env', 'lab2')])
+
+        self.assertEqual(['1', '3'], self.started)
+        self.assertEqual(['2'], self.scheduler.queued())
+
+        self.scheduler.release('1')
+        self.assertEqual(['1', '3', '2'], self.started)
+
+    def test_priority_then_fifo(self):
+        self.submit('1', [('env', 'lab1')])
+        self.submit('2', [('env', 'lab1')])
+        self.submit('3', [('env', 'lab1')], priority=1)
+        self.submit('4', [('env', 'lab1')])
+
+        self.assertEqual(['3', '2', '4'], self.scheduler.queued())
+        self.assertEqual(2, self.scheduler.position('2'))
+
+        for execution_id in ['1', '3', '2']:
+            self.scheduler.release(execution_id)
+        self.assertEqual(['1', '3', '2', '4'], self.started)
+
+    def test_resource_limit_overrides_type_limit(self):
+        self.scheduler.set_resource_limit(('suite', 's1'), 1)
+        self.submit('1', [('suite', 's1'), ('env', 'lab1')])
+        self.submit('2', [('suite', 's1'), ('env', 'lab2')])
+        self.submit('3', [('suite', 's2'), ('env', 'lab3')])
+
+        self.assertEqual(['1', '3'], self.started)
+
+        self.scheduler.clear_resource_limit(('suite', 's1'))
+        self.scheduler.dispatch()
+        self.assertEqual(['1', '3', '2'], self.started)
+
+    def test_failed_start_releases_resources(self):
+        start_failed = mock.Mock()
+        scheduler = Scheduler(lambda: {'env': 1}, start_failed=start_failed)
+        error = Exception('Unable to fork')
+
+        scheduler.submit('1', [('env', 'lab1')], mock.Mock(side_effect=error))
+        start_func = mock.Mock()
+        scheduler.submit('2', [('env', 'lab1')], start_func)
+
+        start_failed.assert_called_once_with('1', error)
+        start_func.assert_called_once_with()
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import threading
+import time
+import unittest
+
+import mock
+
+from api.generic import constants
+from api.generic.mano import Mano
+from test_cases.tst_007.ns.inst.TD_NFV_NSLCM_INSTANTIATE_001 import TD_NFV_NSLCM_INSTANTIATE_001
+
+VERIFICATION_TIME = 0.3
+
+
+class StepDagTest(unittest.TestCase):
+    """
+    Verifies that the steps of TD_NFV_NSLCM_INSTANTIATE_001 that only depend on step 1 call the MANO concurrently.
+    """
+
+    def setUp(self):
+        self.intervals = {}
+        self.lock = threading.Lock()
+
+    def verification(self, name):
+        def verify(*args, **kwargs):
+            start_time = time.time()
+            time.sleep(VERIFICATION_TIME)
+            with self.lock:
+                self.intervals[name] = (start_time, time.time())
+            return True
+        return verify
+
+    def test_dependent_steps_overlap(self):
+        tc = TD_NFV_NSLCM_INSTANTIATE_001({'mano': {'type': 'dummy'}, 'nsd_id': 'nsd'})
+        tc.REQUIRED_APIS = ('mano',)
+        tc.steps = [step for step in tc.steps if step.index <= 4]
+        tc.initialize_events()
+        tc.initialize_steps()
+
+        with mock.patch.object(Mano, 'ns_create_and_instantiate', return_value=('ns', constants.OPERATION_SUCCESS)), \
+                mock.patch.object(Mano, 'ns_query', return_value=mock.Mock(vnf_info=[])), \
+                mock.patch.object(Mano, 'verify_ns_sw_images', side_effect=self.verification('step2')), \
+                mock.patch.object(Mano, 'validate_ns_allocated_vresources', side_effect=self.verification('step3')), \
+                mock.patch.object(Mano, 'verify_vnf_nsd_mapping', side_effect=self.verification('step4')):
+            tc.build_apis()
+            tc.run()
+
+        self.assertEqual(['PASS'] * 4, [tc.tc_result['steps'][index]['status'] for index in range(1, 5)])
+        self.assertEqual(['step2', 'step3', 'step4'], sorted(self.intervals))
+        latest_start = max(start_time for start_time, _ in self.intervals.values())
+        earliest_end = min(end_time for _, end_time in self.intervals.values())
+        self.assertLess(latest_start, earliest_end)
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from rest_server.store import JsonFileStore, StoreError
+
+
+class JsonFileStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.store = JsonFileStore(self.directory, flush_delay=0)
+
+    def read_document(self, document):
+        with open(os.path.join(self.directory, '%s.json' % document), 'r') as json_file:
+            return json.load(json_file)
+
+    def test_set_flushed_to_disk(self):
+        self.store.set('mano', 'tacker', {'type': 'tacker'})
+
+        self.assertEqual({'tacker': {'type': 'tacker'}}, self.read_document('mano'))
+        self.assertEqual([], [name for name in os.listdir(self.directory) if name.endswith('.tmp')])
+
+    def test_delete_flushed_to_disk(self):
+        self.store.set('mano', 'tacker', {'type': 'tacker'})
+
+        self.assertEqual({'type': 'tacker'}, self.store.delete('mano', 'tacker'))
+        self.assertEqual({}, self.read_document('mano'))
+
+    def test_external_edit_reloaded(self):
+        self.store.set('mano', 'tacker', {'type': 'tacker'})
+        with open(os.path.join(self.directory, 'mano.json'), 'w') as json_file:
+            json.dump({'rift': {'type': 'rift'}}, json_file)
+        os.utime(os.path.join(self.directory, 'mano.json'), (0, 0))
+
+        self.assertEqual({'rift': {'type': 'rift'}}, self.store.get_all('mano'))
+
+    def test_write_error_raised_and_retried(self):
+        with mock.patch.object(self.store, '_write', side_effect=IOError('No space left on device')):
+            self.assertRaises(StoreError, self.store.set, 'mano', 'tacker', {'type': 'tacker'})
+            self.assertRaises(IOError, self.store.flush)
+
+        # The change stays pending and is written by the next flush
+        self.assertEqual({'type': 'tacker'}, self.store.get('mano', 'tacker'))
+        self.store.flush()
+        self.assertEqual({'tacker': {'type': 'tacker'}}, self.read_document('mano'))
@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import unittest
+
+import mock
+
+from utils import tracing
+
+
+def query(adapter, resource_id, query_filter=None):
+    pass
+
+
+class TraceCallTest(unittest.TestCase):
+
+    def tearDown(self):
+        tracing.deactivate()
+
+    def test_digest_not_computed_without_active_buffer(self):
+        with mock.patch.object(tracing, 'args_digest') as args_digest:
+            tracing.trace_call('mano', query, (object(), 'vnf'), {}, 0, 0.1, None)
+        self.assertFalse(args_digest.called)
+
+    def test_digest_is_bounded(self):
+        trace_buffer = tracing.TraceBuffer()
+        tracing.activate(trace_buffer)
+        tracing.trace_call('mano', query, (object(), 'vnf'), {'query_filter': 'x' * 10 ** 6}, 0, 0.1, None)
+        tracing.trace_call('mano', query, (object(), 'vnf'), {'query_filter': 'x' * 10 ** 6}, 0, 0.1, None)
+        tracing.trace_call('mano', query, (object(), 'other'), {}, 0, 0.1, None)
+
+        digests = [span.args_digest for span in trace_buffer.spans]
+        self.assertEqual(tracing.ARGS_DIGEST_LENGTH, len(digests[0]))
+        self.assertEqual(digests[0], digests[1])
+        self.assertNotEqual(digests[0], digests[2])
@@ -21,6 +21,7 @@ VIM_TYPES = ['openstack']
 EM_TYPES = ['tacker']
 TRAFFIC_TYPES = ['stc']
 VNF_TYPES = ['ubuntu']
+REPORTS_PAGE_SIZE = 100
 
 
 # os.chdir(os.path.dirname(__file__))
@@ -1119,9 +1120,17 @@ def kibana():
 
 @route('/reports/')
 def get_reports_list():
-    reports = requests.get(url='http://localhost:8080/v1.0/reports?type=html')
+    try:
+        page = max(int(request.query.page or 1), 1)
+    except ValueError:
+        page = 1
+    offset = (page - 1) * REPORTS_PAGE_SIZE
+    reports = requests.get(url='http://localhost:8080/v1.0/reports?type=html&limit=%s&offset=%s'
+                               % (REPORTS_PAGE_SIZE, offset))
     reports_list = reports.json()['reports']
-    return template('reports.html', reports_list=reports_list)
+    reports_total = reports.json().get('total', len(reports_list))
+    return template('reports.html', reports_list=reports_list, offset=offset, page=page,
+                    has_next_page=offset + len(reports_list) < reports_total)
 
 
 @route('/reports/<report_name>')
@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+from collections import OrderedDict
+from threading import Lock
+
+from monotonic import monotonic
+
+from utils.metrics import REGISTRY
+
+# Interval of time in seconds during which a key that was not found is not looked up again
+NEGATIVE_CACHE_TTL = 60
+
+
+class LruCache(object):
+    """
+    Size-bounded cache evicting the least recently used entries. Besides values, it holds the keys that were not found,
+    for NEGATIVE_CACHE_TTL seconds. The lookups are counted in the vnflcv_cache_lookups_total metric, labeled with the
+    name of the cache and the result of the lookup, and are also available from stats() for the tools that report
+    on a single process.
+    """
+
+    def __init__(self, name, max_size, negative_ttl=NEGATIVE_CACHE_TTL):
+        self.name = name
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """
+        This method looks up the key.
+
+        :return:    Tuple containing a boolean telling if the key is cached and the cached value, which is None if the
+                    key is known not to exist.
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                value, expiration_time = entry
+                if expiration_time is None or expiration_time > monotonic():
+                    self.entries[key] = entry
+                    self.hits += 1
+                    result = 'hit' if value is not None else 'negative_hit'
+                    REGISTRY.inc('vnflcv_cache_lookups_total', cache=self.name, result=result)
+                    return True, value
+            self.misses += 1
+        REGISTRY.inc('vnflcv_cache_lookups_total', cache=self.name, result='miss')
+        return False, None
+
+    def put(self, key, value):
+        """
+        This method caches the value of the key. A value of None records that the key does not exist.
+        """
+        expiration_time = monotonic() + self.negative_ttl if value is None else None
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expiration_time)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def get(self, key, load):
+        """
+        This method returns the cached value of the key, calling load to get it if it is not cached.
+
+        :param load:    Function taking the key as argument and returning its value, or None if the key does not exist.
+        :return:        Value of the key, or None if the key does not exist.
+        """
+        cached, value = self.lookup(key)
+        if cached:
+            return value
+        value = load(key)
+        self.put(key, value)
+        return value
+
+    def stats(self):
+        """
+        This method returns the statistics of the cache.
+
+        :return:    Dictionary containing the number of hits, including the negative ones, misses and cached entries.
+        """
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.entries)
+            }
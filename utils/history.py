@@ -0,0 +1,320 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import glob
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from threading import Lock
+
+HISTORY_DIR = '/var/log/vnflcv'
+HISTORY_DB_NAME = 'history.db'
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Columns of the executions table that can be used for filtering the history
+FILTER_COLUMNS = ['tc_name', 'run_id', 'suite_name', 'status']
+
+# Extensions of the files generated for each execution
+REPORT_EXTENSIONS = ['txt', 'html', 'json', 'log']
+
+# Columns of the reports table that can be used for filtering the report catalogue
+REPORT_FILTER_COLUMNS = ['tc_name', 'status']
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS executions ('
+    '    execution_id TEXT PRIMARY KEY,'
+    '    tc_name TEXT,'
+    '    run_id TEXT,'
+    '    suite_name TEXT,'
+    '    status TEXT,'
+    '    error_info TEXT,'
+    '    start_time TEXT,'
+    '    end_time TEXT,'
+    '    duration REAL,'
+    '    mano_type TEXT,'
+    '    vim_type TEXT,'
+    '    report_name TEXT)',
+    'CREATE TABLE IF NOT EXISTS steps ('
+    '    execution_id TEXT,'
+    '    step_index TEXT,'
+    '    name TEXT,'
+    '    description TEXT,'
+    '    status TEXT,'
+    '    duration REAL)',
+    'CREATE TABLE IF NOT EXISTS events ('
+    '    execution_id TEXT,'
+    '    name TEXT,'
+    '    duration REAL,'
+    '    details TEXT)',
+    'CREATE TABLE IF NOT EXISTS reports ('
+    '    report_name TEXT,'
+    '    extension TEXT,'
+    '    tc_name TEXT,'
+    '    status TEXT,'
+    '    duration REAL,'
+    '    size INTEGER,'
+    '    PRIMARY KEY (extension, report_name))',
+    'CREATE INDEX IF NOT EXISTS executions_tc_name ON executions (tc_name)',
+    'CREATE INDEX IF NOT EXISTS executions_run_id ON executions (run_id)',
+    'CREATE INDEX IF NOT EXISTS executions_suite_name ON executions (suite_name)',
+    'CREATE INDEX IF NOT EXISTS executions_status ON executions (status)',
+    'CREATE INDEX IF NOT EXISTS executions_start_time ON executions (start_time)',
+    'CREATE INDEX IF NOT EXISTS steps_execution_id ON steps (execution_id)',
+    'CREATE INDEX IF NOT EXISTS events_execution_id ON events (execution_id)',
+    'CREATE INDEX IF NOT EXISTS reports_tc_name ON reports (tc_name)',
+    'CREATE INDEX IF NOT EXISTS reports_status ON reports (status)'
+]
+
+# Paths of the databases whose journal mode and schema were already set up by this process
+_initialized_databases = set()
+_initialization_lock = Lock()
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+def connect():
+    """
+    This function opens a connection to the history database. The first connection of the process to the database
+    creates it if it does not exist and sets it up.
+    """
+    database_path = os.path.join(HISTORY_DIR, HISTORY_DB_NAME)
+    connection = sqlite3.connect(database_path, timeout=30)
+    connection.row_factory = sqlite3.Row
+    with _initialization_lock:
+        if database_path not in _initialized_databases:
+            connection.execute('PRAGMA journal_mode=WAL')
+            for statement in SCHEMA:
+                connection.execute(statement)
+            _initialized_databases.add(database_path)
+    return connection
+
+
+def _duration(tc_result):
+    try:
+        tc_start_time = datetime.strptime(tc_result['tc_start_time'], TIME_FORMAT)
+        tc_end_time = datetime.strptime(tc_result['tc_end_time'], TIME_FORMAT)
+    except (KeyError, ValueError):
+        return None
+    return (tc_end_time - tc_start_time).total_seconds()
+
+
+def record_execution(execution_id, report_name, tc_exec_request, tc_input, tc_result):
+    """
+    This function stores the execution, its steps and its events in the history database.
+    """
+    try:
+        connection = connect()
+    except sqlite3.Error as e:
+        LOG.debug('Unable to open the execution history database')
+        LOG.exception(e)
+        return
+
+    try:
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO executions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                               (execution_id, tc_exec_request.get('tc_name'),
+                                str(tc_exec_request.get('run_id', '')).strip(), tc_exec_request.get('suite_name'),
+                                tc_result.get('overall_status'), str(tc_result.get('error_info')),
+                                tc_result.get('tc_start_time'), tc_result.get('tc_end_time'), _duration(tc_result),
+                                tc_input.get('mano', {}).get('type'), tc_input.get('vim', {}).get('type'),
+                                report_name))
+
+            connection.execute('DELETE FROM steps WHERE execution_id = ?', (execution_id,))
+            for step_index, step_details in tc_result.get('steps', {}).items():
+                connection.execute('INSERT INTO steps VALUES (?, ?, ?, ?, ?, ?)',
+                                   (execution_id, str(step_index), step_details.get('name'),
+                                    step_details.get('description'), step_details.get('status'),
+                                    step_details.get('duration')))
+
+            connection.execute('DELETE FROM events WHERE execution_id = ?', (execution_id,))
+            for event_name, event_details in tc_result.get('events', {}).items():
+                connection.execute('INSERT INTO events VALUES (?, ?, ?, ?)',
+                                   (execution_id, event_name, event_details.get('duration'),
+                                    json.dumps(event_details.get('details'))))
+    except sqlite3.Error as e:
+        LOG.debug('Unable to record execution %s in the history database' % execution_id)
+        LOG.exception(e)
+    finally:
+        connection.close()
+
+
+def query_executions(filters=None, start_after=None, start_before=None, limit=DEFAULT_PAGE_SIZE, offset=0):
+    """
+    This function returns one page of executions from the history, most recent first.
+
+    :param filters:         Dictionary with columns from FILTER_COLUMNS as keys and the values to match as values.
+    :param start_after:     Only return executions started at or after this time (ISO 8601, UTC).
+    :param start_before:    Only return executions started before this time (ISO 8601, UTC).
+    :param limit:           Maximum number of executions to return.
+    :param offset:          Number of executions to skip.
+    :return:                Tuple containing the list of executions and the total number of matching executions.
+    """
+    conditions = []
+    parameters = []
+    for column, value in (filters or {}).items():
+        if column not in FILTER_COLUMNS:
+            raise ValueError('Unable to filter by %s' % column)
+        conditions.append('%s = ?' % column)
+        parameters.append(value)
+    if start_after is not None:
+        conditions.append('start_time >= ?')
+        parameters.append(start_after)
+    if start_before is not None:
+        conditions.append('start_time < ?')
+        parameters.append(start_before)
+
+    where_clause = ''
+    if conditions:
+        where_clause = 'WHERE ' + ' AND '.join(conditions)
+
+    limit = max(0, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+
+    connection = connect()
+    try:
+        total = connection.execute('SELECT COUNT(*) FROM executions %s' % where_clause, parameters).fetchone()[0]
+        rows = connection.execute('SELECT * FROM executions %s ORDER BY start_time DESC LIMIT ? OFFSET ?'
+                                  % where_clause, parameters + [limit, offset]).fetchall()
+    finally:
+        connection.close()
+
+    return [dict(row) for row in rows], total
+
+
+def get_execution(execution_id):
+    """
+    This function returns the execution with the specified ID, including its steps and events, or None if the
+    execution is not in the history.
+    """
+    connection = connect()
+    try:
+        row = connection.execute('SELECT * FROM executions WHERE execution_id = ?', (execution_id,)).fetchone()
+        if row is None:
+            return None
+        execution = dict(row)
+        execution['steps'] = [dict(step) for step in connection.execute(
+            'SELECT step_index, name, description, status, duration FROM steps WHERE execution_id = ? ORDER BY rowid',
+            (execution_id,))]
+        execution['events'] = [dict(event) for event in connection.execute(
+            'SELECT name, duration, details FROM events WHERE execution_id = ? ORDER BY rowid', (execution_id,))]
+    finally:
+        connection.close()
+
+    for event in execution['events']:
+        event['details'] = json.loads(event['details'])
+
+    return execution
+
+
+def _catalogue_report(connection, report_file_path, tc_name, status, duration, replace=True):
+    report_name, extension = os.path.splitext(os.path.basename(report_file_path))
+    try:
+        size = os.path.getsize(report_file_path)
+    except OSError:
+        return
+    connection.execute('INSERT OR %s INTO reports VALUES (?, ?, ?, ?, ?, ?)' % ('REPLACE' if replace else 'IGNORE'),
+                       (report_name, extension.lstrip('.'), tc_name, status, duration, size))
+
+
+def record_reports(report_dir, report_name, tc_name, tc_result):
+    """
+    This function adds the report files generated for an execution to the report catalogue.
+    """
+    try:
+        connection = connect()
+    except sqlite3.Error as e:
+        LOG.debug('Unable to open the execution history database')
+        LOG.exception(e)
+        return
+
+    try:
+        with connection:
+            for extension in REPORT_EXTENSIONS:
+                report_file_path = os.path.join(report_dir, '%s.%s' % (report_name, extension))
+                _catalogue_report(connection, report_file_path, tc_name, tc_result.get('overall_status'),
+                                  _duration(tc_result))
+    except sqlite3.Error as e:
+        LOG.debug('Unable to record the reports %s in the catalogue' % report_name)
+        LOG.exception(e)
+    finally:
+        connection.close()
+
+
+def catalogue_directory(report_dir):
+    """
+    This function adds to the report catalogue the report files that are not in it yet, for example the ones generated
+    before the catalogue existed, and removes from it the reports whose file no longer exists. The test case name is
+    taken from the file name and the status and duration from the execution history, if the execution was recorded.
+    """
+    connection = connect()
+    try:
+        recorded = {}
+        for row in connection.execute('SELECT report_name, tc_name, status, duration FROM executions'):
+            recorded[row['report_name']] = (row['tc_name'], row['status'], row['duration'])
+
+        missing = []
+        for row in connection.execute('SELECT report_name, extension FROM reports'):
+            if not os.path.isfile(os.path.join(report_dir, '%s.%s' % (row['report_name'], row['extension']))):
+                missing.append((row['extension'], row['report_name']))
+
+        with connection:
+            connection.executemany('DELETE FROM reports WHERE extension = ? AND report_name = ?', missing)
+            for extension in REPORT_EXTENSIONS:
+                for report_file_path in glob.glob(os.path.join(report_dir, '*.%s' % extension)):
+                    report_name = os.path.splitext(os.path.basename(report_file_path))[0]
+                    # Report names have the format <YYYYmmdd>_<HHMMSS>_<tc_name>
+                    default_details = (report_name.split('_', 2)[-1], None, None)
+                    tc_name, status, duration = recorded.get(report_name, default_details)
+                    _catalogue_report(connection, report_file_path, tc_name, status, duration, replace=False)
+    finally:
+        connection.close()
+
+
+def query_reports(extension, filters=None, limit=None, offset=0):
+    """
+    This function returns the reports with the specified extension from the report catalogue, sorted by name.
+
+    :param extension:   Report file extension. Ex. 'html'
+    :param filters:     Dictionary with columns from REPORT_FILTER_COLUMNS as keys and the values to match as values.
+    :param limit:       Maximum number of reports to return. All the reports are returned if None.
+    :param offset:      Number of reports to skip.
+    :return:            Tuple containing the list of reports and the total number of matching reports.
+    """
+    conditions = ['extension = ?']
+    parameters = [extension]
+    for column, value in (filters or {}).items():
+        if column not in REPORT_FILTER_COLUMNS:
+            raise ValueError('Unable to filter by %s' % column)
+        conditions.append('%s = ?' % column)
+        parameters.append(value)
+    where_clause = 'WHERE ' + ' AND '.join(conditions)
+
+    if limit is None:
+        limit = -1
+    offset = max(0, offset)
+
+    connection = connect()
+    try:
+        total = connection.execute('SELECT COUNT(*) FROM reports %s' % where_clause, parameters).fetchone()[0]
+        rows = connection.execute('SELECT report_name, tc_name, status, duration, size FROM reports %s '
+                                  'ORDER BY report_name LIMIT ? OFFSET ?' % where_clause,
+                                  parameters + [limit, offset]).fetchall()
+    finally:
+        connection.close()
+
+    return [dict(row) for row in rows], total
@@ -14,6 +14,10 @@ import functools
 import logging
 import os
 import sys
+import time
+
+from utils import tracing
+from utils.metrics import REGISTRY
 
 LOG_DIR = '/var/log/vnflcv'
 
@@ -87,7 +91,19 @@ def log_entry_exit(LOG):
         @functools.wraps(func)
         def logger_wrapper(*args, **kwargs):
             LOG.debug('Entering function %s' % func.__name__)
-            func_result = func(*args, **kwargs)
+            start_time = time.time()
+            error = None
+            tracing.enter_call(func.__name__)
+            try:
+                func_result = func(*args, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                tracing.exit_call()
+                duration = time.time() - start_time
+                REGISTRY.observe('vnflcv_api_call_duration_seconds', duration, module=LOG.name, method=func.__name__)
+                tracing.trace_call(LOG.name, func, args, kwargs, start_time, duration, error)
             LOG.debug('Exiting function %s' % func.__name__)
             return func_result
         return logger_wrapper
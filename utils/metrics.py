@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import bisect
+from threading import Lock
+
+# Histogram bucket upper bounds, in seconds. They cover both API calls and long lifecycle operations.
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+
+def _label_key(labels):
+    return tuple(sorted((str(name), str(value)) for name, value in labels.items()))
+
+
+def _format_labels(label_key, extra_labels=()):
+    label_pairs = list(label_key) + list(extra_labels)
+    if not label_pairs:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                             for name, value in label_pairs)
+
+
+class Registry(object):
+    """
+    In-process registry of counters, gauges and histograms.
+
+    Worker processes record their samples in their own registry and periodically drain it and send the samples to the
+    server, which merges them in its registry and exposes them in the Prometheus text format.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.lock = Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        """
+        This method increments the counter with the specified name and labels.
+        """
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        """
+        This method sets the value of the gauge with the specified name and labels.
+        """
+        with self.lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        """
+        This method records a value in the histogram with the specified name and labels.
+        """
+        key = (name, _label_key(labels))
+        with self.lock:
+            bucket_counts, total, count = self.histograms.get(key, ([0] * (len(self.buckets) + 1), 0, 0))
+            bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.histograms[key] = (bucket_counts, total + value, count + 1)
+
+    def drain(self):
+        """
+        This method returns the counters and histograms recorded since the last call and resets them.
+        """
+        with self.lock:
+            counters, histograms = self.counters, self.histograms
+            self.counters, self.histograms = {}, {}
+        return counters, histograms
+
+    def merge(self, counters, histograms):
+        """
+        This method adds the counters and histograms drained from another registry to this one.
+        """
+        with self.lock:
+            for key, value in counters.items():
+                self.counters[key] = self.counters.get(key, 0) + value
+            for key, (bucket_counts, total, count) in histograms.items():
+                own_bucket_counts, own_total, own_count = self.histograms.get(key, ([0] * len(bucket_counts), 0, 0))
+                merged_bucket_counts = [a + b for a, b in zip(own_bucket_counts, bucket_counts)]
+                self.histograms[key] = (merged_bucket_counts, own_total + total, own_count + count)
+
+    def render(self):
+        """
+        This method returns all the metrics in the Prometheus text exposition format.
+        """
+        with self.lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            histograms = sorted(self.histograms.items())
+
+        lines = []
+        typed = set()
+        for metric_type, samples in [('counter', counters), ('gauge', gauges)]:
+            for (name, label_key), value in samples:
+                if name not in typed:
+                    lines.append('# TYPE %s %s' % (name, metric_type))
+                    typed.add(name)
+                lines.append('%s%s %s' % (name, _format_labels(label_key), value))
+
+        for (name, label_key), (bucket_counts, total, count) in histograms:
+            if name not in typed:
+                lines.append('# TYPE %s histogram' % name)
+                typed.add(name)
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(list(self.buckets) + ['+Inf'], bucket_counts):
+                cumulative_count += bucket_count
+                lines.append('%s_bucket%s %s' % (name, _format_labels(label_key, [('le', str(upper_bound))]),
+                                                 cumulative_count))
+            lines.append('%s_sum%s %s' % (name, _format_labels(label_key), total))
+            lines.append('%s_count%s %s' % (name, _format_labels(label_key), count))
+
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
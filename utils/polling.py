@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import logging
+import random
+from threading import Event, Lock
+
+from monotonic import monotonic
+
+from utils.metrics import REGISTRY
+
+# Interval of time in seconds before the second poll. It doubles after each poll, up to the poll interval of the caller.
+INITIAL_POLL_INTERVAL = 0.5
+BACKOFF_FACTOR = 2
+
+# Maximum relative deviation applied to each interval, so that concurrent pollers do not hit the API at the same time
+JITTER = 0.2
+
+_wake_up_events = set()
+_wake_up_lock = Lock()
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+def wake_up():
+    """
+    This function makes all the pollers that are waiting poll again immediately. It is called, for example, when a
+    lifecycle change notification arrives.
+    """
+    with _wake_up_lock:
+        for wake_up_event in _wake_up_events:
+            wake_up_event.set()
+
+
+def _poll(poll_once, max_wait_time, poll_interval):
+    """
+    This function calls poll_once until it reports completion or the deadline expires. The first polls are
+    INITIAL_POLL_INTERVAL apart and the interval grows exponentially, with jitter, up to poll_interval. The waiting
+    pollers are woken up by wake_up().
+
+    :param poll_once:       Function returning a tuple containing a boolean telling if the polling is complete and
+                            the value of the last poll.
+    :return:                Tuple containing the value of the last poll and the number of polls.
+    """
+    deadline = monotonic() + max_wait_time
+    interval = min(INITIAL_POLL_INTERVAL, poll_interval)
+    poll_count = 0
+
+    wake_up_event = Event()
+    with _wake_up_lock:
+        _wake_up_events.add(wake_up_event)
+    try:
+        while True:
+            complete, value = poll_once()
+            poll_count += 1
+            if complete:
+                return value, poll_count
+
+            remaining_time = deadline - monotonic()
+            if remaining_time <= 0:
+                return value, poll_count
+
+            sleep_time = min(interval * random.uniform(1 - JITTER, 1 + JITTER), poll_interval, remaining_time)
+            LOG.debug('Sleeping %.2f seconds, %.2f seconds left out of %s' % (sleep_time, remaining_time,
+                                                                               max_wait_time))
+            wake_up_event.wait(sleep_time)
+            wake_up_event.clear()
+            interval = min(interval * BACKOFF_FACTOR, poll_interval)
+    finally:
+        with _wake_up_lock:
+            _wake_up_events.discard(wake_up_event)
+
+
+def poll_for_completion(get_status, operation_id, final_states, max_wait_time, poll_interval, operation_name=None):
+    """
+    This function polls the status of an operation until it reaches a final state or the deadline expires.
+
+    :param get_status:      Function returning the status of the operation with the ID given as its argument.
+    :param operation_id:    ID of the operation.
+    :param final_states:    List of states of the operation that when reached, the polling stops.
+    :param max_wait_time:   Maximum interval of time in seconds to wait for the operation to reach a final state,
+                            including the time spent getting the status.
+    :param poll_interval:   Maximum interval of time in seconds between consecutive polls.
+    :param operation_name:  Name of the operation, used for labeling the latency statistics. Ex. 'ns_instantiate_sync'
+    :return:                Operation status.
+    """
+    def poll_once():
+        operation_status = get_status(operation_id)
+        LOG.debug('Got status %s for operation with ID %s' % (operation_status, operation_id))
+        if operation_status in final_states:
+            return True, operation_status
+        LOG.debug('Expected state to be one of %s, got %s' % (final_states, operation_status))
+        return False, operation_status
+
+    start_time = monotonic()
+    operation_status, poll_count = None, 0
+    try:
+        operation_status, poll_count = _poll(poll_once, max_wait_time, poll_interval)
+        if operation_status not in final_states:
+            LOG.debug('Operation with ID %s did not reach any of the states %s in %s seconds'
+                      % (operation_id, final_states, max_wait_time))
+    finally:
+        operation_name = operation_name or 'unknown'
+        REGISTRY.observe('vnflcv_operation_duration_seconds', monotonic() - start_time, operation=operation_name,
+                         status=str(operation_status))
+        REGISTRY.inc('vnflcv_operation_polls_total', poll_count, operation=operation_name)
+
+    return operation_status
+
+
+def wait_until(condition, timeout, poll_interval, condition_name=None):
+    """
+    This function evaluates the condition until it holds or the timeout expires, with the same adaptive intervals as
+    poll_for_completion.
+
+    :param condition:       Function without arguments returning a value that is true when the condition holds.
+    :param timeout:         Maximum interval of time in seconds to wait for the condition to hold.
+    :param poll_interval:   Maximum interval of time in seconds between consecutive evaluations of the condition.
+    :param condition_name:  Name of the condition, used for labeling the latency statistics.
+    :return:                Value returned by the condition when it held, or None if the timeout expired.
+    """
+    def poll_once():
+        value = condition()
+        if value:
+            return True, value
+        return False, None
+
+    condition_name = condition_name or getattr(condition, '__name__', 'unknown')
+    start_time = monotonic()
+    value, poll_count = None, 0
+    try:
+        value, poll_count = _poll(poll_once, timeout, poll_interval)
+        if value is None:
+            LOG.debug('Condition %s did not hold in %s seconds' % (condition_name, timeout))
+    finally:
+        REGISTRY.observe('vnflcv_wait_duration_seconds', monotonic() - start_time, condition=condition_name,
+                         status='timeout' if value is None else 'success')
+        REGISTRY.inc('vnflcv_wait_polls_total', poll_count, condition=condition_name)
+
+    return value
+
+
+def all_of(*conditions):
+    """
+    This function returns a condition that holds when all the conditions hold. The conditions are evaluated in order
+    and the evaluation stops at the first one that does not hold.
+
+    :return:    Function returning the list of values returned by the conditions, or None.
+    """
+    def all_conditions():
+        values = []
+        for condition in conditions:
+            value = condition()
+            if not value:
+                return None
+            values.append(value)
+        return values
+    all_conditions.__name__ = 'all_of(%s)' % ', '.join(getattr(condition, '__name__', '?') for condition in conditions)
+    return all_conditions
+
+
+def any_of(*conditions):
+    """
+    This function returns a condition that holds when any of the conditions holds. The conditions are evaluated in
+    order and the evaluation stops at the first one that holds.
+
+    :return:    Function returning the value returned by the first condition that holds, or None.
+    """
+    def any_condition():
+        for condition in conditions:
+            value = condition()
+            if value:
+                return value
+        return None
+    any_condition.__name__ = 'any_of(%s)' % ', '.join(getattr(condition, '__name__', '?') for condition in conditions)
+    return any_condition
@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+
+PROFILE_DIR = '/var/log/vnflcv'
+DEFAULT_TOP_N = 20
+DEFAULT_SAMPLING_INTERVAL = 0.01
+
+# Instantiate logger
+LOG = logging.getLogger(__name__)
+
+
+def _frame_label(code):
+    return '%s (%s:%s)' % (code.co_name, os.path.basename(code.co_filename), code.co_firstlineno)
+
+
+class StackSampler(threading.Thread):
+    """
+    Thread that periodically samples the call stack of another thread and counts the collapsed stacks, in the format
+    expected by the flame graph tools: one line per stack, with the frames separated by semicolons, starting from the
+    outermost frame, followed by the number of samples.
+    """
+
+    def __init__(self, thread_id, interval=DEFAULT_SAMPLING_INTERVAL):
+        super(StackSampler, self).__init__(name='stack-sampler')
+        self.daemon = True
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = collections.Counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            frames = []
+            while frame is not None:
+                frames.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if frames:
+                self.stacks[';'.join(reversed(frames))] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+    def dump(self, file_path):
+        with open(file_path, 'w') as collapsed_file:
+            for stack, count in sorted(self.stacks.items()):
+                collapsed_file.write('%s %s\n' % (stack, count))
+
+
+class Profiler(object):
+    """
+    Profiles the steps and the cleanup of a test case execution.
+
+    For each profiled call a deterministic profile is written to <report_name>.<label>.pstats and the stacks sampled
+    while the call was running are written to <report_name>.<label>.collapsed, next to the execution reports.
+    """
+
+    def __init__(self, report_name, top_n=DEFAULT_TOP_N, profile_dir=PROFILE_DIR):
+        self.report_name = report_name
+        self.top_n = top_n
+        self.profile_dir = profile_dir
+        self.results = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def profile(self, label, name, func, *args, **kwargs):
+        """
+        This method calls the function with the specified arguments while profiling it and returns its result.
+
+        :param label:   Label used in the profile file names. Ex. 'step3'
+        :param name:    Name of the profiled step, reported with the hot functions.
+        """
+        profile = cProfile.Profile()
+        sampler = StackSampler(threading.current_thread().ident)
+        sampler.start()
+        start_time = time.time()
+        profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            duration = time.time() - start_time
+            sampler.stop()
+            self._save(label, name, duration, profile, sampler)
+
+    def _save(self, label, name, duration, profile, sampler):
+        pstats_file_path = os.path.join(self.profile_dir, '%s.%s.pstats' % (self.report_name, label))
+        collapsed_file_path = os.path.join(self.profile_dir, '%s.%s.collapsed' % (self.report_name, label))
+        result = {
+            'name': name,
+            'duration': duration,
+            'pstats_file': os.path.basename(pstats_file_path),
+            'collapsed_file': os.path.basename(collapsed_file_path),
+            'hot_functions': []
+        }
+
+        try:
+            stats = pstats.Stats(profile)
+            stats.dump_stats(pstats_file_path)
+            sampler.dump(collapsed_file_path)
+        except (IOError, OSError) as e:
+            LOG.debug('Unable to write the profile of %s' % label)
+            LOG.exception(e)
+        else:
+            hot_functions = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:self.top_n]
+            for (file_name, line_number, function_name), (_, call_count, total_time, cumulative_time, _) in \
+                    hot_functions:
+                result['hot_functions'].append({
+                    'function': '%s (%s:%s)' % (function_name, file_name, line_number),
+                    'calls': call_count,
+                    'total_time': total_time,
+                    'cumulative_time': cumulative_time
+                })
+
+        with self.lock:
+            self.results[label] = result
@@ -62,6 +62,18 @@ def report_test_case(report_file_name, tc_exec_request, tc_input, tc_result):
         report_file.write(t.get_string())
         report_file.write('\n\n')
 
+        # Write API calls summary
+        report_file.write('* API calls:\n')
+        t = prettytable.PrettyTable(['Step #', 'Module', 'Vendor', 'Method', 'Calls', 'Errors', 'Duration (sec)',
+                                     'Max duration (sec)'])
+        for step_label, method_statistics in tc_result.get('api_calls', {}).items():
+            for statistics in method_statistics:
+                t.add_row([step_label, statistics['module'], statistics['vendor'] or 'N/A', statistics['method'],
+                           statistics['calls'], statistics['errors'], '%.3f' % statistics['duration'],
+                           '%.3f' % statistics['max_duration']])
+        report_file.write(t.get_string())
+        report_file.write('\n\n')
+
         # Write test case environment
         report_file.write('*** Test case environment ***')
         report_file.write('\n\n')
@@ -223,6 +235,33 @@ def html_report_test_case(html_report_file_name, tc_exec_request, tc_input, tc_r
         }
         steps_summary_body = steps_summary_body + (steps_summary_some_part % substitutes_local)
 
+    # Populate API Calls table
+    api_calls_body = ''
+    for step_label, method_statistics in tc_result.get('api_calls', {}).items():
+        for statistics in method_statistics:
+            api_calls_some_part = '''
+                                        <tr>
+                                            <td>%(step_label)s</td>
+                                            <td>%(module)s</td>
+                                            <td>%(vendor)s</td>
+                                            <td>%(method)s</td>
+                                            <td>%(calls)s</td>
+                                            <td>%(errors)s</td>
+                                            <td>%(duration)s</td>
+                                            <td>%(max_duration)s</td>
+                                        </tr>'''
+            substitutes_local = {
+                'step_label': str(step_label),
+                'module': str(statistics['module']),
+                'vendor': str(statistics['vendor'] or 'N/A'),
+                'method': str(statistics['method']),
+                'calls': str(statistics['calls']),
+                'errors': str(statistics['errors']),
+                'duration': ('%.3f' % statistics['duration']),
+                'max_duration': ('%.3f' % statistics['max_duration'])
+            }
+            api_calls_body = api_calls_body + (api_calls_some_part % substitutes_local)
+
     # Write VNF resources
     vnf_resources = ''
     for key in tc_result.get('resources', {}).keys():
@@ -388,6 +427,7 @@ def html_report_test_case(html_report_file_name, tc_exec_request, tc_input, tc_r
         'traffic_type': str(tc_input.get('traffic', {}).get('type')),
         'traffic_name': str(tc_input.get('traffic', {}).get('name', 'N/A')),
         'steps_summary_body': steps_summary_body,
+        'api_calls_body': api_calls_body,
         'vnf_resources': vnf_resources,
         'scaling_info': scaling_info,
         'time_stamps': time_stamps,
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2018 by Spirent Communications Plc.
+# All Rights Reserved.
+#
+# This software is confidential and proprietary to Spirent Communications Inc.
+# No part of this software may be reproduced, transmitted, disclosed or used
+# in violation of the Software License Agreement without the expressed
+# written consent of Spirent Communications Inc.
+#
+#
+
+
+import collections
+import functools
+import hashlib
+import threading
+
+Span = collections.namedtuple('Span', 'step module vendor method args_digest depth start_time duration error')
+
+# Label of the calls made outside the test case steps
+SETUP_LABEL = 'setup'
+CLEANUP_LABEL = 'cleanup'
+
+# Maximum number of characters of the representation of the call arguments that are hashed, and length of the digest
+ARGS_REPR_MAX_LENGTH = 1024
+ARGS_DIGEST_LENGTH = 12
+
+_context = threading.local()
+_active_buffer = None
+
+
+class TraceBuffer(object):
+    """
+    Buffer holding the spans of the API calls made during one test case execution.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def record(self, span):
+        with self.lock:
+            self.spans.append(span)
+
+    def summary(self):
+        """
+        This method aggregates the spans by step and by API method.
+
+        :return:    Ordered dictionary with the step labels as keys, in the order of their first call, and the lists of
+                    per method statistics as values.
+        """
+        with self.lock:
+            spans = list(self.spans)
+
+        statistics = collections.OrderedDict()
+        for span in spans:
+            step_statistics = statistics.setdefault(span.step, collections.OrderedDict())
+            method_statistics = step_statistics.setdefault((span.module, span.vendor, span.method), {
+                'module': span.module,
+                'vendor': span.vendor,
+                'method': span.method,
+                'calls': 0,
+                'errors': 0,
+                'duration': 0,
+                'max_duration': 0
+            })
+            method_statistics['calls'] += 1
+            method_statistics['duration'] += span.duration
+            method_statistics['max_duration'] = max(method_statistics['max_duration'], span.duration)
+            if span.error is not None:
+                method_statistics['errors'] += 1
+
+        return collections.OrderedDict((step, list(step_statistics.values()))
+                                       for step, step_statistics in statistics.items())
+
+
+def activate(trace_buffer):
+    """
+    This function makes the trace buffer the destination of the spans recorded in this process.
+    """
+    global _active_buffer
+    _active_buffer = trace_buffer
+
+
+def deactivate():
+    global _active_buffer
+    _active_buffer = None
+
+
+def set_step(step):
+    """
+    This function sets the step to which the calls made by the current thread are attributed.
+    """
+    _context.step = step
+
+
+def current_step():
+    return getattr(_context, 'step', SETUP_LABEL)
+
+
+def bind(func):
+    """
+    This function returns a wrapper of func that attributes the calls func makes to the current step of the calling
+    thread, even if func runs on another thread, for example on a thread pool.
+    """
+    step = current_step()
+
+    @functools.wraps(func)
+    def bound_func(*args, **kwargs):
+        set_step(step)
+        return func(*args, **kwargs)
+    return bound_func
+
+
+def args_digest(args, kwargs):
+    """
+    This function returns a short digest of the call arguments, so that the spans of calls made with the same arguments
+    can be told apart from the others. Only the first ARGS_REPR_MAX_LENGTH characters of their representation are
+    hashed.
+    """
+    try:
+        args_repr = repr((args, sorted(kwargs.items())))[:ARGS_REPR_MAX_LENGTH]
+        return hashlib.md5(args_repr).hexdigest()[:ARGS_DIGEST_LENGTH]
+    except Exception:
+        return None
+
+
+def trace_call(module, func, args, kwargs, start_time, duration, error):
+    """
+    This function records a span in the active trace buffer, if any. The digest of the arguments is only computed
+    while a trace buffer is active.
+    """
+    trace_buffer = _active_buffer
+    if trace_buffer is None:
+        return
+    vendor = getattr(args[0], 'vendor', None) if args else None
+    trace_buffer.record(Span(step=current_step(), module=module, vendor=vendor, method=func.__name__,
+                             args_digest=args_digest(args[1:], kwargs), depth=len(_call_stack()),
+                             start_time=start_time, duration=duration,
+                             error=None if error is None else '%s: %s' % (type(error).__name__, error)))
+
+
+def _call_stack():
+    try:
+        return _context.calls
+    except AttributeError:
+        _context.calls = []
+        return _context.calls
+
+
+def enter_call(method):
+    _call_stack().append(method)
+
+
+def exit_call():
+    _call_stack().pop()
+
+
+def caller_name():
+    """
+    This function returns the name of the API method that called the API method currently running, or None.
+    """
+    calls = _call_stack()
+    if len(calls) < 2:
+        return None
+    return calls[-2]